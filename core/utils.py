@@ -202,14 +202,14 @@ class ParamParser:
         Returns:
             Dictionary of parameters
         """
-        if not params or not params.strip():
+        if not params:
             return {}
 
         param_dict = {}
         for param in params.split(';'):
-            param = param.strip()
-            if '=' in param:
-                key, value = param.split('=', 1)
+            # Entries without '=' are skipped
+            key, sep, value = param.partition('=')
+            if sep:
                 param_dict[key.strip()] = value.strip()
 
         return param_dict
@@ -306,6 +306,8 @@ class MultiprocessingConfig:
             - num_workers: Optional[int]
             - chunk_size: int
             - min_lines_for_parallel: int
+            - backend: str ('process' or 'thread')
+            - target_chunk_bytes: int (max text size of a log parsing chunk)
         """
         config_mgr = ConfigManager()
 
@@ -319,12 +321,15 @@ class MultiprocessingConfig:
                 'enabled': mp_config.get('enabled', True),
                 'num_workers': mp_config.get('num_workers'),  # None = auto-detect
                 'chunk_size': mp_config.get('chunk_size', 10000),
-                'min_lines_for_parallel': mp_config.get('min_lines_for_parallel', 10000)
+                'min_lines_for_parallel': mp_config.get('min_lines_for_parallel', 10000),
+                'backend': str(mp_config.get('backend', 'process')).lower(),
+                'target_chunk_bytes': mp_config.get('target_chunk_bytes', 4 * 1024 * 1024)
             }
 
             logger.info(f"Multiprocessing config loaded: enabled={result['enabled']}, "
                        f"num_workers={result['num_workers']}, chunk_size={result['chunk_size']}, "
-                       f"min_lines_for_parallel={result['min_lines_for_parallel']}")
+                       f"min_lines_for_parallel={result['min_lines_for_parallel']}, "
+                       f"backend={result['backend']}, target_chunk_bytes={result['target_chunk_bytes']}")
 
             return result
         except Exception as e:
@@ -333,7 +338,9 @@ class MultiprocessingConfig:
                 'enabled': True,
                 'num_workers': None,
                 'chunk_size': 10000,
-                'min_lines_for_parallel': 10000
+                'min_lines_for_parallel': 10000,
+                'backend': 'process',
+                'target_chunk_bytes': 4 * 1024 * 1024
             }
 
     @staticmethod
@@ -5,7 +5,9 @@ Log Parser Module for Access Log Analyzer
 Supports ALB, Apache/Nginx (HTTPD), JSON, and GROK patterns
 Implements MCP tool: recommendAccessLogFormat, parseAccessLog
 """
+import copy
 import gzip
+import io
 import pandas as pd
 import re
 import yaml
@@ -13,11 +15,13 @@ import json
 import os
 import glob
 from datetime import datetime
-from collections import Counter
+from collections import Counter, deque
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Any
 from multiprocessing import Pool, cpu_count
-from functools import partial
+from multiprocessing.pool import ThreadPool
+from functools import partial, lru_cache
+from operator import itemgetter
 import itertools
 
 # Import core modules
@@ -29,9 +33,46 @@ from core.exceptions import (
 from core.config import ConfigManager
 from core.logging_config import get_logger
 
+try:
+    import rapidgzip
+except ImportError:  # Optional: parallel gzip decompression
+    rapidgzip = None
+
+try:
+    import re2
+except ImportError:  # Optional: linear-time regex engine (parsing.regex_engine: re2)
+    re2 = None
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # Optional: faster JSON decoding for JSON Lines input
+    orjson = None
+    _json_loads = json.loads
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # Optional: Arrow-backed string columns (parsing.arrow_strings)
+    pa = None
+    pc = None
+
+try:
+    import duckdb
+except ImportError:  # Optional: columnar database storage (save_to_duckdb)
+    duckdb = None
+
 # Setup logger
 logger = get_logger(__name__)
 
+# Read buffer for gzip input; the 8 KiB default causes many tiny zlib reads
+GZIP_READ_BUFFER_SIZE = 128 * 1024
+GZIP_MAGIC = b'\x1f\x8b'
+
+# Parsed field values that mean "no value" and are stored as None
+EMPTY_MARKERS = ('', '-', ' ')
+EMPTY_FIELD_VALUES = frozenset(EMPTY_MARKERS + (None,))
+
 
 # ============================================================================
 # MCP Tool: recommendAccessLogFormat
@@ -233,24 +274,13 @@ def _sample_log_lines(file_path: str, n: int = 100) -> List[str]:
     """Sample n lines from log file (supports gzip)"""
     lines = []
     try:
-        # Try gzip first
-        try:
-            with gzip.open(file_path, 'rt', encoding='utf-8') as f:
-                for i, line in enumerate(f):
-                    if i >= n:
-                        break
-                    line = line.strip()
-                    if line:
-                        lines.append(line)
-        except:
-            # Try plain text
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                for i, line in enumerate(f):
-                    if i >= n:
-                        break
-                    line = line.strip()
-                    if line:
-                        lines.append(line)
+        with _open_log_text(file_path) as f:
+            for i, line in enumerate(f):
+                if i >= n:
+                    break
+                line = line.strip()
+                if line:
+                    lines.append(line)
     except Exception as e:
         logger.error(f"Error sampling file {file_path}: {e}")
     
@@ -275,16 +305,26 @@ def _load_config_near_input(input_file: Optional[str] = None) -> Tuple[Dict[str,
     config_paths.append(script_dir / 'config.yaml')
 
     for config_path in config_paths:
-        if config_path.exists():
-            try:
-                return load_config_legacy(str(config_path)) or {}, config_path
-            except Exception as e:
-                logger.warning(f"Failed to load config from {config_path}: {e}")
-                continue
+        try:
+            mtime = config_path.stat().st_mtime
+        except OSError:
+            continue
+        try:
+            # Copy so callers can't modify the cached config
+            return copy.deepcopy(_load_config_cached(str(config_path), mtime)), config_path
+        except Exception as e:
+            logger.warning(f"Failed to load config from {config_path}: {e}")
+            continue
 
     return {}, None
 
 
+@lru_cache(maxsize=8)
+def _load_config_cached(config_path: str, mtime: float) -> Dict[str, Any]:
+    """Parse a config.yaml once per (path, mtime) so edits invalidate the cache."""
+    return load_config_legacy(config_path) or {}
+
+
 def _detect_log_type(sample_lines: List[str]) -> Tuple[str, float]:
     """Detect log type from sample lines"""
     scores = {'ALB': 0, 'JSON': 0, 'APACHE': 0, 'GROK': 0}
@@ -731,7 +771,107 @@ def parseAccessLog(logLine, logPattern):
 # Helper Functions for File Parsing
 # ============================================================================
 
-def _parse_lines_chunk(lines_chunk, pattern, pattern_type, format_info):
+def _get_parsing_config():
+    """
+    Get parsing options from the 'parsing' section of config.yaml.
+
+    Returns:
+        dict: {'regex_engine': 're' | 're2', 'arrow_strings': bool}
+    """
+    try:
+        parsing_config = ConfigManager().load_config().get('parsing') or {}
+    except Exception as e:
+        logger.warning(f"Could not load parsing config: {e}, using defaults")
+        parsing_config = {}
+
+    return {
+        'regex_engine': str(parsing_config.get('regex_engine', 're')).lower(),
+        'arrow_strings': bool(parsing_config.get('arrow_strings', False))
+    }
+
+
+def _build_dataframe(data, use_arrow=False, empty_to_null=None):
+    """
+    Build a DataFrame from column-wise parsed data.
+
+    With use_arrow (and pyarrow installed) each column is converted to an
+    Arrow array and the frame uses pd.ArrowDtype columns: strings are stored
+    in one contiguous buffer instead of one Python object per cell.
+
+    Args:
+        data: {column: [values]}
+        use_arrow: Build Arrow-backed columns
+        empty_to_null: Columns whose empty markers ('', '-', ' ') are replaced
+            with nulls in one vectorized pass (None for no replacement)
+
+    Returns:
+        pandas.DataFrame
+    """
+    empty_columns = [col for col in empty_to_null if col in data] if empty_to_null else []
+
+    if use_arrow:
+        if pa is None:
+            logger.warning("arrow_strings enabled but pyarrow is not installed, using object columns")
+        else:
+            try:
+                arrays = {col: pa.array(values) for col, values in data.items()}
+                if empty_columns:
+                    empty_values = pa.array(EMPTY_MARKERS)
+                    for col in empty_columns:
+                        arr = arrays[col]
+                        if pa.types.is_string(arr.type):
+                            arr = pc.if_else(pc.is_in(arr, value_set=empty_values), pa.scalar(None, arr.type), arr)
+                            # All-empty columns get the null type, as pa.array([None, ...]) does
+                            arrays[col] = pa.nulls(len(arr)) if arr.null_count == len(arr) else arr
+                return pa.table(arrays).to_pandas(types_mapper=pd.ArrowDtype)
+            except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+                # Mixed-type columns (e.g. JSON) cannot be represented as a single Arrow type
+                logger.warning(f"Could not build Arrow-backed DataFrame ({e}), using object columns")
+
+    df = pd.DataFrame(data)
+    for col in empty_columns:
+        values = df[col]
+        is_empty = values.isin(EMPTY_MARKERS)
+        if not is_empty.any():
+            continue
+        if (is_empty | values.isna()).all():
+            # Same column pd.DataFrame builds from all-None values
+            df[col] = pd.Series([None] * len(df), index=df.index, dtype=object)
+        else:
+            df[col] = values.where(~is_empty, None)
+    return df
+
+
+@lru_cache(maxsize=32)
+def _compile_log_pattern(pattern, engine='re'):
+    """
+    Compile a log pattern once per process.
+
+    With engine='re2' the pattern is compiled with re2 (no backtracking) if it
+    is installed and supports the pattern; otherwise the standard re module
+    is used. re2 is opt-in because submatch extraction on patterns with many
+    capture groups (e.g. ALB) is slower than re.
+
+    Args:
+        pattern: Regex pattern string
+        engine: 're' or 're2'
+
+    Returns:
+        Compiled pattern object with match()
+    """
+    if engine == 're2':
+        if re2 is None:
+            logger.warning("regex_engine 're2' requested but re2 is not installed, using re")
+        else:
+            try:
+                return re2.compile(pattern)
+            except Exception as e:
+                logger.warning(f"Pattern not supported by re2 ({e}), using re")
+
+    return re.compile(pattern)
+
+
+def _parse_lines_chunk(lines_chunk, pattern, pattern_type, format_info, columns_to_load=None):
     """
     Parse a chunk of lines in parallel worker process.
 
@@ -740,58 +880,415 @@ def _parse_lines_chunk(lines_chunk, pattern, pattern_type, format_info):
         pattern: Regex pattern
         pattern_type: Pattern type (ALB, JSON, HTTPD, GROK)
         format_info: Format information dict
+        columns_to_load: Optional collection of columns to emit (None for all),
+            see _resolve_worker_columns
 
     Returns:
-        Tuple of (parsed_data, failed_lines)
+        Tuple of (parsed_data, failed_lines), where parsed_data is column-wise:
+        {column: [value per parsed line]}
     """
-    parsed_data = []
+    # Positional patterns with configured columns use the specialized chunk parser
+    compiled = _positional_pattern(pattern, pattern_type, format_info)
+    if compiled is not None:
+        return _parse_column_lines_chunk(lines_chunk, compiled, format_info['columns'], pattern_type, columns_to_load)
+
+    # Chunk size bounds the row count, so fill a preallocated list and trim it
+    parsed_rows = [None] * len(lines_chunk)
+    n_rows = 0
     failed_lines = []
 
     for line_num, line in lines_chunk:
-        original_line = line.rstrip('\n\r')
-        parsed = _parse_line(line, pattern, pattern_type, format_info)
+        # Strip once here; blank lines are skipped, not reported as failures
+        stripped = line.strip()
+        if not stripped:
+            continue
+        parsed = _parse_line(stripped, pattern, pattern_type, format_info, stripped=True)
         if parsed:
-            parsed_data.append(parsed)
+            if columns_to_load:
+                parsed = {key: value for key, value in parsed.items() if key in columns_to_load}
+            parsed_rows[n_rows] = parsed
+            n_rows += 1
         else:
-            if original_line.strip():
-                failed_lines.append((line_num, original_line))
+            failed_lines.append((line_num, line.rstrip('\n\r')))
 
-    return parsed_data, failed_lines
+    del parsed_rows[n_rows:]
+    return _rows_to_columns(parsed_rows), failed_lines
 
 
-def _read_lines_from_file(input_file, max_lines=None):
+def _positional_pattern(pattern, pattern_type, format_info):
     """
-    Read lines from file (gzip or plain text) with line numbers.
+    Return the compiled pattern if lines are parsed by _parse_column_lines_chunk.
+
+    That is the case for non-JSON formats with configured columns and a
+    pattern without named groups. Its output keeps empty markers ('', '-',
+    ' ') as-is; they are replaced with nulls when building the DataFrame.
 
     Args:
-        input_file: Path to input file
-        max_lines: Maximum number of lines to read (None for all)
+        pattern: Regex pattern
+        pattern_type: Pattern type (ALB, JSON, HTTPD, GROK)
+        format_info: Format information dict
 
     Returns:
-        List of (line_num, line) tuples
+        Compiled pattern, or None if lines are parsed with _parse_line
     """
-    lines = []
+    if pattern_type == 'JSON' or not format_info or not format_info.get('columns'):
+        return None
+    try:
+        compiled = _compile_log_pattern(pattern, format_info.get('_regex_engine', 're'))
+    except re.error:
+        return None
+    return None if compiled.groupindex else compiled
+
+
+def _resolve_worker_columns(pattern, pattern_type, format_info, columns_to_load):
+    """
+    Resolve columns_to_load against the pattern's column set for parse workers.
+
+    Workers can only drop columns early when the column set is known before
+    parsing (configured positional columns or named groups). JSON and other
+    schema-less inputs return None and are filtered after combining chunks.
+
+    Args:
+        pattern: Regex pattern
+        pattern_type: Pattern type (ALB, JSON, HTTPD, GROK)
+        format_info: Format information dict
+        columns_to_load: Requested columns (None for all)
+
+    Returns:
+        frozenset of columns workers should emit, or None to emit all columns
+    """
+    if not columns_to_load or pattern_type == 'JSON':
+        return None
 
     try:
-        # Try gzip first
+        compiled = _compile_log_pattern(pattern, format_info.get('_regex_engine', 're'))
+    except re.error:
+        return None
+
+    known_columns = list(compiled.groupindex) or format_info.get('columns') or []
+    keep = {col for col in known_columns if col in columns_to_load}
+
+    # HTTPD derived columns (request_url, request_method, request_proto) are split from 'request'
+    if pattern_type == 'HTTPD' and 'request' in known_columns:
+        if any(col in columns_to_load for col in ('request_url', 'request_method', 'request_proto')):
+            keep.add('request')
+
+    # No overlap: emit everything so the caller can fall back to loading all columns
+    return frozenset(keep) if keep else None
+
+
+def _rows_to_columns(rows):
+    """
+    Convert a list of row dicts to column-wise lists.
+
+    Keys missing from a row are filled with None; columns keep the order in
+    which they first appear (same as pd.DataFrame(rows)).
+
+    Args:
+        rows: List of dicts
+
+    Returns:
+        dict: {column: [value per row]}
+    """
+    data = {}
+    n_rows = len(rows)
+    for i, row in enumerate(rows):
+        for key, value in row.items():
+            values = data.get(key)
+            if values is None:
+                values = data[key] = [None] * n_rows
+            values[i] = value
+    return data
+
+
+def _extend_columns(data, total_rows, chunk_data):
+    """
+    Append a column-wise chunk to column-wise accumulated data in place.
+
+    Args:
+        data: Accumulated {column: [values]} (modified in place)
+        total_rows: Number of rows already in data
+        chunk_data: Column-wise chunk to append
+
+    Returns:
+        int: Number of rows in data after appending
+    """
+    if not chunk_data:
+        return total_rows
+
+    chunk_rows = len(next(iter(chunk_data.values())))
+    for col, values in chunk_data.items():
+        target = data.get(col)
+        if target is None:
+            data[col] = [None] * total_rows + values if total_rows else values
+        else:
+            target.extend(values)
+    for col, target in data.items():
+        if col not in chunk_data:
+            target.extend([None] * chunk_rows)
+
+    return total_rows + chunk_rows
+
+
+def _parse_column_lines_chunk(lines_chunk, compiled, columns, pattern_type, columns_to_load=None):
+    """
+    Parse a chunk of lines whose regex groups map positionally to columns.
+
+    Same validation as calling _parse_line per line, but the pattern, column
+    list and validation fields are resolved once per chunk instead of once per
+    line, and values are collected as rows of tuples and transposed into
+    columns. Empty markers ('', '-', ' ') are kept as-is; the caller replaces
+    them in one vectorized pass (see _build_dataframe).
+
+    Args:
+        lines_chunk: List of (line_num, line) tuples
+        compiled: Compiled pattern without named groups
+        columns: Column names in group order
+        pattern_type: Pattern type (ALB, HTTPD, GROK)
+        columns_to_load: Optional collection of columns to emit (None for all)
+
+    Returns:
+        Tuple of (parsed_data, failed_lines), parsed_data is {column: [values]}
+    """
+    rows = [None] * len(lines_chunk)
+    n_rows = 0
+    failed_lines = []
+    match = compiled.match
+    n_columns = len(columns)
+
+    # Only requested columns are emitted; validation still sees every group
+    selected = [(i, col) for i, col in enumerate(columns) if not columns_to_load or col in columns_to_load]
+    selected_columns = [col for _, col in selected]
+    if not selected:
+        select = lambda groups: ()
+    elif len(selected) == 1:
+        only_index = selected[0][0]
+        select = lambda groups: (groups[only_index],)
+    else:
+        select = itemgetter(*(i for i, _ in selected))
+    empty = EMPTY_FIELD_VALUES
+
+    # Validation fields (see _parse_line)
+    if pattern_type == 'ALB':
+        required_any = [columns.index(col) for col in ('time', 'request_url', 'request_verb') if col in columns]
+    elif pattern_type == 'HTTPD':
+        required_any = [columns.index(col) for col in ('time', 'timestamp', 'status', 'status_code') if col in columns]
+    else:
+        required_any = None
+
+    for line_num, line in lines_chunk:
+        stripped = line.strip()
+        if not stripped:
+            continue
+        m = match(stripped)
+        if m is None:
+            failed_lines.append((line_num, line.rstrip('\n\r')))
+            continue
+
+        groups = m.groups()
+        if len(groups) < n_columns:
+            # Pad once so the per-column loop needs no bounds check
+            groups += (None,) * (n_columns - len(groups))
+
+        if required_any is not None and all(groups[i] in empty for i in required_any):
+            failed_lines.append((line_num, line.rstrip('\n\r')))
+            continue
+
+        rows[n_rows] = select(groups)
+        n_rows += 1
+
+    if not n_rows:
+        return {}, failed_lines
+    del rows[n_rows:]
+
+    return dict(zip(selected_columns, map(list, zip(*rows)))), failed_lines
+
+
+def _is_gzip_file(file_path):
+    """Check the gzip magic bytes at the start of a file"""
+    with open(file_path, 'rb') as f:
+        return f.read(2) == GZIP_MAGIC
+
+
+def _advise_sequential(f):
+    """
+    Hint the kernel that a plain log file is read front to back.
+
+    With POSIX_FADV_SEQUENTIAL the kernel uses a larger readahead window,
+    so cold-cache reads of big files wait less on the disk. No-op where
+    posix_fadvise is unavailable (Windows, macOS).
+
+    Args:
+        f: Open file object
+
+    Returns:
+        The same file object
+    """
+    if hasattr(os, 'posix_fadvise'):
         try:
-            with gzip.open(input_file, 'rt', encoding='utf-8') as f:
-                for line_num, line in enumerate(f, 1):
-                    lines.append((line_num, line))
-                    if max_lines and line_num >= max_lines:
-                        break
-        except (gzip.BadGzipFile, OSError):
-            # Try plain text
-            with open(input_file, 'r', encoding='utf-8', errors='ignore') as f:
-                for line_num, line in enumerate(f, 1):
-                    lines.append((line_num, line))
-                    if max_lines and line_num >= max_lines:
-                        break
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+    return f
+
+
+def _open_log_binary(file_path, parallelization=0):
+    """
+    Open a log file (gzip or plain) for binary line reading.
+
+    Args:
+        file_path: Path to log file
+        parallelization: rapidgzip decompression threads (0 = all cores)
+
+    Returns:
+        Buffered binary stream (use as a context manager)
+    """
+    if not _is_gzip_file(file_path):
+        return _advise_sequential(open(file_path, 'rb', buffering=GZIP_READ_BUFFER_SIZE))
+
+    if rapidgzip is not None:
+        raw = rapidgzip.open(str(file_path), parallelization=parallelization)
+    else:
+        raw = gzip.open(file_path, 'rb')
+    return io.BufferedReader(raw, buffer_size=GZIP_READ_BUFFER_SIZE)
+
+
+def _iter_json_lines(file_path):
+    """
+    Read a JSON Lines file (gzip or plain) and yield one object per line.
+
+    Lines are decoded straight from bytes (orjson and json both accept bytes),
+    and empty lines are skipped.
+
+    Args:
+        file_path: Path to JSON Lines file
+
+    Yields:
+        Parsed JSON objects
+
+    Raises:
+        ValueError: If one of the first 3 lines is not valid JSON
+            (probably not a JSON Lines file)
+    """
+    with _open_log_binary(file_path) as f:
+        for line_num, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                obj = _json_loads(line)
+            except ValueError:
+                # If first few lines fail to parse as JSON, probably not JSON Lines
+                if line_num <= 3:
+                    raise ValueError("Not a JSON Lines file")
+                continue
+            yield obj
+
+
+def _open_gzip_text(file_path, parallelization=0):
+    """
+    Open a gzip file for text reading with a large read buffer.
+
+    Uses rapidgzip (parallel block decompression) when it is installed,
+    otherwise the standard gzip module.
+
+    Args:
+        file_path: Path to gzip file
+        parallelization: rapidgzip decompression threads (0 = all cores)
+
+    Returns:
+        Text stream (use as a context manager)
+    """
+    if rapidgzip is not None:
+        raw = rapidgzip.open(str(file_path), parallelization=parallelization)
+    else:
+        raw = gzip.open(file_path, 'rb')
+    return io.TextIOWrapper(
+        io.BufferedReader(raw, buffer_size=GZIP_READ_BUFFER_SIZE),
+        encoding='utf-8'
+    )
+
+
+def _open_log_text(file_path, parallelization=0):
+    """
+    Open a log file for text reading, gzip or plain.
+
+    The format is decided from the magic bytes, so the file is opened once
+    with the right reader instead of trying gzip and falling back.
+
+    Args:
+        file_path: Path to log file
+        parallelization: rapidgzip decompression threads (0 = all cores)
+
+    Returns:
+        Text stream (use as a context manager)
+    """
+    if _is_gzip_file(file_path):
+        return _open_gzip_text(file_path, parallelization)
+    return _advise_sequential(open(file_path, 'r', encoding='utf-8', errors='ignore'))
+
+
+def _read_lines_from_file(input_file, max_lines=None, parallelization=0):
+    """
+    Read lines from file (gzip or plain text) with line numbers.
+
+    Lines are yielded lazily so parsing can start while the rest of the
+    file is still being read/decompressed.
+
+    Args:
+        input_file: Path to input file
+        max_lines: Maximum number of lines to read (None for all)
+        parallelization: Decompression threads for rapidgzip (0 = all cores)
+
+    Yields:
+        (line_num, line) tuples
+    """
+    try:
+        with _open_log_text(input_file, parallelization) as f:
+            for line_num, line in enumerate(f, 1):
+                yield line_num, line
+                if max_lines and line_num >= max_lines:
+                    return
     except Exception as e:
         logger.error(f"Error reading file {input_file}: {e}")
         raise
 
-    return lines
+
+def _iter_chunks(iterable, size, max_bytes=None):
+    """
+    Group an iterable of (line_num, line) tuples into chunks.
+
+    A chunk ends after `size` lines or, if max_bytes is given, once its
+    lines add up to max_bytes characters, whichever comes first. Bounding by
+    size keeps per-chunk work similar for short and long log lines.
+
+    Args:
+        iterable: Source iterable (e.g. _read_lines_from_file generator)
+        size: Maximum number of lines per chunk
+        max_bytes: Optional maximum text size per chunk
+
+    Yields:
+        Lists of (line_num, line) tuples
+    """
+    iterator = iter(iterable)
+    if not max_bytes:
+        while True:
+            chunk = list(itertools.islice(iterator, size))
+            if not chunk:
+                return
+            yield chunk
+
+    chunk = []
+    chunk_bytes = 0
+    for item in iterator:
+        chunk.append(item)
+        chunk_bytes += len(item[1])
+        if len(chunk) >= size or chunk_bytes >= max_bytes:
+            yield chunk
+            chunk = []
+            chunk_bytes = 0
+    if chunk:
+        yield chunk
 
 
 def parse_log_file_with_format(input_file, log_format_file, use_multiprocessing=None, num_workers=None, chunk_size=None, columns_to_load=None):
@@ -806,8 +1303,9 @@ def parse_log_file_with_format(input_file, log_format_file, use_multiprocessing=
             If None, reads from config.yaml (default: None, will use config or True)
         num_workers (int, optional): Number of worker processes.
             If None, reads from config.yaml or auto-detects based on CPU cores
-        chunk_size (int, optional): Number of lines per chunk for parallel processing.
-            If None, reads from config.yaml (default: None, will use config or 10000)
+        chunk_size (int, optional): Maximum number of lines per chunk for parallel processing.
+            If None, reads from config.yaml (default: None, will use config or 10000).
+            Chunks are additionally bounded by multiprocessing.target_chunk_bytes.
         columns_to_load (list, optional): List of column names to load. If None, loads all columns.
             This significantly reduces memory usage for large files (80-90% reduction).
             Example: ['time', 'request_url'] will only load these 2 columns instead of all 34.
@@ -839,42 +1337,8 @@ def parse_log_file_with_format(input_file, log_format_file, use_multiprocessing=
     if is_filtered_file:
         # Try to read as JSON Lines (filtered files are JSON Lines)
         try:
-            log_data = []
-            # Try gzip first
-            try:
-                with gzip.open(input_file, 'rt', encoding='utf-8') as f:
-                    for line_num, line in enumerate(f, 1):
-                        line = line.strip()
-                        if not line:
-                            continue
-                        try:
-                            obj = json.loads(line)
-                            log_data.append(obj)
-                        except json.JSONDecodeError:
-                            # If first few lines fail to parse as JSON, probably not JSON Lines
-                            if line_num <= 3:
-                                raise ValueError("Not a JSON Lines file")
-                            continue
-                        if line_num % 10000 == 0:
-                            logger.debug(f"Processed {line_num} lines...")
-            except (gzip.BadGzipFile, OSError):
-                # Try plain text JSON Lines
-                with open(input_file, 'r', encoding='utf-8', errors='ignore') as f:
-                    for line_num, line in enumerate(f, 1):
-                        line = line.strip()
-                        if not line:
-                            continue
-                        try:
-                            obj = json.loads(line)
-                            log_data.append(obj)
-                        except json.JSONDecodeError:
-                            # If first few lines fail to parse as JSON, probably not JSON Lines
-                            if line_num <= 3:
-                                raise ValueError("Not a JSON Lines file")
-                            continue
-                        if line_num % 10000 == 0:
-                            logger.debug(f"Processed {line_num} lines...")
-            
+            log_data = list(_iter_json_lines(input_file))
+
             # If we successfully parsed JSON Lines, return it
             if log_data:
                 df = pd.DataFrame(log_data)
@@ -886,94 +1350,293 @@ def parse_log_file_with_format(input_file, log_format_file, use_multiprocessing=
                 logger.warning(f"Failed to parse as JSON Lines, trying original log format: {e}")
             pass
     
-    # Load log format for original log parsing
+    format_info, parsing_config, worker_columns, empty_to_null = _prepare_format_info(
+        input_file, log_format_file, columns_to_load
+    )
+
+    # Parse file as original log format, accumulating column-wise ({column: [values]})
+    log_data = {}
+    total_rows = 0
+    failed_lines = []  # Collect failed lines for output
+
+    for parsed_chunk, failed_chunk in _iter_parsed_chunks(
+        input_file, format_info, worker_columns, use_multiprocessing, num_workers, chunk_size, mp_config
+    ):
+        total_rows = _extend_columns(log_data, total_rows, parsed_chunk)
+        failed_lines.extend(failed_chunk)
+
+    _log_failed_lines(failed_lines)
+
+    if not total_rows:
+        logger.warning("No valid log entries parsed.")
+        return pd.DataFrame()
+
+    df = _finalize_dataframe(log_data, total_rows, format_info, parsing_config, empty_to_null, columns_to_load)
+
+    logger.info(f"Total parsed entries: {len(df)}")
+    if failed_lines:
+        logger.info(f"Total failed lines: {len(failed_lines)}")
+
+    return df
+
+
+def parse_log_file_with_format_chunks(input_file, log_format_file, rows_per_chunk=200_000, use_multiprocessing=None,
+                                      num_workers=None, chunk_size=None, columns_to_load=None):
+    """
+    Parse log file like parse_log_file_with_format, yielding DataFrames of bounded size.
+
+    Only up to rows_per_chunk parsed rows are held at a time, so callers that
+    process rows independently (e.g. filterByCondition) need O(chunk) memory
+    instead of O(file). Each chunk gets the same post-processing (HTTPD request
+    split, column types) as the full DataFrame.
+
+    Args:
+        input_file (str): Input log file path
+        log_format_file (str): Log format JSON file path
+        rows_per_chunk (int): Maximum number of rows per yielded DataFrame
+        use_multiprocessing, num_workers, chunk_size, columns_to_load:
+            Same as parse_log_file_with_format
+
+    Yields:
+        pandas.DataFrame: Parsed log data, in file order
+    """
+    from core.utils import MultiprocessingConfig
+    mp_config = MultiprocessingConfig.get_config()
+
+    if use_multiprocessing is None:
+        use_multiprocessing = mp_config['enabled']
+    if num_workers is None:
+        num_workers = mp_config['num_workers']
+    if chunk_size is None:
+        chunk_size = mp_config['chunk_size']
+
+    # Filtered files from filterByCondition are JSON Lines
+    if 'filtered_' in Path(input_file).name:
+        records = []
+        total_rows = 0
+        try:
+            for record in _iter_json_lines(input_file):
+                records.append(record)
+                if len(records) >= rows_per_chunk:
+                    total_rows += len(records)
+                    yield _take_records_frame(records)
+        except ValueError as e:
+            # Not JSON Lines: fall through to original log parsing (only possible before any output)
+            if total_rows:
+                raise
+            logger.warning(f"Failed to parse as JSON Lines, trying original log format: {e}")
+            records = None
+
+        if records is not None and (records or total_rows):
+            if records:
+                total_rows += len(records)
+                yield _take_records_frame(records)
+            logger.info(f"Total parsed entries (JSON Lines): {total_rows}")
+            return
+
+    format_info, parsing_config, worker_columns, empty_to_null = _prepare_format_info(
+        input_file, log_format_file, columns_to_load
+    )
+
+    log_data = {}
+    pending_rows = 0
+    total_rows = 0
+    failed_lines = []
+
+    for parsed_chunk, failed_chunk in _iter_parsed_chunks(
+        input_file, format_info, worker_columns, use_multiprocessing, num_workers, chunk_size, mp_config
+    ):
+        pending_rows = _extend_columns(log_data, pending_rows, parsed_chunk)
+        failed_lines.extend(failed_chunk)
+        while pending_rows >= rows_per_chunk:
+            # Split off exactly rows_per_chunk rows; the rest waits for the next chunk.
+            # The taken lists are only referenced by the call, so the generator holds
+            # nothing but the pending rows while the caller works on the DataFrame
+            pending_rows -= rows_per_chunk
+            total_rows += rows_per_chunk
+            yield _finalize_dataframe(_take_rows(log_data, rows_per_chunk), rows_per_chunk,
+                                      format_info, parsing_config, empty_to_null, columns_to_load)
+
+    if pending_rows:
+        total_rows += pending_rows
+        yield _finalize_dataframe(_take_rows(log_data, pending_rows), pending_rows,
+                                  format_info, parsing_config, empty_to_null, columns_to_load)
+
+    _log_failed_lines(failed_lines)
+    if not total_rows:
+        logger.warning("No valid log entries parsed.")
+    logger.info(f"Total parsed entries: {total_rows}")
+
+
+def _take_rows(data, n_rows):
+    """
+    Remove the first n_rows from column-wise data in place and return them.
+
+    Args:
+        data: {column: [values]} (modified in place)
+        n_rows: Number of leading rows to take
+
+    Returns:
+        dict: {column: [values]} with the taken rows
+    """
+    head = {}
+    for col, values in data.items():
+        head[col] = values[:n_rows]
+        del values[:n_rows]
+    return head
+
+
+def _take_records_frame(records):
+    """Build a DataFrame from a list of records and empty the list in place"""
+    df = pd.DataFrame(records)
+    records.clear()
+    return df
+
+
+def _prepare_format_info(input_file, log_format_file, columns_to_load):
+    """
+    Load a log format file and resolve the per-parse settings derived from it.
+
+    Args:
+        input_file (str): Input log file path (used to find config.yaml)
+        log_format_file (str): Log format JSON file path
+        columns_to_load (list): Requested columns (None for all)
+
+    Returns:
+        Tuple of (format_info, parsing_config, worker_columns, empty_to_null)
+    """
     with open(log_format_file, 'r', encoding='utf-8') as f:
         format_info = json.load(f)
-    
+
     pattern = format_info['logPattern']
     pattern_type = format_info['patternType']
-    field_map = format_info['fieldMap']
-    
+    parsing_config = _get_parsing_config()
+    format_info['_regex_engine'] = parsing_config['regex_engine']
+
     # For ALB, if columns are missing, try to load from config.yaml
     if pattern_type == 'ALB' and 'columns' not in format_info:
         logger.warning("columns not found in logFormatFile, trying to load from config.yaml")
-        try:
-            # Try to find config.yaml and load columns
-            config_paths = [
-                Path(input_file).parent / 'config.yaml',
-                Path(input_file).parent.parent / 'config.yaml',
-                Path.cwd() / 'config.yaml',
-                Path(__file__).parent / 'config.yaml'
-            ]
-            
-            for config_path in config_paths:
-                if config_path.exists():
-                    try:
-                        config = load_config_legacy(str(config_path))
-                        if 'columns' in config:
-                            format_info['columns'] = config['columns']
-                            logger.info(f"Loaded columns from config.yaml: {config_path}")
-                            break
-                    except Exception as e:
-                        continue
-        except Exception as e:
-            logger.warning(f"Failed to load columns from config.yaml: {e}")
-    
-    # Parse file as original log format
-    log_data = []
-    failed_lines = []  # Collect failed lines for output
+        config, config_path = _load_config_near_input(input_file)
+        columns = config.get('columns') or (config.get('alb') or {}).get('columns')
+        if columns:
+            format_info['columns'] = columns
+            logger.info(f"Loaded columns from config.yaml: {config_path}")
+
+    # Let workers drop unrequested columns when the column set is known up front
+    worker_columns = _resolve_worker_columns(pattern, pattern_type, format_info, columns_to_load)
+    # Positional chunk parsing keeps empty markers; they are nulled when building the DataFrame
+    empty_to_null = format_info['columns'] if _positional_pattern(pattern, pattern_type, format_info) is not None else None
+
+    return format_info, parsing_config, worker_columns, empty_to_null
+
+
+def _iter_parsed_chunks(input_file, format_info, worker_columns, use_multiprocessing, num_workers, chunk_size, mp_config):
+    """
+    Read and parse a log file chunk by chunk, in file order.
+
+    Args:
+        input_file (str): Input log file path
+        format_info (dict): Format information (see _prepare_format_info)
+        worker_columns: Columns workers emit (see _resolve_worker_columns)
+        use_multiprocessing (bool): Parse chunks in a worker pool
+        num_workers (int): Number of workers (None for all cores)
+        chunk_size (int): Maximum number of lines per chunk
+        mp_config (dict): Multiprocessing configuration
+
+    Yields:
+        Tuple of (parsed_chunk, failed_chunk) per chunk (see _parse_lines_chunk)
+    """
+    pattern = format_info['logPattern']
+    pattern_type = format_info['patternType']
+    parsed_rows = 0
+    failed_count = 0
 
-    # Determine if we should use multiprocessing
-    # Get total line count estimate for decision
+    # Stream the file in chunks (bounded by chunk_size lines and target_chunk_bytes);
+    # worker processes are only started when the file spans more than one chunk
+    lines = _read_lines_from_file(input_file, parallelization=num_workers or 0)
     try:
-        lines_with_nums = _read_lines_from_file(input_file)
-        total_lines = len(lines_with_nums)
-        logger.info(f"Read {total_lines} lines from {input_file}")
+        chunks = _iter_chunks(lines, chunk_size, mp_config.get('target_chunk_bytes'))
+        first_chunk = next(chunks, [])
+
+        # Peek at the next chunk: files that fit in one chunk are parsed sequentially
+        second_chunk = next(chunks, None)
+        if second_chunk is not None:
+            chunks = itertools.chain([second_chunk], chunks)
 
-        # Use multiprocessing for large files (>= 10000 lines)
-        if use_multiprocessing and total_lines >= chunk_size:
-            # Determine number of workers
+        if use_multiprocessing and second_chunk is not None:
+            # Determine number of workers: the total line count is unknown while streaming,
+            # so read ahead up to one chunk per core and start no more workers than chunks
             if num_workers is None:
-                num_workers = min(cpu_count(), max(1, total_lines // chunk_size))
+                lookahead = list(itertools.islice(chunks, cpu_count() - 1))
+                chunks = itertools.chain(lookahead, chunks)
+                num_workers = min(cpu_count(), 1 + len(lookahead))
 
-            logger.info(f"Using multiprocessing with {num_workers} workers, chunk_size={chunk_size}")
+            # Threads avoid fork and pickling of parsed chunks, but only scale
+            # when the regex engine releases the GIL
+            backend = mp_config.get('backend', 'process')
+            pool_cls = ThreadPool if backend == 'thread' else Pool
 
-            # Split lines into chunks
-            chunks = [lines_with_nums[i:i + chunk_size] for i in range(0, len(lines_with_nums), chunk_size)]
+            logger.info(f"Using multiprocessing with {num_workers} workers, chunk_size={chunk_size}, backend={backend}")
 
             # Create worker function with fixed parameters
-            worker_fn = partial(_parse_lines_chunk, pattern=pattern, pattern_type=pattern_type, format_info=format_info)
-
-            # Process chunks in parallel
-            with Pool(processes=num_workers) as pool:
-                results = pool.map(worker_fn, chunks)
+            worker_fn = partial(_parse_lines_chunk, pattern=pattern, pattern_type=pattern_type,
+                                format_info=format_info, columns_to_load=worker_columns)
 
-            # Combine results
-            for parsed_chunk, failed_chunk in results:
-                log_data.extend(parsed_chunk)
-                failed_lines.extend(failed_chunk)
+            # Process chunks in parallel as they are read, in the original line order
+            with pool_cls(processes=num_workers) as pool:
+                results = _imap_bounded(pool, worker_fn, itertools.chain([first_chunk], chunks), 2 * num_workers)
+                for parsed_chunk, failed_chunk in results:
+                    if parsed_chunk:
+                        parsed_rows += len(next(iter(parsed_chunk.values())))
+                    failed_count += len(failed_chunk)
+                    yield parsed_chunk, failed_chunk
 
-            logger.info(f"Parallel parsing completed: {len(log_data)} entries parsed, {len(failed_lines)} failed")
+            logger.info(f"Parallel parsing completed: {parsed_rows} entries parsed, {failed_count} failed")
 
         else:
             # Sequential processing for small files
             logger.info("Using sequential processing (file too small or multiprocessing disabled)")
 
-            for line_num, line in lines_with_nums:
-                original_line = line.rstrip('\n\r')
-                parsed = _parse_line(line, pattern, pattern_type, format_info)
-                if parsed:
-                    log_data.append(parsed)
-                else:
-                    if original_line.strip():
-                        failed_lines.append((line_num, original_line))
-                if line_num % 10000 == 0:
-                    logger.debug(f"Processed {line_num} lines...")
+            for chunk in itertools.chain([first_chunk] if first_chunk else [], chunks):
+                yield _parse_lines_chunk(chunk, pattern, pattern_type, format_info, worker_columns)
+                logger.debug(f"Processed {chunk[-1][0]} lines...")
 
     except Exception as e:
         logger.error(f"Error parsing file {input_file}: {e}")
         raise
+    finally:
+        # Close the reader even if parsing failed part-way (releases rapidgzip threads)
+        lines.close()
+
+
+def _imap_bounded(pool, fn, items, max_pending):
+    """
+    Ordered pool.imap that reads at most max_pending items ahead of the consumer.
+
+    pool.imap drains its input in a feeder thread, so a streamed file would be read
+    into memory as fast as it can be chunked; here a chunk is only submitted once
+    an earlier one has been handed back.
 
+    Args:
+        pool: multiprocessing Pool or ThreadPool
+        fn: Function applied to each item
+        items: Iterable of items
+        max_pending (int): Maximum number of submitted, not yet yielded items
+
+    Yields:
+        fn(item) for each item, in input order
+    """
+    pending = deque()
+    for item in items:
+        pending.append(pool.apply_async(fn, (item,)))
+        if len(pending) >= max_pending:
+            yield pending.popleft().get()
+    while pending:
+        yield pending.popleft().get()
+
+
+def _log_failed_lines(failed_lines):
+    """Log lines that could not be parsed (first 10 in full)"""
     # Output failed lines (파싱에 실패한 라인은 화면에 출력함)
     if failed_lines:
         logger.warning(f"파싱에 실패한 라인 ({len(failed_lines)}건):")
@@ -982,16 +1645,29 @@ def parse_log_file_with_format(input_file, log_format_file, use_multiprocessing=
             logger.warning(f"Line {line_num}: {failed_line[:100]}...")  # Truncate long lines
         if len(failed_lines) > 10:
             logger.warning(f"... and {len(failed_lines) - 10} more failed lines")
-    
-    if not log_data:
-        logger.warning("No valid log entries parsed.")
-        return pd.DataFrame()
+
+
+def _finalize_dataframe(log_data, total_rows, format_info, parsing_config, empty_to_null, columns_to_load=None):
+    """
+    Build the parsed DataFrame from column-wise data and apply post-processing.
+
+    Args:
+        log_data (dict): Column-wise parsed data ({column: [values]}), non-empty
+        total_rows (int): Number of rows in log_data
+        format_info (dict): Format information (see _prepare_format_info)
+        parsing_config (dict): Parsing options (see _get_parsing_config)
+        empty_to_null: Columns whose empty markers become nulls (see _build_dataframe)
+        columns_to_load (list): Requested columns (None for all)
+
+    Returns:
+        pandas.DataFrame
+    """
+    pattern_type = format_info['patternType']
 
     # OPTIMIZED: Filter columns BEFORE DataFrame creation to reduce memory usage
+    # (workers already dropped them when worker_columns is set; JSON is filtered here)
     if columns_to_load:
-        # Get sample entry to check available columns
-        sample_entry = log_data[0] if log_data else {}
-        all_columns = list(sample_entry.keys())
+        all_columns = list(log_data.keys())
         available_cols = [col for col in columns_to_load if col in all_columns]
         missing_cols = [col for col in columns_to_load if col not in all_columns]
 
@@ -1010,25 +1686,16 @@ def parse_log_file_with_format(input_file, log_format_file, use_multiprocessing=
             logger.warning(f"Requested columns not found in parsed data: {missing_cols}")
 
         if available_cols:
-            # Filter each entry to only include requested columns
-            # This happens BEFORE DataFrame creation, reducing memory by 80-90%
-            filtered_log_data = []
-            for entry in log_data:
-                filtered_entry = {col: entry.get(col) for col in available_cols}
-                filtered_log_data.append(filtered_entry)
+            # Drop unrequested columns BEFORE DataFrame creation, reducing memory by 80-90%
+            log_data = {col: log_data[col] for col in available_cols}
 
             logger.info(f"Column filtering: Loading {len(available_cols)}/{len(columns_to_load)} requested columns (from {len(all_columns)} total)")
-            logger.info(f"Pre-filtered {len(log_data)} entries before DataFrame creation (memory optimized)")
-            log_data = filtered_log_data
+            logger.info(f"Pre-filtered {total_rows} entries before DataFrame creation (memory optimized)")
         else:
             logger.warning("No requested columns found in parsed data, loading all columns")
 
-    # Create DataFrame from pre-filtered data (much smaller memory footprint)
-    df = pd.DataFrame(log_data)
-
-    logger.info(f"Total parsed entries: {len(df)}")
-    if failed_lines:
-        logger.info(f"Total failed lines: {len(failed_lines)}")
+    # Create DataFrame from pre-filtered column lists (much smaller memory footprint)
+    df = _build_dataframe(log_data, use_arrow=parsing_config['arrow_strings'], empty_to_null=empty_to_null)
 
     # For HTTPD logs, split 'request' field into method, url, protocol
     if pattern_type == 'HTTPD' and 'request' in df.columns and not df.empty:
@@ -1102,7 +1769,11 @@ def parse_log_file_with_format(input_file, log_format_file, use_multiprocessing=
                         df[col] = pd.to_numeric(df[col], errors='coerce')
                         logger.debug(f"Converted '{col}' to float")
                     elif dtype in ('str', 'string', 'object'):
-                        df[col] = df[col].astype(str)
+                        if isinstance(df[col].dtype, pd.ArrowDtype):
+                            # Already Arrow strings; astype(str) would fall back to objects
+                            df[col] = df[col].astype(pd.ArrowDtype(pa.string()))
+                        else:
+                            df[col] = df[col].astype(str)
                         logger.debug(f"Converted '{col}' to string")
                 except Exception as e:
                     logger.warning(f"Failed to convert column '{col}' to {dtype}: {e}")
@@ -1121,7 +1792,7 @@ def parse_log_file_with_format(input_file, log_format_file, use_multiprocessing=
     return df
 
 
-def _parse_line(line, pattern, pattern_type, format_info=None):
+def _parse_line(line, pattern, pattern_type, format_info=None, stripped=False):
     """Parse a single line based on pattern type
 
     Args:
@@ -1129,24 +1800,27 @@ def _parse_line(line, pattern, pattern_type, format_info=None):
         pattern: Regex pattern
         pattern_type: Pattern type (ALB, JSON, HTTPD, GROK)
         format_info: Format information dict (may contain 'columns')
+        stripped: True if the caller already stripped the line
     """
-    line = line.strip()
+    if not stripped:
+        line = line.strip()
     if not line:
         return None
 
     if pattern_type == 'JSON':
         try:
-            return json.loads(line)
+            return _json_loads(line)
         except:
             return None
     else:
         try:
-            match = re.match(pattern, line)
+            engine = format_info.get('_regex_engine', 're') if format_info else 're'
+            match = _compile_log_pattern(pattern, engine).match(line)
             if match:
                 named_groups = match.groupdict()
                 if named_groups:
                     return {
-                        key: (None if value in ('', '-', ' ', None) else value)
+                        key: (None if value in EMPTY_FIELD_VALUES else value)
                         for key, value in named_groups.items()
                     }
 
@@ -1156,19 +1830,15 @@ def _parse_line(line, pattern, pattern_type, format_info=None):
                 columns = format_info.get('columns', []) if format_info else []
 
                 if columns:
+                    # If not enough groups, pad so remaining columns are set to None
+                    if len(groups) < len(columns):
+                        groups += (None,) * (len(columns) - len(groups))
+
                     # Map groups to column names from config
                     result = {}
-                    for i, col in enumerate(columns):
-                        if i < len(groups):
-                            value = groups[i]
-                            # Handle empty strings and special values
-                            if value == '' or value == '-' or value == ' ' or value is None:
-                                result[col] = None
-                            else:
-                                result[col] = value
-                        else:
-                            # If not enough groups, set remaining columns to None
-                            result[col] = None
+                    for col, value in zip(columns, groups):
+                        # Handle empty strings and special values
+                        result[col] = None if value in EMPTY_FIELD_VALUES else value
 
                     # Validate for ALB (strict validation)
                     if pattern_type == 'ALB':
@@ -1202,7 +1872,7 @@ def _parse_line(line, pattern, pattern_type, format_info=None):
                         for i in range(min_fields):
                             if i < len(field_names):
                                 value = groups[i]
-                                if value == '' or value == '-' or value == ' ':
+                                if value in EMPTY_FIELD_VALUES:
                                     result[field_names[i]] = None
                                 else:
                                     result[field_names[i]] = value
@@ -1257,6 +1927,7 @@ def parse_log_file(input_path, log_pattern, columns):
     import glob
     
     log_data = []
+    compiled_pattern = _compile_log_pattern(log_pattern)
     
     # Handle glob patterns
     if isinstance(input_path, str):
@@ -1266,24 +1937,13 @@ def parse_log_file(input_path, log_pattern, columns):
     
     for file_path in file_paths:
         try:
-            # Try gzip first
-            try:
-                with gzip.open(file_path, 'rt', encoding='utf-8') as f:
-                    for line_num, line in enumerate(f, 1):
-                        match = re.match(log_pattern, line.strip())
-                        if match:
-                            log_data.append(dict(zip(columns, match.groups())))
-                        if line_num % 10000 == 0:
-                            logger.debug(f"Processed {line_num} lines from {file_path}...")
-            except:
-                # Try plain text
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    for line_num, line in enumerate(f, 1):
-                        match = re.match(log_pattern, line.strip())
-                        if match:
-                            log_data.append(dict(zip(columns, match.groups())))
-                        if line_num % 10000 == 0:
-                            logger.debug(f"Processed {line_num} lines from {file_path}...")
+            with _open_log_text(file_path) as f:
+                for line_num, line in enumerate(f, 1):
+                    match = compiled_pattern.match(line.strip())
+                    if match:
+                        log_data.append(dict(zip(columns, match.groups())))
+                    if line_num % 10000 == 0:
+                        logger.debug(f"Processed {line_num} lines from {file_path}...")
         except Exception as e:
             logger.error(f"Error parsing file {file_path}: {e}")
     
@@ -1328,7 +1988,7 @@ def apply_column_types(log_df, column_types):
 
 def save_as_pickle(log_df, pickle_path):
     """
-    Save DataFrame to pickle file.
+    Save DataFrame to pickle file (legacy, see save_as_parquet).
     
     Args:
         log_df (pandas.DataFrame): DataFrame to save
@@ -1355,6 +2015,41 @@ def load_from_pickle(pickle_path):
         return pickle.load(f)
 
 
+def save_as_parquet(log_df, parquet_path, compression='zstd'):
+    """
+    Save DataFrame to a Parquet file (columnar, compressed).
+
+    Preferred over save_as_pickle: smaller files, faster to write and read,
+    and load_from_parquet can read only the columns it needs.
+
+    Args:
+        log_df (pandas.DataFrame): DataFrame to save
+        parquet_path (str): Output Parquet file path
+        compression (str): Parquet compression codec (default: 'zstd')
+    """
+    if pa is None:
+        raise ImportError("pyarrow is required for Parquet storage (pip install pyarrow)")
+    log_df.to_parquet(parquet_path, engine='pyarrow', compression=compression, index=False)
+    print(f"Data saved to {parquet_path}")
+
+
+def load_from_parquet(parquet_path, columns_to_load=None):
+    """
+    Load DataFrame from a Parquet file.
+
+    Args:
+        parquet_path (str): Parquet file path
+        columns_to_load (list, optional): Columns to read (None for all).
+            Only these columns are read from disk.
+
+    Returns:
+        pandas.DataFrame: Loaded DataFrame
+    """
+    if pa is None:
+        raise ImportError("pyarrow is required for Parquet storage (pip install pyarrow)")
+    return pd.read_parquet(parquet_path, engine='pyarrow', columns=columns_to_load)
+
+
 def save_to_sqlite(log_df, sqlite_path, table_name):
     """
     Save DataFrame to SQLite database.
@@ -1389,6 +2084,52 @@ def load_from_sqlite(sqlite_path, table_name):
     return df
 
 
+def save_to_duckdb(log_df, duckdb_path, table_name):
+    """
+    Save DataFrame to a DuckDB database.
+
+    Much faster than save_to_sqlite for large frames: DuckDB reads the
+    DataFrame columns directly instead of inserting row by row.
+
+    Args:
+        log_df (pandas.DataFrame): DataFrame to save
+        duckdb_path (str): DuckDB database file path
+        table_name (str): Table name (replaced if it exists)
+    """
+    if duckdb is None:
+        raise ImportError("duckdb is required for DuckDB storage (pip install duckdb)")
+    conn = duckdb.connect(duckdb_path)
+    try:
+        conn.register('log_df_view', log_df)
+        conn.execute(f'CREATE OR REPLACE TABLE "{table_name}" AS SELECT * FROM log_df_view')
+        conn.unregister('log_df_view')
+    finally:
+        conn.close()
+    print(f"Data saved to DuckDB database: {duckdb_path} (table: {table_name})")
+
+
+def load_from_duckdb(duckdb_path, table_name, columns_to_load=None):
+    """
+    Load DataFrame from a DuckDB database.
+
+    Args:
+        duckdb_path (str): DuckDB database file path
+        table_name (str): Table name
+        columns_to_load (list, optional): Columns to read (None for all)
+
+    Returns:
+        pandas.DataFrame: Loaded DataFrame
+    """
+    if duckdb is None:
+        raise ImportError("duckdb is required for DuckDB storage (pip install duckdb)")
+    select_list = ', '.join(f'"{col}"' for col in columns_to_load) if columns_to_load else '*'
+    conn = duckdb.connect(duckdb_path, read_only=True)
+    try:
+        return conn.execute(f'SELECT {select_list} FROM "{table_name}"').df()
+    finally:
+        conn.close()
+
+
 # Main function for testing
 if __name__ == "__main__":
     import sys
@@ -7,6 +7,7 @@ Implements MCP tools: filterByCondition, extractUriPatterns, filterUriPatterns,
 import pandas as pd
 import numpy as np
 import json
+import math
 import re
 import os
 from datetime import datetime
@@ -14,9 +15,11 @@ from pathlib import Path
 from collections import defaultdict, Counter
 from urllib.parse import urlparse, parse_qs
 import ipaddress
+import heapq
 from typing import Dict, List, Tuple, Optional, Any
-from multiprocessing import Pool, cpu_count
-from functools import partial
+from functools import lru_cache
+from multiprocessing import cpu_count
+from multiprocessing.pool import ThreadPool
 
 # Import core modules
 from core.exceptions import (
@@ -26,9 +29,42 @@ from core.exceptions import (
 from core.logging_config import get_logger
 from core.utils import ParamParser
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # Optional: faster JSON for list files and filtered output
+    orjson = None
+    _json_loads = json.loads
+
 # Setup logger
 logger = get_logger(__name__)
 
+# Dotted-quad IPv4 address as accepted by ipaddress (0-255, no leading zeros)
+_IPV4_OCTET = r'(?:25[0-5]|2[0-4][0-9]|1[0-9][0-9]|[1-9]?[0-9])'
+_IPV4_RE = re.compile(rf'{_IPV4_OCTET}(?:\.{_IPV4_OCTET}){{3}}')
+
+# Write buffer for filtered JSON Lines output
+JSONL_WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Characters with a meaning in regex syntax; URI patterns without them are plain prefixes
+_REGEX_METACHARACTERS = frozenset('.^$*+?{}[]\\|()')
+
+# Up to this many literal filterUriPatterns needles, `needle in uri` checks beat one
+# combined regex (see _prepare_uri_filters)
+_MAX_SUBSTRING_NEEDLES = 3
+
+# File size units (see _format_size)
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+# Characters of hex IDs (see _is_id_like)
+_HEX_DIGITS = '0123456789abcdefABCDEF'
+
+# Number + unit of response time parameters, e.g. '0.5s', '500 ms' (see _parse_time_value)
+_TIME_VALUE_RE = re.compile(r'([\d.]+)\s*([a-z]*)', re.IGNORECASE)
+
+# Trailing UTC offset of ISO 8601 times, e.g. '+09:00', '-0500' (see _parse_time_with_timezone)
+_TZ_TAIL_RE = re.compile(r'[+-]\d{2}:?\d{2}$')
+
 
 # ============================================================================
 # MCP Tool: filterByCondition
@@ -77,32 +113,34 @@ def filterByCondition(
     timestamp = datetime.now().strftime('%y%m%d_%H%M%S')
     output_file = input_path.parent / f"filtered_{timestamp}.log"
     
-    # Read and filter log file
-    from data_parser import parse_log_file_with_format
-    log_df = parse_log_file_with_format(inputFile, logFormatFile)
-    
-    total_lines = len(log_df)
-    
-    # Apply filter based on condition
-    if condition == 'time':
-        log_df = _filter_by_time(log_df, param_dict, format_info)
-    elif condition == 'statusCode':
-        log_df = _filter_by_status_code(log_df, param_dict, format_info)
-    elif condition == 'responseTime':
-        log_df = _filter_by_response_time(log_df, param_dict, format_info)
-    elif condition == 'client':
-        log_df = _filter_by_client(log_df, param_dict, format_info)
-    elif condition == 'urls':
-        log_df = _filter_by_urls(log_df, param_dict, format_info)
-    elif condition == 'uriPatterns':
-        log_df = _filter_by_uri_patterns(log_df, param_dict, format_info)
-    else:
+    # Select filter based on condition
+    filter_functions = {
+        'time': _filter_by_time,
+        'statusCode': _filter_by_status_code,
+        'responseTime': _filter_by_response_time,
+        'client': _filter_by_client,
+        'urls': _filter_by_urls,
+        'uriPatterns': _filter_by_uri_patterns,
+    }
+    filter_fn = filter_functions.get(condition)
+    if filter_fn is None:
         raise ValueError(f"Unknown condition: {condition}")
-    
-    filtered_lines = len(log_df)
-    
-    # Save filtered data to file (as JSON Lines for flexibility)
-    log_df.to_json(output_file, orient='records', lines=True)
+
+    # Read and filter log file chunk by chunk so only one chunk is held in memory;
+    # filtered rows are appended to the output (as JSON Lines for flexibility)
+    from data_parser import parse_log_file_with_format_chunks
+
+    total_lines = 0
+    filtered_lines = 0
+
+    with open(output_file, 'wb', buffering=JSONL_WRITE_BUFFER_SIZE) as f:
+        for log_df in parse_log_file_with_format_chunks(inputFile, logFormatFile):
+            total_lines += len(log_df)
+            log_df = filter_fn(log_df, param_dict, format_info)
+            if len(log_df):
+                _write_json_lines(log_df, f)
+                filtered_lines += len(log_df)
+            del log_df
     
     file_size = os.path.getsize(output_file)
     file_size_str = _format_size(file_size)
@@ -116,6 +154,90 @@ def filterByCondition(
     }
 
 
+def _write_json_lines(log_df, f):
+    """
+    Append DataFrame rows to a binary file as JSON Lines.
+
+    Writes the same records as DataFrame.to_json(orient='records', lines=True)
+    (datetimes as epoch milliseconds, missing values as null), but with orjson
+    when it is installed instead of pandas' per-cell JSON encoder.
+
+    Args:
+        log_df: DataFrame to write
+        f: File opened in binary mode
+    """
+    if orjson is not None:
+        try:
+            f.write(_dump_json_lines(log_df))
+            return
+        except (TypeError, ValueError, AttributeError) as e:
+            # Values or dtypes this path does not handle (e.g. custom objects): use pandas
+            logger.debug(f"orjson could not serialize filtered rows ({e}), using DataFrame.to_json")
+
+    f.write(log_df.to_json(orient='records', lines=True).encode('utf-8'))
+
+
+def _dump_json_lines(log_df):
+    """Serialize DataFrame rows to JSON Lines bytes with orjson, see _write_json_lines"""
+    names = [str(col) for col in log_df.columns]
+    columns = []
+    for col in log_df.columns:
+        series = log_df[col]
+        missing = series.isna().to_numpy()
+        if pd.api.types.is_datetime64_any_dtype(series.dtype):
+            # Epoch milliseconds (UTC for tz-aware columns), like to_json's default
+            values = series.dt.as_unit('ms').array.asi8.astype(object)
+        else:
+            values = series.to_numpy(dtype=object, copy=True)
+        values[missing] = None
+        columns.append(values.tolist())
+
+    dumps = orjson.dumps
+    option = orjson.OPT_APPEND_NEWLINE
+    return b''.join(dumps(dict(zip(names, row)), option=option) for row in zip(*columns))
+
+
+def _nan_to_null(data):
+    """Copy of nested dicts/lists/tuples with non-finite floats replaced by None"""
+    if isinstance(data, float):
+        return data if math.isfinite(data) else None
+    if isinstance(data, dict):
+        return {key: _nan_to_null(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [_nan_to_null(value) for value in data]
+    return data
+
+
+def _write_json(data, output_file):
+    """
+    Write a result dict as indented JSON (UTF-8, non-ASCII kept as is).
+
+    Uses orjson when it is installed; json.dump's indenting encoder is pure Python
+    and dominates the write time for large URL/pattern results. Non-finite values
+    (e.g. std of a single value) are written as null either way, as orjson does,
+    so the output stays valid JSON.
+
+    Args:
+        data: JSON-serializable data
+        output_file: Output file path
+    """
+    if orjson is not None:
+        try:
+            payload = orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            )
+        except TypeError as e:
+            # orjson.JSONEncodeError (e.g. integers over 64 bits): use the json module
+            logger.debug(f"orjson could not serialize result ({e}), using json.dump")
+        else:
+            with open(output_file, 'wb') as f:
+                f.write(payload)
+            return
+
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(_nan_to_null(data), f, indent=2, ensure_ascii=False)
+
+
 def _parse_params(params: str) -> Dict[str, str]:
     """
     Parse parameter string into dict.
@@ -130,6 +252,8 @@ def _filter_by_time(log_df, params, format_info):
     """Filter by time range with timezone support
     
     If timezone is not specified in time parameters, uses the timezone from log lines.
+    Time-sorted logs (the usual case) are cut with a binary search on each bound;
+    otherwise both bounds are applied with a single boolean mask.
     """
     time_field = format_info['fieldMap'].get('timestamp', 'time')
     
@@ -148,125 +272,123 @@ def _filter_by_time(log_df, params, format_info):
     # Handle empty dataframe
     if len(log_df) == 0:
         return log_df
+
+    if 'startTime' not in params and 'endTime' not in params:
+        return log_df
     
-    is_log_timezone_aware = pd.api.types.is_datetime64tz_dtype(log_df[time_field])
-    
-    # Helper function to check if a timestamp is timezone-aware
-    def _is_timezone_aware(ts):
-        """Check if timestamp is timezone-aware"""
-        if isinstance(ts, pd.Timestamp):
-            return ts.tz is not None
-        return False
-    
-    # Parse time parameters with timezone support
-    # If timezone is not specified in time parameter, use timezone from log format
-    def _parse_time_with_timezone(time_str, log_timezone, target_timezone_aware):
-        """Parse time string with timezone handling
-        
-        If timezone is already in time_str (ISO 8601 with timezone), use it.
-        Otherwise, use log_timezone from format_info.
-        Returns a datetime that matches target_timezone_aware (True/False).
-        """
-        parsed_time = pd.to_datetime(time_str)
-        
-        # Check if parsed_time is timezone-aware
-        is_parsed_timezone_aware = _is_timezone_aware(parsed_time)
-        
-        # If target needs naive datetime but we have timezone-aware, convert
-        if not target_timezone_aware and is_parsed_timezone_aware:
-            return parsed_time.tz_localize(None)
-        
-        # If target needs timezone-aware but we have naive
-        if target_timezone_aware and not is_parsed_timezone_aware:
-            # Check if timezone is already specified in ISO 8601 format
-            timezone_in_str = False
-            if 'T' in time_str:
-                # Check for timezone indicators: Z, +HH:MM, -HH:MM
-                if time_str.endswith('Z') or time_str.endswith('z') or \
-                   re.search(r'[+-]\d{2}:?\d{2}$', time_str):
-                    # Timezone in string, but parse might have failed
-                    # Try parsing again with utc=True
-                    try:
-                        parsed_time = pd.to_datetime(time_str, utc=True)
-                        return parsed_time
-                    except:
-                        pass
-            
-            # No timezone in parameter - apply log timezone
-            if log_timezone == 'fromLog':
-                # For 'fromLog', return naive (assume same timezone as log)
-                return parsed_time
-            elif log_timezone and log_timezone != 'UTC' and log_timezone != 'fromLog':
-                # Apply timezone from format info
-                try:
-                    return parsed_time.tz_localize(log_timezone)
-                except (TypeError, ValueError):
-                    # If timezone invalid, return naive
-                    return parsed_time
-            elif log_timezone == 'UTC':
-                try:
-                    return parsed_time.tz_localize('UTC')
-                except (TypeError, ValueError):
-                    return parsed_time
-        
-        return parsed_time
-    
-    # Apply time filters
-    if 'startTime' in params:
-        start_time = _parse_time_with_timezone(
-            params['startTime'], 
-            timezone_from_log,
-            is_log_timezone_aware
-        )
+    times = log_df[time_field]
+    is_log_timezone_aware = isinstance(times.dtype, pd.DatetimeTZDtype)
+    bounds = {}
+
+    # Parse time bounds (matched to the log column's timezone-awareness)
+    for param_name in ('startTime', 'endTime'):
+        if param_name not in params:
+            continue
+
+        bound = _parse_time_with_timezone(params[param_name], timezone_from_log, is_log_timezone_aware)
+
         # Ensure both are same type for comparison
-        # Double-check and convert if needed
-        if not is_log_timezone_aware and _is_timezone_aware(start_time):
-            # Log is naive but start_time is timezone-aware - convert start_time to naive
+        if not is_log_timezone_aware and _is_timezone_aware(bound):
+            # Log is naive but bound is timezone-aware - convert bound to naive
             try:
-                start_time = start_time.tz_localize(None) if start_time.tz is not None else start_time
+                bound = bound.tz_localize(None) if bound.tz is not None else bound
             except (TypeError, AttributeError):
                 # If conversion fails, convert to UTC then remove timezone
-                start_time = start_time.tz_convert('UTC').tz_localize(None)
-        elif is_log_timezone_aware and not _is_timezone_aware(start_time):
-            # Log is timezone-aware but start_time is naive - convert log to naive for comparison
+                bound = bound.tz_convert('UTC').tz_localize(None)
+        elif is_log_timezone_aware and not _is_timezone_aware(bound):
+            # Log is timezone-aware but bound is naive - convert log to naive for comparison
             # Convert timezone-aware to naive by converting to UTC first, then removing timezone
             try:
-                log_df[time_field] = log_df[time_field].dt.tz_convert('UTC').dt.tz_localize(None)
+                times = times.dt.tz_convert('UTC').dt.tz_localize(None)
             except (TypeError, AttributeError):
                 # If conversion fails, try direct removal
-                log_df[time_field] = log_df[time_field].dt.tz_localize(None)
+                times = times.dt.tz_localize(None)
+            log_df[time_field] = times
             is_log_timezone_aware = False
-        
-        log_df = log_df[log_df[time_field] >= start_time]
+            # A start bound parsed against the aware column: same instant in naive UTC
+            bounds = {name: b.tz_convert('UTC').tz_localize(None) for name, b in bounds.items()}
+
+        bounds[param_name] = bound
+
+    start, end = bounds.get('startTime'), bounds.get('endTime')
+
+    if pd.api.types.is_datetime64_any_dtype(times):
+        time_index = pd.DatetimeIndex(times)
+        # Sorted without NaT: rows in range are one contiguous slice. A bound that
+        # parsed to NaT matches no rows, so it is left to the mask below.
+        nat_bound = any(bound is not None and pd.isna(bound) for bound in (start, end))
+        if time_index.is_monotonic_increasing and not nat_bound:
+            lo = time_index.searchsorted(start, side='left') if start is not None else 0
+            hi = time_index.searchsorted(end, side='right') if end is not None else len(time_index)
+            return log_df.iloc[lo:hi]
+
+    mask = np.ones(len(log_df), dtype=bool)
+    if start is not None:
+        mask &= (times >= start).to_numpy(dtype=bool)
+    if end is not None:
+        mask &= (times <= end).to_numpy(dtype=bool)
+
+    return log_df[mask]
+
+
+def _is_timezone_aware(ts):
+    """Check if timestamp is timezone-aware"""
+    if isinstance(ts, pd.Timestamp):
+        return ts.tz is not None
+    return False
+
+
+@lru_cache(maxsize=64)
+def _parse_time_with_timezone(time_str, log_timezone, target_timezone_aware):
+    """Parse time string with timezone handling
     
-    if 'endTime' in params:
-        end_time = _parse_time_with_timezone(
-            params['endTime'], 
-            timezone_from_log,
-            is_log_timezone_aware
-        )
-        # Ensure both are same type for comparison
-        # Double-check and convert if needed
-        if not is_log_timezone_aware and _is_timezone_aware(end_time):
-            # Log is naive but end_time is timezone-aware - convert end_time to naive
+    If timezone is already in time_str (ISO 8601 with timezone), use it.
+    Otherwise, use log_timezone from format_info.
+    Returns a datetime that matches target_timezone_aware (True/False).
+    Cached: filterByCondition filters chunk by chunk with the same bounds.
+    """
+    parsed_time = pd.to_datetime(time_str)
+    
+    # Check if parsed_time is timezone-aware
+    is_parsed_timezone_aware = _is_timezone_aware(parsed_time)
+    
+    # If target needs naive datetime but we have timezone-aware, convert
+    if not target_timezone_aware and is_parsed_timezone_aware:
+        return parsed_time.tz_localize(None)
+    
+    # If target needs timezone-aware but we have naive
+    if target_timezone_aware and not is_parsed_timezone_aware:
+        # Check if timezone is already specified in ISO 8601 format
+        if 'T' in time_str:
+            # Check for timezone indicators: Z, +HH:MM, -HH:MM
+            if time_str.endswith('Z') or time_str.endswith('z') or \
+               _TZ_TAIL_RE.search(time_str):
+                # Timezone in string, but parse might have failed
+                # Try parsing again with utc=True
+                try:
+                    parsed_time = pd.to_datetime(time_str, utc=True)
+                    return parsed_time
+                except:
+                    pass
+        
+        # No timezone in parameter - apply log timezone
+        if log_timezone == 'fromLog':
+            # For 'fromLog', return naive (assume same timezone as log)
+            return parsed_time
+        elif log_timezone and log_timezone != 'UTC' and log_timezone != 'fromLog':
+            # Apply timezone from format info
             try:
-                end_time = end_time.tz_localize(None) if end_time.tz is not None else end_time
-            except (TypeError, AttributeError):
-                # If conversion fails, convert to UTC then remove timezone
-                end_time = end_time.tz_convert('UTC').tz_localize(None)
-        elif is_log_timezone_aware and not _is_timezone_aware(end_time):
-            # Log is timezone-aware but end_time is naive - convert log to naive for comparison
-            # Convert timezone-aware to naive by converting to UTC first, then removing timezone
+                return parsed_time.tz_localize(log_timezone)
+            except (TypeError, ValueError):
+                # If timezone invalid, return naive
+                return parsed_time
+        elif log_timezone == 'UTC':
             try:
-                log_df[time_field] = log_df[time_field].dt.tz_convert('UTC').dt.tz_localize(None)
-            except (TypeError, AttributeError):
-                # If conversion fails, try direct removal
-                log_df[time_field] = log_df[time_field].dt.tz_localize(None)
-            is_log_timezone_aware = False
-        
-        log_df = log_df[log_df[time_field] <= end_time]
+                return parsed_time.tz_localize('UTC')
+            except (TypeError, ValueError):
+                return parsed_time
     
-    return log_df
+    return parsed_time
 
 
 def _filter_by_status_code(log_df, params, format_info):
@@ -286,18 +408,22 @@ def _filter_by_status_code(log_df, params, format_info):
     # Convert to numeric
     log_df[status_field] = pd.to_numeric(log_df[status_field], errors='coerce')
     
-    # Build filter condition
-    mask = pd.Series([False] * len(log_df), index=log_df.index)
+    # Expand ranges and exact codes into one set of allowed codes
+    allowed = set()
     
     for code in status_codes:
         code = code.strip()
         if code.endswith('xx'):
             # Range filter (e.g., 2xx, 5xx)
             prefix = int(code[0])
-            mask |= (log_df[status_field] >= prefix * 100) & (log_df[status_field] < (prefix + 1) * 100)
+            allowed.update(range(prefix * 100, (prefix + 1) * 100))
         else:
             # Exact match
-            mask |= (log_df[status_field] == int(code))
+            allowed.add(int(code))
+    
+    # Single isin pass over the column (missing/invalid codes are NaN and never match)
+    codes = log_df[status_field].to_numpy(dtype=np.float64, na_value=np.nan)
+    mask = np.isin(codes, np.fromiter(allowed, dtype=np.int64, count=len(allowed)))
     
     return log_df[mask]
 
@@ -345,7 +471,7 @@ def _parse_time_value(value_str, target_unit):
     value_str = value_str.strip()
     
     # Extract number and unit
-    match = re.match(r'([\d.]+)\s*([a-z]*)', value_str, re.IGNORECASE)
+    match = _TIME_VALUE_RE.match(value_str)
     if not match:
         return float(value_str)
     
@@ -380,33 +506,93 @@ def _filter_by_client(log_df, params, format_info):
     if not client_ips or client_ips == ['']:
         return log_df
     
+    # Partition once: exact IPs are matched with a single isin, CIDRs below
+    ip_patterns = [ip_pattern.strip() for ip_pattern in client_ips]
+    exact_ips = frozenset(p for p in ip_patterns if p and '/' not in p)
+    cidrs = [p for p in ip_patterns if '/' in p]
+
     # Build filter mask
-    mask = pd.Series([False] * len(log_df), index=log_df.index)
-    
-    for ip_pattern in client_ips:
-        ip_pattern = ip_pattern.strip()
-        
-        if '/' in ip_pattern:
-            # CIDR notation
-            try:
-                network = ipaddress.ip_network(ip_pattern, strict=False)
-                mask |= log_df[ip_field].apply(lambda x: _ip_in_network(x, network))
-            except:
-                logger.warning(f"Invalid CIDR notation: {ip_pattern}")
+    if exact_ips:
+        mask = log_df[ip_field].isin(exact_ips).to_numpy(dtype=bool, copy=True)
+    else:
+        mask = np.zeros(len(log_df), dtype=bool)
+
+    # IP column is parsed once, on the first valid CIDR (see _parse_ip_column)
+    parsed_ips = None
+
+    for ip_pattern in cidrs:
+        try:
+            network = ipaddress.ip_network(ip_pattern, strict=False)
+        except ValueError:
+            logger.warning(f"Invalid CIDR notation: {ip_pattern}")
+            continue
+
+        if parsed_ips is None:
+            parsed_ips = _parse_ip_column(log_df[ip_field])
+        codes, ipv4_ints, ipv4_valid, ipv6_addresses = parsed_ips
+
+        if network.version == 4:
+            # Vectorized (ip & netmask) == network address on uint32 values
+            netmask = np.uint32(int(network.netmask))
+            in_network = ipv4_valid & ((ipv4_ints & netmask) == np.uint32(int(network.network_address)))
         else:
-            # Exact match
-            mask |= (log_df[ip_field] == ip_pattern)
-    
+            # IPv6: test each distinct address once and map back to rows
+            in_unique = np.fromiter(
+                (addr is not None and addr in network for addr in ipv6_addresses),
+                dtype=bool,
+                count=len(ipv6_addresses)
+            )
+            in_network = in_unique[codes]
+        mask |= in_network
+
     return log_df[mask]
 
 
-def _ip_in_network(ip_str, network):
-    """Check if IP is in network"""
-    try:
-        ip = ipaddress.ip_address(ip_str)
-        return ip in network
-    except:
-        return False
+def _parse_ip_column(ip_series):
+    """
+    Parse an IP column once for CIDR matching.
+
+    Distinct dotted-quad values are converted to uint32 with vectorized string
+    ops; any other distinct value (IPv6, invalid) goes through ipaddress once.
+
+    Args:
+        ip_series: Series of IP address strings
+
+    Returns:
+        Tuple of (codes, ipv4_ints, ipv4_valid, ipv6_addresses): codes maps
+        each row to its distinct value, ipv4_ints/ipv4_valid are the per-row
+        uint32 values, ipv6_addresses holds the parsed IPv6 address per
+        distinct value (None otherwise) indexed by codes
+    """
+    codes, uniques = pd.factorize(ip_series)
+    n_uniques = len(uniques)
+
+    # Missing values (code -1) point at a trailing invalid entry
+    codes = np.where(codes >= 0, codes, n_uniques)
+
+    unique_ints = np.zeros(n_uniques + 1, dtype=np.uint32)
+    unique_valid = np.zeros(n_uniques + 1, dtype=bool)
+    ipv6_addresses = [None] * (n_uniques + 1)
+
+    values = pd.Series(uniques, dtype=object)
+    is_ipv4 = values.astype(str).str.fullmatch(_IPV4_RE).to_numpy(dtype=bool)
+    if is_ipv4.any():
+        octets = values[is_ipv4].str.split('.', expand=True).astype(np.uint32).to_numpy()
+        unique_ints[:n_uniques][is_ipv4] = (octets[:, 0] << 24) | (octets[:, 1] << 16) | (octets[:, 2] << 8) | octets[:, 3]
+        unique_valid[:n_uniques] = is_ipv4
+
+    for i in np.flatnonzero(~is_ipv4):
+        try:
+            address = ipaddress.ip_address(values.iat[i])
+        except (ValueError, TypeError):
+            continue
+        if address.version == 4:
+            unique_ints[i] = int(address)
+            unique_valid[i] = True
+        else:
+            ipv6_addresses[i] = address
+
+    return codes, unique_ints[codes], unique_valid[codes], ipv6_addresses
 
 
 def _filter_by_urls(log_df, params, format_info):
@@ -416,18 +602,8 @@ def _filter_by_urls(log_df, params, format_info):
     if not urls_file:
         return log_df
     
-    # Load URLs from file
-    with open(urls_file, 'r', encoding='utf-8') as f:
-        if urls_file.endswith('.json'):
-            urls_data = json.load(f)
-            if isinstance(urls_data, list):
-                urls = urls_data
-            elif isinstance(urls_data, dict) and 'urls' in urls_data:
-                urls = urls_data['urls']
-            else:
-                urls = []
-        else:
-            urls = [line.strip() for line in f if line.strip()]
+    # Load URLs from file (cached, filterByCondition calls this once per chunk)
+    url_set = _load_url_set(urls_file)
     
     url_field = format_info['fieldMap'].get('url', 'request_url')
     
@@ -436,7 +612,6 @@ def _filter_by_urls(log_df, params, format_info):
         return log_df
     
     # Filter by URL set
-    url_set = set(urls)
     return log_df[log_df[url_field].isin(url_set)]
 
 
@@ -448,17 +623,7 @@ def _filter_by_uri_patterns(log_df, params, format_info):
         return log_df
     
     # Load URI patterns from file
-    with open(uris_file, 'r', encoding='utf-8') as f:
-        if uris_file.endswith('.json'):
-            patterns_data = json.load(f)
-            if isinstance(patterns_data, list):
-                patterns = patterns_data
-            elif isinstance(patterns_data, dict) and 'patterns' in patterns_data:
-                patterns = patterns_data['patterns']
-            else:
-                patterns = []
-        else:
-            patterns = [line.strip() for line in f if line.strip()]
+    patterns = _load_list_file(uris_file, 'patterns')
     
     url_field = format_info['fieldMap'].get('url', 'request_url')
     
@@ -466,24 +631,128 @@ def _filter_by_uri_patterns(log_df, params, format_info):
         logger.warning(f"URL field '{url_field}' not found in log data")
         return log_df
     
-    # Match URLs against patterns
-    mask = pd.Series([False] * len(log_df), index=log_df.index)
-    
+    if not patterns:
+        return log_df.iloc[0:0]
+
+    # Patterns without regex syntax are plain prefixes: look up url[:length] in one
+    # set per distinct prefix length, so their number does not matter. The others
+    # are combined into one regex (replace * with .*) where possible
+    literal_prefixes = defaultdict(set)
+    regex_patterns = []
     for pattern in patterns:
-        # Convert URI pattern to regex (replace * with .*)
-        regex_pattern = pattern.replace('*', '.*')
-        mask |= log_df[url_field].str.match(regex_pattern, na=False)
-    
+        if _REGEX_METACHARACTERS.isdisjoint(pattern):
+            literal_prefixes[len(pattern)].add(pattern)
+        else:
+            regex_patterns.append(pattern.replace('*', '.*'))
+    regex_matchers = [regex.match for regex in _compile_uri_patterns(regex_patterns)]
+
+    def matches(url):
+        for length, prefixes in literal_prefixes.items():
+            if url[:length] in prefixes:
+                return True
+        return any(match(url) is not None for match in regex_matchers)
+
+    # Match each distinct URL once and map the result back to the rows
+    codes, uniques = pd.factorize(log_df[url_field])
+    unique_matches = np.fromiter(
+        (isinstance(url, str) and matches(url) for url in uniques),
+        dtype=bool,
+        count=len(uniques)
+    )
+    # Missing URLs (code -1) pick the trailing False
+    mask = np.append(unique_matches, False)[codes]
+
     return log_df[mask]
 
 
+def _compile_uri_patterns(sources):
+    """
+    Compile URI regex patterns for matching with any-of semantics.
+
+    Args:
+        sources: Regex sources
+
+    Returns:
+        List of compiled regexes: one combined alternation, or one per pattern
+        when they cannot be combined (backreferences would point at the wrong
+        group, inline global flags or clashing group names do not compile)
+    """
+    compiled = [re.compile(source) for source in sources]
+    if len(compiled) > 1 and \
+            not any(regex.flags & ~re.UNICODE for regex in compiled) and \
+            not any(re.search(r'\\[1-9]|\(\?P=', source) for source in sources):
+        try:
+            return [re.compile('|'.join(f'(?:{source})' for source in sources))]
+        except re.error:
+            pass
+    return compiled
+
+
+def _load_list_file(file_path, list_key):
+    """
+    Load a URL/pattern list file.
+
+    JSON files hold a list or an object with the list under list_key; other
+    files hold one entry per line (blank lines skipped). Results are cached
+    per file version, since filterByCondition filters one chunk at a time.
+
+    Args:
+        file_path: Path to list file
+        list_key: Key of the list in a JSON object ('urls' or 'patterns')
+
+    Returns:
+        tuple of entries
+    """
+    stat = os.stat(file_path)
+    return _load_list_file_cached(file_path, list_key, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=16)
+def _load_list_file_cached(file_path, list_key, mtime_ns, size):
+    """Read a list file once per (path, mtime, size), see _load_list_file"""
+    # One bulk read and split instead of a Python-level readline per entry
+    with open(file_path, 'rb') as f:
+        data = f.read()
+
+    if file_path.endswith('.json'):
+        list_data = _json_loads(data)
+        if isinstance(list_data, list):
+            return tuple(list_data)
+        if isinstance(list_data, dict) and list_key in list_data:
+            return tuple(list_data[list_key])
+        return ()
+
+    # bytes.splitlines() only splits on \n, \r and \r\n, like text-mode line iteration
+    entries = (line.decode('utf-8').strip() for line in data.splitlines())
+    return tuple(entry for entry in entries if entry)
+
+
+@lru_cache(maxsize=16)
+def _load_url_set_cached(file_path, mtime_ns, size):
+    """Build the URL lookup set once per list file version, see _load_url_set"""
+    return frozenset(_load_list_file_cached(file_path, 'urls', mtime_ns, size))
+
+
+def _load_url_set(file_path):
+    """
+    Load a URL list file (see _load_list_file) as a frozenset for isin lookups.
+
+    Args:
+        file_path: Path to URL list file
+
+    Returns:
+        frozenset of URLs
+    """
+    stat = os.stat(file_path)
+    return _load_url_set_cached(file_path, stat.st_mtime_ns, stat.st_size)
+
+
 def _format_size(size_bytes):
-    """Format file size"""
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.1f}{unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f}TB"
+    """Format file size (unit picked from the bit length: each unit is 2**10 of the previous)"""
+    if size_bytes <= 0:
+        return f"{size_bytes:.1f}B"
+    unit_index = min(max(0, (int(size_bytes).bit_length() - 1) // 10), len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * unit_index)):.1f}{_SIZE_UNITS[unit_index]}"
 
 
 # ============================================================================
@@ -548,14 +817,8 @@ def extractUriPatterns(
     timestamp = datetime.now().strftime('%y%m%d_%H%M%S')
     
     if extractionType == 'urls':
-        # Extract unique URLs
-        if include_params:
-            urls = log_df[url_field].tolist()
-        else:
-            # Remove query parameters
-            urls = log_df[url_field].apply(lambda x: x.split('?')[0] if x else x).tolist()
-        
-        url_counts = Counter(urls)
+        # Extract unique URLs (query parameters removed unless includeParams)
+        url_counts = _count_urls(log_df[url_field], include_params)
         
         # Filter by count range
         filtered_urls = {url: count for url, count in url_counts.items() 
@@ -570,8 +833,7 @@ def extractUriPatterns(
             'totalRequests': total_requests
         }
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(result_data, f, indent=2, ensure_ascii=False)
+        _write_json(result_data, output_file)
         
         # Return absolute path
         return {
@@ -582,12 +844,8 @@ def extractUriPatterns(
     
     elif extractionType == 'patterns':
         # Extract URI patterns (replace path variables with *)
-        if not include_params:
-            urls = log_df[url_field].apply(lambda x: x.split('?')[0] if x else x).tolist()
-        else:
-            urls = log_df[url_field].tolist()
-        
-        patterns = _extract_uri_patterns(urls, max_patterns, min_count, max_count)
+        url_counts = _count_urls(log_df[url_field], include_params)
+        patterns = _extract_uri_patterns(url_counts, max_patterns, min_count, max_count)
         pattern_list = list(patterns.keys())
         
         # Generate pattern rules from patterns
@@ -635,31 +893,123 @@ def extractUriPatterns(
         raise ValueError(f"Unknown extraction type: {extractionType}")
 
 
-def _extract_uri_patterns(urls, max_patterns, min_count, max_count):
-    """Extract URI patterns by replacing path variables with *"""
-    # Count exact URLs first
-    url_counts = Counter(urls)
-    
-    # Group similar URLs by replacing numbers with *
-    pattern_groups = defaultdict(list)
-    
-    for url, count in url_counts.items():
-        # Replace path segments that look like IDs/numbers with *
-        pattern = _generalize_url(url)
-        pattern_groups[pattern].append((url, count))
-    
-    # Calculate pattern counts
-    pattern_counts = {}
-    for pattern, url_list in pattern_groups.items():
-        total_count = sum(count for _, count in url_list)
-        if min_count <= total_count <= max_count:
-            pattern_counts[pattern] = total_count
-    
-    # Sort by count and limit
-    sorted_patterns = sorted(pattern_counts.items(), key=lambda x: x[1], reverse=True)
-    limited_patterns = dict(sorted_patterns[:max_patterns])
-    
-    return limited_patterns
+def _count_urls(urls, include_params):
+    """
+    Count URLs in one pass over the column values.
+
+    Rows are counted per distinct raw URL with pandas' hash table; the query
+    string is then cut only once per distinct URL, not once per row.
+
+    Args:
+        urls: Series of URLs (missing values are skipped)
+        include_params: Keep query strings; otherwise URLs are cut at '?'
+
+    Returns:
+        Counter of URL -> number of requests, in order of first appearance
+    """
+    codes, uniques = pd.factorize(urls)
+    counts = np.bincount(codes[codes >= 0], minlength=len(uniques)).tolist()
+
+    url_counts = Counter()
+    for url, count in zip(uniques.tolist(), counts):
+        if isinstance(url, str):
+            url_counts[url if include_params else url.partition('?')[0]] += count
+    return url_counts
+
+
+def _extract_uri_patterns(url_counts, max_patterns, min_count, max_count):
+    """Extract URI patterns by replacing path variables with *
+
+    Args:
+        url_counts: Mapping of URL -> request count (see _count_urls)
+        max_patterns: Maximum number of patterns to return
+        min_count: Minimum request count per pattern
+        max_count: Maximum request count per pattern
+
+    Returns:
+        dict: {pattern: request count}, most frequent first
+    """
+    # Sum request counts per pattern (path segments that look like IDs become *)
+    pattern_counts = defaultdict(int)
+    patterns = _generalize_urls(url_counts.keys())
+    for pattern, count in zip(patterns, url_counts.values()):
+        pattern_counts[pattern] += count
+
+    filtered = {
+        pattern: count for pattern, count in pattern_counts.items()
+        if min_count <= count <= max_count
+    }
+
+    # Top max_patterns by count (same order as a stable descending sort)
+    return dict(heapq.nlargest(max_patterns, filtered.items(), key=lambda item: item[1]))
+
+
+class CompiledPatternRules(list):
+    """
+    List of compiled pattern rules with a combined matcher.
+
+    Behaves like the plain list of {'pattern', 'replacement'} dicts, but
+    find_replacement() matches all rules with one alternation regex
+    ((?P<_r0>...)|(?P<_r1>...)|...), so a URL is scanned by a single match
+    call instead of one per rule. Alternatives are tried in order, so the
+    first matching rule wins, as with a loop over the rules.
+    """
+
+    def __init__(self, rules):
+        super().__init__(rules)
+        self._combined = _combine_rule_patterns(self)
+        self._replacements = {f'_r{i}': rule['replacement'] for i, rule in enumerate(self)}
+
+    def find_replacement(self, url):
+        """
+        Find the replacement of the first rule matching a URL.
+
+        Args:
+            url: URL string
+
+        Returns:
+            Replacement pattern, or None if no rule matches
+        """
+        if self._combined is None:
+            for rule in self:
+                if rule['pattern'].match(url):
+                    return rule['replacement']
+            return None
+
+        match = self._combined.match(url)
+        return self._replacements[match.lastgroup] if match else None
+
+
+def _combine_rule_patterns(rules):
+    """
+    Join compiled rule patterns into one alternation regex.
+
+    Args:
+        rules: List of rules with a compiled 'pattern'
+
+    Returns:
+        Compiled combined regex, or None if the rules cannot be combined
+        (backreferences would point at the wrong group, inline global flags
+        or clashing group names do not compile); callers then try each rule
+    """
+    sources = [rule['pattern'].pattern for rule in rules]
+    if any(rule['pattern'].flags & ~re.UNICODE for rule in rules) or \
+            any(re.search(r'\\[1-9]|\(\?P=', source) for source in sources):
+        return None
+    try:
+        return re.compile('|'.join(f'(?P<_r{i}>{source})' for i, source in enumerate(sources)))
+    except re.error:
+        return None
+
+
+def _find_rule_replacement(pattern_rules, url):
+    """Return the replacement of the first pattern rule matching url, or None"""
+    if isinstance(pattern_rules, CompiledPatternRules):
+        return pattern_rules.find_replacement(url)
+    for rule in pattern_rules:
+        if rule['pattern'].match(url):
+            return rule['replacement']
+    return None
 
 
 # Global pattern rules cache (loaded from pattern file)
@@ -706,7 +1056,9 @@ class PatternRulesManager:
                             'replacement': rule['replacement']
                         })
                 if rules:
+                    rules = CompiledPatternRules(rules)
                     self._cache[patterns_file] = rules
+                    _generalize_url.cache_clear()
                     logger.info(f"Loaded {len(rules)} pattern rules from {patterns_file}")
                     return rules
 
@@ -727,7 +1079,9 @@ class PatternRulesManager:
                                 'replacement': pattern
                             })
                     if rules:
+                        rules = CompiledPatternRules(rules)
                         self._cache[patterns_file] = rules
+                        _generalize_url.cache_clear()
                         logger.info(f"Loaded {len(rules)} patterns from {patterns_file}")
                         return rules
 
@@ -738,7 +1092,7 @@ class PatternRulesManager:
 
     def clear_cache(self, patterns_file: Optional[str] = None):
         """
-        Clear cached pattern rules.
+        Clear cached pattern rules (and URLs generalized with them).
 
         Args:
             patterns_file: Specific file to clear, or None to clear all
@@ -747,6 +1101,7 @@ class PatternRulesManager:
             self._cache.pop(patterns_file, None)
         else:
             self._cache.clear()
+        _generalize_url.cache_clear()
 
     def get_cached_files(self) -> List[str]:
         """Get list of cached pattern files"""
@@ -767,10 +1122,16 @@ def _load_pattern_rules(patterns_file: Optional[str] = None) -> Optional[List[Di
     return _pattern_manager.load_rules(patterns_file)
 
 
+@lru_cache(maxsize=1 << 16)
 def _generalize_url(url, patterns_file=None):
     """
     Generalize URL by replacing path variables with * or using pattern rules from file.
 
+    Results are cached per (url, patterns_file), so URLs seen again (e.g. hot
+    endpoints across chunks or repeated runs) are generalized only once. The
+    cache keeps the 65536 most recent URLs, since it lives as long as the MCP
+    server, and is cleared whenever PatternRulesManager loads or drops rules.
+
     Static files are categorized by extension:
     - .css → *.css
     - .js, .jsx, .ts, .tsx, .mjs → *.js
@@ -798,9 +1159,9 @@ def _generalize_url(url, patterns_file=None):
 
     # Try pattern rules first
     if pattern_rules:
-        for rule in pattern_rules:
-            if rule['pattern'].match(url):
-                return rule['replacement']
+        replacement = _find_rule_replacement(pattern_rules, url)
+        if replacement is not None:
+            return replacement
 
     # Fallback to default generalization
     # Split into path and query
@@ -842,6 +1203,59 @@ def _generalize_url(url, patterns_file=None):
     return result
 
 
+def _generalize_urls(urls):
+    """
+    Generalize many URLs with the default rules (no pattern file).
+
+    Gives the same result as [_generalize_url(url) for url in urls], but
+    each distinct path segment is classified only once per call. Segments
+    such as 'api' or 'users' repeat across nearly every URL, so most of the
+    work becomes a dict lookup instead of _is_id_like/_categorize_static_file.
+
+    Args:
+        urls: Iterable of URL strings
+
+    Returns:
+        List of generalized URL patterns, in input order
+    """
+    inner_segments = {}  # segment -> '*' or segment
+    last_segments = {}   # last segment -> static category, '*' or segment
+    results = []
+
+    for url in urls:
+        if not url:
+            results.append(url)
+            continue
+
+        path, has_query, _ = url.partition('?')
+        segments = path.split('/')
+        last = segments.pop()
+
+        generalized = []
+        for segment in segments:
+            pattern = inner_segments.get(segment)
+            if pattern is None:
+                pattern = '*' if segment and _is_id_like(segment) else segment
+                inner_segments[segment] = pattern
+            generalized.append(pattern)
+
+        pattern = last_segments.get(last)
+        if pattern is None:
+            if last:
+                pattern = _categorize_static_file(last) or ('*' if _is_id_like(last) else last)
+            else:
+                pattern = last
+            last_segments[last] = pattern
+        generalized.append(pattern)
+
+        result = '/'.join(generalized)
+        if has_query:
+            result += '?*'
+        results.append(result)
+
+    return results
+
+
 def _generalize_url_with_rules(url, pattern_rules=None):
     """
     Generalize URL using pre-loaded pattern rules.
@@ -867,48 +1281,12 @@ def _generalize_url_with_rules(url, pattern_rules=None):
 
     # Try pattern rules first
     if pattern_rules:
-        for rule in pattern_rules:
-            if rule['pattern'].match(url):
-                return rule['replacement']
+        replacement = _find_rule_replacement(pattern_rules, url)
+        if replacement is not None:
+            return replacement
 
-    # Fallback to default generalization
-    # Split into path and query
-    parts = url.split('?')
-    path = parts[0]
-
-    # Split path into segments
-    segments = path.split('/')
-
-    # Generalize each segment
-    generalized = []
-    for i, segment in enumerate(segments):
-        if not segment:
-            generalized.append(segment)
-            continue
-
-        # Check if this is the last segment (potential filename)
-        is_last_segment = (i == len(segments) - 1)
-
-        # Check if segment is a static file
-        if is_last_segment:
-            static_category = _categorize_static_file(segment)
-            if static_category:
-                generalized.append(static_category)
-                continue
-
-        # Check if segment looks like an ID
-        if _is_id_like(segment):
-            generalized.append('*')
-        else:
-            generalized.append(segment)
-
-    result = '/'.join(generalized)
-
-    # Append query placeholder if present
-    if len(parts) > 1:
-        result += '?*'
-
-    return result
+    # Fallback to default generalization (cached)
+    return _generalize_url(url)
 
 
 def _categorize_static_file(filename: str) -> Optional[str]:
@@ -1018,16 +1396,18 @@ def _is_id_like(segment):
     if segment.isdigit():
         return True
 
-    # UUID pattern
-    if re.match(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', segment, re.I):
-        return True
+    length = len(segment)
 
-    # Long hex strings
-    if re.match(r'^[0-9a-f]{16,}$', segment, re.I):
+    # UUID pattern (8-4-4-4-12 hex digits) and long hex strings; str methods
+    # run in C, which is cheaper than a regex match per segment
+    if length == 36 and segment.count('-') == 4 and segment[8] == segment[13] == segment[18] == segment[23] == '-':
+        if not segment.replace('-', '').lstrip(_HEX_DIGITS):
+            return True
+    elif length >= 16 and not segment.lstrip(_HEX_DIGITS):
         return True
 
     # Mixed alphanumeric that's mostly numbers
-    if len(segment) > 8 and sum(c.isdigit() for c in segment) / len(segment) > 0.7:
+    if length > 8 and sum(map(str.isdigit, segment)) / length > 0.7:
         return True
 
     return False
@@ -1067,62 +1447,29 @@ def filterUriPatterns(urisFile: str, params: str = '') -> Dict[str, Any]:
     counts = data.get('counts', {})
     original_count = len(patterns)
     
-    # Apply filters
-    filtered_patterns = []
-    
-    for pattern in patterns:
-        # Check exclude patterns
-        if exclude_patterns and exclude_patterns != ['']:
-            excluded = False
-            for ex_pattern in exclude_patterns:
-                ex_pattern = ex_pattern.strip()
-                if not ex_pattern:
-                    continue
-                
-                if use_regex:
-                    if re.search(ex_pattern, pattern, 0 if case_sensitive else re.IGNORECASE):
-                        excluded = True
-                        break
-                else:
-                    if case_sensitive:
-                        if ex_pattern in pattern:
-                            excluded = True
-                            break
-                    else:
-                        if ex_pattern.lower() in pattern.lower():
-                            excluded = True
-                            break
-            
-            if excluded:
-                continue
-        
-        # Check include patterns
-        if include_patterns and include_patterns != ['']:
-            included = False
-            for in_pattern in include_patterns:
-                in_pattern = in_pattern.strip()
-                if not in_pattern:
-                    continue
-                
-                if use_regex:
-                    if re.search(in_pattern, pattern, 0 if case_sensitive else re.IGNORECASE):
-                        included = True
-                        break
-                else:
-                    if case_sensitive:
-                        if in_pattern in pattern:
-                            included = True
-                            break
-                    else:
-                        if in_pattern.lower() in pattern.lower():
-                            included = True
-                            break
-            
-            if not included:
-                continue
-        
-        filtered_patterns.append(pattern)
-    
+    # Prepare filters once: regexes are compiled and literal needles lowercased
+    # up front instead of for every (filter, URI) pair
+    check_excludes = bool(exclude_patterns) and exclude_patterns != ['']
+    check_includes = bool(include_patterns) and include_patterns != ['']
+    exclude_filters = _prepare_uri_filters(exclude_patterns, case_sensitive, use_regex)
+    include_filters = _prepare_uri_filters(include_patterns, case_sensitive, use_regex)
+
+    # Literal case-insensitive filters are matched against the lowercased URI
+    # (lowercased once per URI, shared by exclude and include checks)
+    lower_haystack = not case_sensitive and not use_regex
+    haystacks = [pattern.lower() for pattern in patterns] if lower_haystack else patterns
+
+    # Apply filters as masks over all URIs: excludes first, then includes on the rest
+    filtered_patterns = patterns
+    if check_excludes:
+        excluded = _uri_filter_mask(haystacks, exclude_filters)
+        filtered_patterns = [pattern for pattern, skip in zip(patterns, excluded) if not skip]
+        if check_includes:
+            haystacks = [haystack for haystack, skip in zip(haystacks, excluded) if not skip]
+    if check_includes:
+        included = _uri_filter_mask(haystacks, include_filters)
+        filtered_patterns = [pattern for pattern, keep in zip(filtered_patterns, included) if keep]
+
     # Generate output file
     input_path = Path(urisFile)
     timestamp = datetime.now().strftime('%y%m%d_%H%M%S')
@@ -1136,8 +1483,7 @@ def filterUriPatterns(urisFile: str, params: str = '') -> Dict[str, Any]:
         'totalRequests': data.get('totalRequests', 0)
     }
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(result_data, f, indent=2, ensure_ascii=False)
+    _write_json(result_data, output_file)
     
     return {
         'filePath': str(output_file),
@@ -1146,154 +1492,209 @@ def filterUriPatterns(urisFile: str, params: str = '') -> Dict[str, Any]:
     }
 
 
-# ============================================================================
-# Parallel Processing Helper Functions
-# ============================================================================
-
-def _calculate_url_stats_chunk(url_group_data, status_field, rt_field, processing_time_fields=None):
+def _prepare_uri_filters(filter_patterns, case_sensitive, use_regex):
     """
-    Calculate statistics for a chunk of URL groups in parallel worker.
+    Prepare include/exclude filters of filterUriPatterns for repeated matching.
+
+    All filters are combined into one alternation regex ((?:f1)|(?:f2)|...),
+    so a URI is scanned once instead of once per filter. Literal filters are
+    escaped and, unless case_sensitive, lowercased: they are matched against
+    the lowercased URI, exactly like `needle.lower() in uri.lower()`. A few
+    literal filters are kept as strings, since substring checks are faster
+    than a regex scan for up to _MAX_SUBSTRING_NEEDLES needles.
 
     Args:
-        url_group_data: List of (url, group_df) tuples
-        status_field: Status code field name
-        rt_field: Response time field name (legacy, kept for backward compatibility)
-        processing_time_fields: List of processing time field names to analyze
+        filter_patterns: Filter strings (blank entries are skipped)
+        case_sensitive: Match case-sensitively
+        use_regex: Filters are regular expressions instead of substrings
 
     Returns:
-        List of URL statistics dicts
+        List of literal needles (str), or of compiled regexes: one combined
+        regex, or one per filter when regex filters cannot be combined
+        (backreferences, inline flags); empty if there are no filters
     """
-    url_stats = []
-
-    for url, group in url_group_data:
-        stat = {
-            'url': url,
-            'count': len(group)
-        }
+    filters = [p.strip() for p in filter_patterns if p.strip()]
+    if not filters:
+        return []
 
-        # Status code distribution
-        if status_field in group.columns:
-            status_counts = group[status_field].value_counts().to_dict()
-            stat['statusCodes'] = {str(k): int(v) for k, v in status_counts.items() if pd.notna(k)}
-
-        # Response time statistics (legacy field)
-        if rt_field and rt_field in group.columns:
-            rt_data = group[rt_field].dropna()
-            if not rt_data.empty:
-                stat['responseTime'] = {
-                    'avg': float(rt_data.mean()),
-                    'sum': float(rt_data.sum()),
-                    'median': float(rt_data.median()),
-                    'std': float(rt_data.std()),
-                    'min': float(rt_data.min()),
-                    'max': float(rt_data.max()),
-                    'p90': float(rt_data.quantile(0.9)),
-                    'p95': float(rt_data.quantile(0.95)),
-                    'p99': float(rt_data.quantile(0.99))
-                }
-
-        # Multiple processing time fields statistics
-        if processing_time_fields:
-            for field_name in processing_time_fields:
-                if field_name in group.columns:
-                    field_data = pd.to_numeric(group[field_name], errors='coerce').dropna()
-                    if not field_data.empty:
-                        # Use field name as key (e.g., 'request_processing_time', 'target_processing_time')
-                        stat[field_name] = {
-                            'avg': float(field_data.mean()),
-                            'sum': float(field_data.sum()),
-                            'median': float(field_data.median()),
-                            'std': float(field_data.std()),
-                            'min': float(field_data.min()),
-                            'max': float(field_data.max()),
-                            'p90': float(field_data.quantile(0.9)),
-                            'p95': float(field_data.quantile(0.95)),
-                            'p99': float(field_data.quantile(0.99))
-                        }
-
-        url_stats.append(stat)
+    if not use_regex:
+        needles = filters if case_sensitive else [p.lower() for p in filters]
+        if len(needles) <= _MAX_SUBSTRING_NEEDLES:
+            return needles
+        return [re.compile('|'.join(re.escape(needle) for needle in needles))]
 
-    return url_stats
+    flags = 0 if case_sensitive else re.IGNORECASE
+    compiled = [re.compile(p, flags) for p in filters]
+    if len(compiled) > 1 and not any(re.search(r'\\[1-9]|\(\?P=', p) for p in filters):
+        try:
+            return [re.compile('|'.join(f'(?:{p})' for p in filters), flags)]
+        except re.error:
+            pass
+    return compiled
 
 
-def _calculate_time_stats_chunk(time_group_data, status_field, rt_field):
+def _uri_filter_mask(haystacks, filters):
     """
-    Calculate statistics for a chunk of time groups in parallel worker.
+    Match URI patterns against filters prepared by _prepare_uri_filters.
+
+    Each needle or regex is applied in one pass over all URIs (a list
+    comprehension per filter), instead of dispatching on the filters per URI.
 
     Args:
-        time_group_data: List of (time_bucket, group_df) tuples
-        status_field: Status code field name
-        rt_field: Response time field name
+        haystacks: URI patterns, lowercased for case-insensitive literal filters
+        filters: Literal needles or compiled regexes from _prepare_uri_filters
 
     Returns:
-        List of time statistics dicts
+        List of bools aligned with haystacks: True if any filter matches
     """
-    time_stats = []
+    mask = [False] * len(haystacks)
+    for uri_filter in filters:
+        if isinstance(uri_filter, str):
+            mask = [matched or uri_filter in haystack for matched, haystack in zip(mask, haystacks)]
+        else:
+            search = uri_filter.search
+            mask = [matched or search(haystack) is not None for matched, haystack in zip(mask, haystacks)]
+    return mask
 
-    for time_bucket, group in time_group_data:
-        stat = {
-            'time': time_bucket.isoformat() if pd.notna(time_bucket) else None,
-            'count': len(group)
-        }
 
-        # Status code distribution
-        if status_field in group.columns:
-            error_count = (group[status_field] >= 400).sum()
-            stat['errorCount'] = int(error_count)
-            stat['errorRate'] = float(error_count / len(group)) if len(group) > 0 else 0.0
+# ============================================================================
+# Statistics Helper Functions
+# ============================================================================
 
-        # Response time statistics
-        if rt_field in group.columns:
-            rt_data = group[rt_field].dropna()
-            if not rt_data.empty:
-                stat['avgResponseTime'] = float(rt_data.mean())
-                stat['p95ResponseTime'] = float(rt_data.quantile(0.95))
+def _describe_values(values, percentiles=(90, 95, 99)):
+    """
+    Describe non-null numeric values from one array pass.
 
-        time_stats.append(stat)
+    All percentiles come from a single np.percentile call (linear
+    interpolation, like Series.quantile) instead of one quantile call each.
 
-    return time_stats
+    Args:
+        values: Non-empty Series or array of numeric values without nulls
+        percentiles: Percentiles to include as 'p<N>' keys
+
+    Returns:
+        dict: {'avg', 'sum', 'median', 'std', 'min', 'max', 'p<N>'...} as floats
+        (std is the sample standard deviation, NaN for a single value)
+    """
+    arr = np.asarray(values, dtype=np.float64)
+    stats = {
+        'avg': float(arr.mean()),
+        'sum': float(arr.sum()),
+        'median': float(np.median(arr)),
+        'std': float(arr.std(ddof=1)) if len(arr) > 1 else float('nan'),
+        'min': float(arr.min()),
+        'max': float(arr.max())
+    }
+    for pct, value in zip(percentiles, np.percentile(arr, percentiles).tolist()):
+        stats[f'p{pct}'] = value
+    return stats
 
 
-def _calculate_ip_stats_chunk(ip_group_data, status_field, rt_field):
+def _grouped_value_counts(log_df, group_field, value_field):
     """
-    Calculate statistics for a chunk of IP groups in parallel worker.
+    Count values per group in one pass, like group[value_field].value_counts().
 
     Args:
-        ip_group_data: List of (ip, group_df) tuples
-        status_field: Status code field name
-        rt_field: Response time field name
+        log_df: DataFrame with log data
+        group_field: Column to group by
+        value_field: Column whose values are counted (missing values skipped)
 
     Returns:
-        List of IP statistics dicts
+        dict: {group: {str(value): count}}, most frequent value first within each group
     """
-    ip_stats = []
+    # Pairs in first-occurrence order, so the stable sort breaks ties like value_counts
+    sizes = log_df.groupby([group_field, value_field], sort=False).size()
+    sizes = sizes.sort_values(ascending=False, kind='stable')
 
-    for ip, group in ip_group_data:
-        stat = {
-            'ip': ip,
-            'count': len(group)
-        }
+    # Convert each distinct group/value label once, not once per (group, value) pair
+    groups = sizes.index.levels[0].tolist()
+    values = [str(value) for value in sizes.index.levels[1].tolist()]
+    group_codes, value_codes = sizes.index.codes
 
-        # Status code distribution
-        if status_field in group.columns:
-            error_count = (group[status_field] >= 400).sum()
-            stat['errorCount'] = int(error_count)
+    counts = {}
+    for group_code, value_code, count in zip(group_codes.tolist(), value_codes.tolist(), sizes.tolist()):
+        counts.setdefault(groups[group_code], {})[values[value_code]] = count
+    return counts
+
+
+def _grouped_numeric_stats(values, keys):
+    """
+    Statistics of a numeric column per group, computed in one groupby pass.
 
-        # Response time average
-        if rt_field in group.columns:
-            rt_data = group[rt_field].dropna()
-            if not rt_data.empty:
-                stat['avgResponseTime'] = float(rt_data.mean())
+    Args:
+        values: Numeric Series (missing values are ignored)
+        keys: Series of group keys aligned with values
 
-        ip_stats.append(stat)
+    Returns:
+        dict: {group: {'avg', 'sum', 'median', 'std', 'min', 'max', 'p90', 'p95', 'p99'}}
+        for groups with at least one value
+    """
+    groups = values.groupby(keys)
+    agg = groups.agg(['count', 'mean', 'sum', 'median', 'std', 'min', 'max'])
+    quantiles = groups.quantile([0.9, 0.95, 0.99]).unstack()
+    agg['p90'], agg['p95'], agg['p99'] = quantiles[0.9], quantiles[0.95], quantiles[0.99]
+    agg = agg[agg['count'] > 0]
 
-    return ip_stats
+    metrics = ['mean', 'sum', 'median', 'std', 'min', 'max', 'p90', 'p95', 'p99']
+    names = ['avg', 'sum', 'median', 'std', 'min', 'max', 'p90', 'p95', 'p99']
+    rows = zip(*(agg[metric].astype(float).tolist() for metric in metrics))
+    return {key: dict(zip(names, row)) for key, row in zip(agg.index, rows)}
 
 
 # ============================================================================
 # MCP Tool: calculateStats
 # ============================================================================
 
+# Results of recent calculateStats calls, keyed by _stats_cache_key (oldest evicted first)
+STATS_CACHE_SIZE = 16
+_stats_results: Dict[tuple, Tuple[Dict[str, Any], tuple]] = {}
+
+
+def _file_version(file_path):
+    """Identify a file version by (absolute path, mtime, size)"""
+    stat = os.stat(file_path)
+    return (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+
+
+def _stats_cache_key(input_file, log_format_file, params):
+    """
+    Key for reusing calculateStats results.
+
+    Statistics only depend on the log file, the log format, the config.yaml used
+    for parsing and the params, so any change to these files gives a new key.
+
+    Args:
+        input_file: Input log file path
+        log_format_file: Log format JSON file path
+        params: calculateStats params string
+
+    Returns:
+        tuple: Hashable cache key
+    """
+    from data_parser import _load_config_near_input
+    _, config_path = _load_config_near_input(input_file)
+    config_version = _file_version(config_path) if config_path else None
+    return (_file_version(input_file), _file_version(log_format_file), config_version, params)
+
+
+def _get_cached_stats(cache_key):
+    """Return a previous calculateStats result if its stats file is still unchanged"""
+    cached = _stats_results.get(cache_key)
+    if cached is None:
+        return None
+
+    result, stats_file_version = cached
+    try:
+        if _file_version(result['filePath']) == stats_file_version:
+            return dict(result)
+    except OSError:
+        pass
+
+    # Stats file was deleted or modified: calculate again
+    del _stats_results[cache_key]
+    return None
+
+
 def calculateStats(
     inputFile: str,
     logFormatFile: str,
@@ -1315,9 +1716,9 @@ def calculateStats(
             - sortBy: Field name to sort URL stats by (e.g., 'request_processing_time', 'target_processing_time', 'count')
             - sortMetric: Metric to use for sorting ('avg', 'sum', 'median', 'p95', 'p99') - default: 'avg'
             - topN: Return only top N URLs (e.g., '20', '50')
-        use_multiprocessing (bool, optional): Enable parallel processing.
-            If None, reads from config.yaml (default: None)
-        num_workers (int, optional): Number of workers for parallel processing.
+        use_multiprocessing (bool, optional): Calculate the statistics types concurrently
+            in a thread pool. If None, reads from config.yaml (default: None)
+        num_workers (int, optional): Maximum thread pool size.
             If None, reads from config.yaml or auto-detects (default: None)
 
     Returns:
@@ -1350,7 +1751,7 @@ def calculateStats(
         num_workers = mp_config['num_workers']  # Can still be None (auto-detect)
 
     logger.info(f"calculateStats: use_multiprocessing={use_multiprocessing}, "
-               f"num_workers={num_workers} (from config)")
+               f"num_workers={num_workers} (from config; thread pool over the statistics types)")
 
     # Validate inputs
     if not inputFile or not os.path.exists(inputFile):
@@ -1358,6 +1759,13 @@ def calculateStats(
     if not logFormatFile or not os.path.exists(logFormatFile):
         raise ValueError(f"Log format file not found: {logFormatFile}")
 
+    # Reuse the stats file of an earlier call on the same files and params
+    cache_key = _stats_cache_key(inputFile, logFormatFile, params)
+    cached_result = _get_cached_stats(cache_key)
+    if cached_result is not None:
+        logger.info(f"Reusing statistics from {cached_result['filePath']} (input unchanged)")
+        return cached_result
+
     # Parse parameters
     param_dict = _parse_params(params)
     stats_types = param_dict.get('statsType', 'all').split(',')
@@ -1395,46 +1803,54 @@ def calculateStats(
     rt_field = format_info['fieldMap'].get('responseTime', 'target_processing_time')
     ip_field = format_info['fieldMap'].get('clientIp', 'client_ip')
     
-    # Convert types
-    if time_field in log_df.columns:
+    # Convert types (skipped for columns the parser already typed)
+    if time_field in log_df.columns and not pd.api.types.is_datetime64_any_dtype(log_df[time_field]):
         log_df[time_field] = pd.to_datetime(log_df[time_field], errors='coerce')
-    if status_field in log_df.columns:
-        log_df[status_field] = pd.to_numeric(log_df[status_field], errors='coerce')
-    if rt_field in log_df.columns:
-        log_df[rt_field] = pd.to_numeric(log_df[rt_field], errors='coerce')
+    for field in (status_field, rt_field):
+        if field in log_df.columns and not pd.api.types.is_numeric_dtype(log_df[field]):
+            log_df[field] = pd.to_numeric(log_df[field], errors='coerce')
 
     # Convert processing time fields to numeric
     if processing_time_fields:
         for field in processing_time_fields:
-            if field in log_df.columns:
+            if field in log_df.columns and not pd.api.types.is_numeric_dtype(log_df[field]):
                 log_df[field] = pd.to_numeric(log_df[field], errors='coerce')
                 logger.info(f"Converted {field} to numeric type")
 
-    # Calculate statistics
-    result = {}
+    # Calculate statistics (the stat functions only read log_df)
+    tasks = {}
 
     if 'summary' in stats_types:
-        result['summary'] = _calculate_summary_stats(log_df, url_field, ip_field, status_field, rt_field)
+        tasks['summary'] = (_calculate_summary_stats, (log_df, url_field, ip_field, status_field, rt_field))
 
     if 'url' in stats_types:
-        result['urlStats'] = _calculate_url_stats(
+        tasks['urlStats'] = (_calculate_url_stats, (
             log_df,
             url_field,
             status_field,
             rt_field,
-            use_multiprocessing,
-            num_workers,
             processing_time_fields,
             sort_by,
             sort_metric,
             top_n
-        )
+        ))
 
     if 'time' in stats_types:
-        result['timeStats'] = _calculate_time_stats(log_df, time_field, status_field, rt_field, time_interval, use_multiprocessing, num_workers)
+        tasks['timeStats'] = (_calculate_time_stats, (log_df, time_field, status_field, rt_field, time_interval))
 
     if 'ip' in stats_types:
-        result['ipStats'] = _calculate_ip_stats(log_df, ip_field, status_field, rt_field, use_multiprocessing, num_workers)
+        tasks['ipStats'] = (_calculate_ip_stats, (log_df, ip_field, status_field, rt_field))
+
+    # Run the stat types concurrently: their groupby/sort kernels release the GIL,
+    # and threads share log_df without pickling it
+    workers = min(len(tasks), num_workers or cpu_count()) if use_multiprocessing else 1
+    if workers > 1:
+        logger.info(f"Calculating {len(tasks)} statistics types with {workers} threads")
+        with ThreadPool(processes=workers) as pool:
+            pending = {key: pool.apply_async(func, args) for key, (func, args) in tasks.items()}
+            result = {key: job.get() for key, job in pending.items()}
+    else:
+        result = {key: func(*args) for key, (func, args) in tasks.items()}
     
     # Generate output file
     input_path = Path(inputFile)
@@ -1442,18 +1858,24 @@ def calculateStats(
     output_file = input_path.parent / f"stats_{timestamp}.json"
     
     # Save to JSON
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(result, f, indent=2, ensure_ascii=False)
+    _write_json(result, output_file)
     
     # Generate summary text
     summary_text = _generate_summary_text(result, stats_types)
-    
-    # Return absolute path
-    return {
+
+    stats_result = {
         'filePath': str(output_file.resolve()),
         'summary': summary_text
     }
 
+    # Remember the result for repeated calls on unchanged input
+    if len(_stats_results) >= STATS_CACHE_SIZE:
+        del _stats_results[next(iter(_stats_results))]
+    _stats_results[cache_key] = (dict(stats_result), _file_version(stats_result['filePath']))
+
+    # Return absolute path
+    return stats_result
+
 
 def _calculate_summary_stats(log_df, url_field, ip_field, status_field, rt_field):
     """Calculate overall summary statistics"""
@@ -1465,23 +1887,19 @@ def _calculate_summary_stats(log_df, url_field, ip_field, status_field, rt_field
     
     # Status code distribution
     if status_field in log_df.columns:
-        status_counts = log_df[status_field].value_counts().to_dict()
-        stats['statusCodeDistribution'] = {str(k): int(v) for k, v in status_counts.items() if pd.notna(k)}
+        # value_counts() skips missing status codes; tolist() yields Python ints
+        status_counts = log_df[status_field].value_counts()
+        stats['statusCodeDistribution'] = {
+            str(status): count for status, count in zip(status_counts.index.tolist(), status_counts.tolist())
+        }
     
     # Response time statistics
     if rt_field in log_df.columns:
         rt_data = log_df[rt_field].dropna()
         if not rt_data.empty:
+            rt_stats = _describe_values(rt_data, percentiles=(10, 90, 95, 99))
             stats['responseTime'] = {
-                'avg': float(rt_data.mean()),
-                'median': float(rt_data.median()),
-                'std': float(rt_data.std()),
-                'min': float(rt_data.min()),
-                'max': float(rt_data.max()),
-                'p10': float(rt_data.quantile(0.1)),
-                'p90': float(rt_data.quantile(0.9)),
-                'p95': float(rt_data.quantile(0.95)),
-                'p99': float(rt_data.quantile(0.99))
+                key: rt_stats[key] for key in ('avg', 'median', 'std', 'min', 'max', 'p10', 'p90', 'p95', 'p99')
             }
     
     return stats
@@ -1492,23 +1910,19 @@ def _calculate_url_stats(
     url_field,
     status_field,
     rt_field,
-    use_multiprocessing=True,
-    num_workers=None,
     processing_time_fields=None,
     sort_by=None,
     sort_metric='avg',
     top_n=None
 ):
     """
-    Calculate per-URL statistics with optional parallel processing.
+    Calculate per-URL statistics with vectorized groupby aggregations.
 
     Args:
         log_df: DataFrame with log data
         url_field: URL field name
         status_field: Status code field name
         rt_field: Response time field name (legacy)
-        use_multiprocessing: Enable parallel processing
-        num_workers: Number of workers
         processing_time_fields: List of processing time field names to analyze
         sort_by: Field name to sort by (e.g., 'request_processing_time', 'target_processing_time')
         sort_metric: Metric to sort by ('avg', 'sum', 'median', 'p95', 'p99')
@@ -1520,52 +1934,35 @@ def _calculate_url_stats(
     if url_field not in log_df.columns:
         return []
 
-    # Group by URL
+    # Aggregate all URL groups at once with vectorized groupby operations
+    # (multiprocessing over per-group Python loops is no longer needed)
     url_groups = log_df.groupby(url_field)
-    num_groups = len(url_groups)
-
-    logger.info(f"Calculating statistics for {num_groups} unique URLs")
-
-    # Use multiprocessing for large number of groups
-    if use_multiprocessing and num_groups >= 100:
-        if num_workers is None:
-            num_workers = min(cpu_count(), max(1, num_groups // 100))
+    counts = url_groups.size()
 
-        logger.info(f"Using multiprocessing with {num_workers} workers for URL stats")
+    logger.info(f"Calculating statistics for {len(counts)} unique URLs")
 
-        # Convert groups to list for chunking
-        group_list = [(url, group) for url, group in url_groups]
+    url_stats = {url: {'url': url, 'count': count} for url, count in zip(counts.index, counts.tolist())}
 
-        # Split into chunks
-        chunk_size = max(1, len(group_list) // (num_workers * 4))
-        chunks = [group_list[i:i + chunk_size] for i in range(0, len(group_list), chunk_size)]
+    # Status code distribution
+    if status_field in log_df.columns:
+        status_counts = _grouped_value_counts(log_df, url_field, status_field)
+        for url, stat in url_stats.items():
+            stat['statusCodes'] = status_counts.get(url, {})
 
-        # Process in parallel
-        worker_fn = partial(
-            _calculate_url_stats_chunk,
-            status_field=status_field,
-            rt_field=rt_field,
-            processing_time_fields=processing_time_fields
-        )
+    # Response time statistics (legacy field), then multiple processing time fields
+    numeric_fields = []
+    if rt_field and rt_field in log_df.columns:
+        numeric_fields.append(('responseTime', log_df[rt_field]))
+    for field_name in processing_time_fields or []:
+        if field_name in log_df.columns:
+            # Use field name as key (e.g., 'request_processing_time', 'target_processing_time')
+            numeric_fields.append((field_name, pd.to_numeric(log_df[field_name], errors='coerce')))
 
-        with Pool(processes=num_workers) as pool:
-            results = pool.map(worker_fn, chunks)
+    for key, values in numeric_fields:
+        for url, field_stats in _grouped_numeric_stats(values, log_df[url_field]).items():
+            url_stats[url][key] = field_stats
 
-        # Combine results
-        url_stats = []
-        for chunk_result in results:
-            url_stats.extend(chunk_result)
-
-        logger.info(f"Parallel URL stats calculation completed: {len(url_stats)} URLs processed")
-    else:
-        # Sequential processing
-        logger.info("Using sequential processing for URL stats")
-        url_stats = _calculate_url_stats_chunk(
-            [(url, group) for url, group in url_groups],
-            status_field,
-            rt_field,
-            processing_time_fields
-        )
+    url_stats = list(url_stats.values())
 
     # Apply sorting
     if sort_by and sort_metric:
@@ -1591,8 +1988,8 @@ def _calculate_url_stats(
     return url_stats
 
 
-def _calculate_time_stats(log_df, time_field, status_field, rt_field, interval, use_multiprocessing=True, num_workers=None):
-    """Calculate time-series statistics with optional parallel processing"""
+def _calculate_time_stats(log_df, time_field, status_field, rt_field, interval):
+    """Calculate time-series statistics (vectorized)"""
     if time_field not in log_df.columns:
         return []
 
@@ -1600,105 +1997,72 @@ def _calculate_time_stats(log_df, time_field, status_field, rt_field, interval,
     from data_visualizer import _normalize_interval
     freq = _normalize_interval(interval)
 
-    # Group by time interval
-    log_df['time_bucket'] = log_df[time_field].dt.floor(freq)
-    time_groups = log_df.groupby('time_bucket')
-    num_groups = len(time_groups)
-
-    logger.info(f"Calculating statistics for {num_groups} time intervals")
-
-    # Use multiprocessing for large number of time buckets
-    if use_multiprocessing and num_groups >= 100:
-        if num_workers is None:
-            num_workers = min(cpu_count(), max(1, num_groups // 100))
-
-        logger.info(f"Using multiprocessing with {num_workers} workers for time stats")
-
-        # Convert groups to list for chunking
-        group_list = [(time_bucket, group) for time_bucket, group in time_groups]
+    # Group by time interval; all buckets are aggregated at once. The buckets are
+    # kept as a Series instead of a log_df column, so log_df is only read here
+    time_buckets = log_df[time_field].dt.floor(freq)
+    counts = time_buckets.groupby(time_buckets).size()
 
-        # Split into chunks
-        chunk_size = max(1, len(group_list) // (num_workers * 4))
-        chunks = [group_list[i:i + chunk_size] for i in range(0, len(group_list), chunk_size)]
+    logger.info(f"Calculating statistics for {len(counts)} time intervals")
 
-        # Process in parallel
-        worker_fn = partial(_calculate_time_stats_chunk, status_field=status_field, rt_field=rt_field)
-
-        with Pool(processes=num_workers) as pool:
-            results = pool.map(worker_fn, chunks)
-
-        # Combine results
-        time_stats = []
-        for chunk_result in results:
-            time_stats.extend(chunk_result)
-
-        logger.info(f"Parallel time stats calculation completed: {len(time_stats)} intervals processed")
-    else:
-        # Sequential processing
-        logger.info("Using sequential processing for time stats")
-        time_stats = _calculate_time_stats_chunk(
-            [(time_bucket, group) for time_bucket, group in time_groups],
-            status_field,
-            rt_field
-        )
+    time_stats = [
+        {'time': time_bucket.isoformat() if pd.notna(time_bucket) else None, 'count': count}
+        for time_bucket, count in zip(counts.index, counts.tolist())
+    ]
 
-    # Sort by time
-    time_stats.sort(key=lambda x: x['time'] if x['time'] else '')
+    # Status code distribution
+    if status_field in log_df.columns:
+        error_counts = (log_df[status_field] >= 400).groupby(time_buckets).sum()
+        error_rates = error_counts / counts
+        for stat, error_count, error_rate in zip(time_stats, error_counts.tolist(), error_rates.tolist()):
+            stat['errorCount'] = error_count
+            stat['errorRate'] = error_rate
 
+    # Response time statistics
+    if rt_field in log_df.columns:
+        rt_groups = log_df[rt_field].groupby(time_buckets)
+        rt_columns = (rt_groups.count().tolist(), rt_groups.mean().tolist(), rt_groups.quantile(0.95).tolist())
+        for stat, rt_count, avg, p95 in zip(time_stats, *rt_columns):
+            if rt_count:
+                stat['avgResponseTime'] = avg
+                stat['p95ResponseTime'] = p95
+
+    # Already in time order: groupby sorts the buckets (and drops NaT)
     return time_stats
 
 
-def _calculate_ip_stats(log_df, ip_field, status_field, rt_field, use_multiprocessing=True, num_workers=None):
-    """Calculate per-IP statistics with optional parallel processing"""
+def _calculate_ip_stats(log_df, ip_field, status_field, rt_field):
+    """Calculate per-IP statistics (vectorized)"""
     if ip_field not in log_df.columns:
         return []
 
-    # Group by IP
-    ip_groups = log_df.groupby(ip_field)
-    num_groups = len(ip_groups)
-
-    logger.info(f"Calculating statistics for {num_groups} unique IPs")
-
-    # Use multiprocessing for large number of IPs
-    if use_multiprocessing and num_groups >= 100:
-        if num_workers is None:
-            num_workers = min(cpu_count(), max(1, num_groups // 100))
-
-        logger.info(f"Using multiprocessing with {num_workers} workers for IP stats")
+    counts = log_df.groupby(ip_field).size()
 
-        # Convert groups to list for chunking
-        group_list = [(ip, group) for ip, group in ip_groups]
+    logger.info(f"Calculating statistics for {len(counts)} unique IPs")
 
-        # Split into chunks
-        chunk_size = max(1, len(group_list) // (num_workers * 4))
-        chunks = [group_list[i:i + chunk_size] for i in range(0, len(group_list), chunk_size)]
+    # Keep only the top 100 IPs by count (ties in IP order) before aggregating,
+    # so error counts and averages are computed for their rows only
+    counts = counts.sort_values(ascending=False, kind='stable').head(100)
+    top_df = log_df[log_df[ip_field].isin(counts.index)]
+    top_ips = top_df[ip_field]
 
-        # Process in parallel
-        worker_fn = partial(_calculate_ip_stats_chunk, status_field=status_field, rt_field=rt_field)
+    ip_stats = {ip: {'ip': ip, 'count': count} for ip, count in zip(counts.index, counts.tolist())}
 
-        with Pool(processes=num_workers) as pool:
-            results = pool.map(worker_fn, chunks)
-
-        # Combine results
-        ip_stats = []
-        for chunk_result in results:
-            ip_stats.extend(chunk_result)
-
-        logger.info(f"Parallel IP stats calculation completed: {len(ip_stats)} IPs processed")
-    else:
-        # Sequential processing
-        logger.info("Using sequential processing for IP stats")
-        ip_stats = _calculate_ip_stats_chunk(
-            [(ip, group) for ip, group in ip_groups],
-            status_field,
-            rt_field
-        )
+    # Status code distribution
+    if status_field in log_df.columns:
+        error_counts = (top_df[status_field] >= 400).groupby(top_ips).sum()
+        for ip, error_count in zip(error_counts.index, error_counts.tolist()):
+            ip_stats[ip]['errorCount'] = error_count
 
-    # Sort by count (descending)
-    ip_stats.sort(key=lambda x: x['count'], reverse=True)
+    # Response time average
+    if rt_field in log_df.columns:
+        rt_groups = top_df[rt_field].groupby(top_ips)
+        rt_counts = rt_groups.count()
+        for ip, rt_count, avg in zip(rt_counts.index, rt_counts.tolist(), rt_groups.mean().tolist()):
+            if rt_count:
+                ip_stats[ip]['avgResponseTime'] = avg
 
-    # Limit to top 100 IPs
-    return ip_stats[:100]
+    # Already sorted by count (descending)
+    return list(ip_stats.values())
 
 
 def _generate_summary_text(result, stats_types):
@@ -2134,44 +2498,39 @@ def aggregate_data(log_df):
     # Remove invalid times
     log_df = log_df.dropna(subset=[time_field])
     
+    if log_df.empty:
+        return pd.DataFrame()
+
     # Create time buckets (1 minute intervals)
-    log_df['time_bucket'] = log_df[time_field].dt.floor('1T')
+    log_df['time_bucket'] = log_df[time_field].dt.floor('1min')
     
     # Detect status and response time fields
     status_field = 'elb_status_code' if 'elb_status_code' in log_df.columns else None
     rt_field = 'target_processing_time' if 'target_processing_time' in log_df.columns else None
     
-    # Aggregate by time bucket
-    aggregated = []
-    
-    for time_bucket, group in log_df.groupby('time_bucket'):
-        agg_row = {
-            'time': time_bucket,
-            'request_count': len(group)
-        }
-        
-        if status_field and status_field in group.columns:
-            agg_row['error_count'] = (pd.to_numeric(group[status_field], errors='coerce') >= 400).sum()
-            agg_row['error_rate'] = agg_row['error_count'] / len(group) * 100
-            
-            status_counts = group[status_field].value_counts()
-            agg_row['status_2xx'] = status_counts.get('2xx', 0) + status_counts.get(200, 0)
-            agg_row['status_4xx'] = status_counts.get('4xx', 0) + status_counts.get(400, 0)
-            agg_row['status_5xx'] = status_counts.get('5xx', 0) + status_counts.get(500, 0)
-        
-        if rt_field and rt_field in group.columns:
-            rt_data = pd.to_numeric(group[rt_field], errors='coerce').dropna()
-            if not rt_data.empty:
-                agg_row['avg_response_time'] = float(rt_data.mean())
-                agg_row['p95_response_time'] = float(rt_data.quantile(0.95))
-                agg_row['p99_response_time'] = float(rt_data.quantile(0.99))
-        
-        aggregated.append(agg_row)
-    
-    result_df = pd.DataFrame(aggregated)
-    
-    if not result_df.empty:
-        result_df = result_df.sort_values('time').reset_index(drop=True)
+    # Aggregate by time bucket: every column is one vectorized groupby over all buckets
+    buckets = log_df['time_bucket']
+    request_counts = log_df.groupby('time_bucket').size()
+    result_df = pd.DataFrame({'time': request_counts.index, 'request_count': request_counts.to_numpy()})
+
+    if status_field:
+        status = log_df[status_field]
+        is_error = pd.to_numeric(status, errors='coerce') >= 400
+        result_df['error_count'] = is_error.groupby(buckets).sum().to_numpy()
+        result_df['error_rate'] = result_df['error_count'] / result_df['request_count'] * 100
+
+        # Counts of the class label or its representative code (e.g. '2xx' or 200)
+        for column, values in (('status_2xx', ['2xx', 200]), ('status_4xx', ['4xx', 400]), ('status_5xx', ['5xx', 500])):
+            result_df[column] = status.isin(values).groupby(buckets).sum().to_numpy()
+
+    if rt_field:
+        rt_groups = pd.to_numeric(log_df[rt_field], errors='coerce').groupby(buckets)
+        # Columns only exist if at least one bucket has response times
+        if rt_groups.count().any():
+            quantiles = rt_groups.quantile([0.95, 0.99]).unstack()
+            result_df['avg_response_time'] = rt_groups.mean().to_numpy()
+            result_df['p95_response_time'] = quantiles[0.95].to_numpy()
+            result_df['p99_response_time'] = quantiles[0.99].to_numpy()
     
     return result_df
 
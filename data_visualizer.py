@@ -7,14 +7,17 @@ Implements MCP tools: generateXlog, generateRequestPerURI
 import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+import html
 import json
 import os
 import re
 import gc
-from datetime import datetime
+from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 import numpy as np
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
 # Import core modules
 from core.exceptions import (
@@ -27,6 +30,46 @@ from core.utils import FieldMapper
 # Setup logger
 logger = get_logger(__name__)
 
+# Plotly default color palette (checkbox colors of patterns without a given color)
+_PLOTLY_DEFAULT_COLORS = (
+    '#636EFA', '#EF553B', '#00CC96', '#AB63FA', '#FFA15A',
+    '#19D3F3', '#FF6692', '#B6E880', '#FF97FF', '#FECB52'
+)
+
+# XLog status colors (order of the 'color' categories) and a colorscale that maps
+# each category code k to its color exactly, for per-point colors passed as codes
+_XLOG_STATUS_COLORS = ('green', 'blue', 'orange', 'red', 'gray')
+_XLOG_STATUS_COLORSCALE = [
+    [k / (len(_XLOG_STATUS_COLORS) - 1), color] for k, color in enumerate(_XLOG_STATUS_COLORS)
+]
+
+# Time interval: number + unit, e.g. '10m', '1h' (see _normalize_interval)
+_INTERVAL_RE = re.compile(r'^(\d+)([a-zA-Z]+)$')
+
+# Interval unit abbreviations -> pandas frequency units
+# 'm' is ambiguous (month vs minute), default to minute for access logs.
+# Read-only: _normalize_interval results are cached, so the table must not change.
+_INTERVAL_UNITS = MappingProxyType({
+    'm': 'min',      # Default 'm' to minutes for access logs
+    'min': 'min',
+    'mins': 'min',
+    'minute': 'min',
+    'minutes': 'min',
+    's': 's',
+    'sec': 's',
+    'secs': 's',
+    'second': 's',
+    'seconds': 's',
+    'h': 'h',
+    'hr': 'h',
+    'hrs': 'h',
+    'hour': 'h',
+    'hours': 'h',
+    'd': 'd',
+    'day': 'd',
+    'days': 'd',
+})
+
 
 # ============================================================================
 # Helper Functions
@@ -54,52 +97,57 @@ def _normalize_interval(interval: str) -> str:
     if not interval or not isinstance(interval, str):
         raise ValidationError('interval', f"Invalid interval: {interval}")
 
+    return _normalize_interval_cached(interval)
+
+
+@lru_cache(maxsize=64)
+def _normalize_interval_cached(interval: str) -> str:
+    """Parse and normalize an interval string once per distinct value, see _normalize_interval"""
     # Common interval patterns: number + unit
-    import re
-    match = re.match(r'^(\d+)([a-zA-Z]+)$', interval.strip())
+    match = _INTERVAL_RE.match(interval.strip())
     if not match:
         raise ValidationError('interval',
             f"Invalid interval format: '{interval}'. Expected format: number + unit (e.g., '1min', '10s', '1h')")
 
     number, unit = match.groups()
 
-    # Normalize unit abbreviations
-    # 'm' is ambiguous (month vs minute), default to minute for access logs
-    unit_map = {
-        'm': 'min',      # Default 'm' to minutes for access logs
-        'min': 'min',
-        'mins': 'min',
-        'minute': 'min',
-        'minutes': 'min',
-        's': 's',
-        'sec': 's',
-        'secs': 's',
-        'second': 's',
-        'seconds': 's',
-        'h': 'h',
-        'hr': 'h',
-        'hrs': 'h',
-        'hour': 'h',
-        'hours': 'h',
-        'd': 'd',
-        'day': 'd',
-        'days': 'd',
-    }
-
-    normalized_unit = unit_map.get(unit.lower())
+    normalized_unit = _INTERVAL_UNITS.get(unit.lower())
     if not normalized_unit:
         raise ValidationError('interval',
             f"Unknown time unit: '{unit}'. Supported units: s, min, h, d")
 
     normalized_interval = f"{number}{normalized_unit}"
 
-    # Log if conversion occurred
+    # Log if conversion occurred (once per distinct interval, since results are cached)
     if normalized_interval != interval:
         logger.info(f"Normalized interval '{interval}' to '{normalized_interval}'")
 
     return normalized_interval
 
 
+def _parse_time_column(series: pd.Series) -> pd.Series:
+    """
+    Convert a time column to datetime, trying pandas' fast ISO 8601 parser first.
+
+    Columns the parser already converted (columnTypes) are returned as is. If any
+    value does not parse as ISO 8601 (e.g. Apache '%d/%b/%Y:%H:%M:%S %z' strings),
+    the column is parsed with pandas format inference instead.
+
+    Args:
+        series (pd.Series): Time column
+
+    Returns:
+        pd.Series: Datetime column (invalid values as NaT)
+    """
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series
+
+    parsed = pd.to_datetime(series, format='ISO8601', errors='coerce')
+    if parsed.isna().sum() > series.isna().sum():
+        parsed = pd.to_datetime(series, errors='coerce')
+    return parsed
+
+
 def _optimize_dataframe_dtypes(df: pd.DataFrame, verbose: bool = True) -> pd.DataFrame:
     """
     Optimize DataFrame memory usage by downcasting numeric types and converting to category.
@@ -241,52 +289,9 @@ def _save_or_merge_patterns(
     return str(patterns_file_path.resolve())
 
 
-def _generate_interactive_enhancements(
-    patterns: List[str],
-    colors: List[str],
-    div_id: str,
-    filter_label: str = "Filter Patterns:",
-    hover_format: str = "default"
-) -> tuple:
-    """
-    Generate checkbox filter panel, hover text display, and JavaScript for interactive visualizations.
-
-    Args:
-        patterns: List of pattern names to display in checkboxes
-        colors: List of colors matching each pattern (Plotly color format)
-        div_id: The Plotly div ID for targeting in JavaScript
-        filter_label: Label text for the filter panel (default: "Filter Patterns:")
-        hover_format: Format for hover text display ("default", "count", "time", or custom)
-
-    Returns:
-        tuple: (checkbox_html, hover_text_html, javascript_code)
-    """
-    # Plotly default color palette
-    plotly_default_colors = [
-        '#636EFA', '#EF553B', '#00CC96', '#AB63FA', '#FFA15A',
-        '#19D3F3', '#FF6692', '#B6E880', '#FF97FF', '#FECB52'
-    ]
-
-    # Create checkbox HTML for each pattern
-    checkbox_html = '<div id="filterCheckboxPanel" style="position: fixed; right: 10px; top: 80px; width: 180px; max-height: 500px; overflow-y: auto; background: rgba(255,255,255,0.95); padding: 8px; border: 1px solid #ccc; border-radius: 5px; z-index: 1000; box-shadow: 0 2px 8px rgba(0,0,0,0.1); color: #444; font-family: \'Open Sans\', verdana, arial, sans-serif; font-size: 11px;">'
-    checkbox_html += f'<div style="font-weight: bold; margin-bottom: 10px; font-size: 14px;">{filter_label}</div>'
-    checkbox_html += '<div style="margin-bottom: 8px; position: relative;"><input type="text" id="patternFilterInput" placeholder="Regex filter..." style="width: 100%; padding: 4px 24px 4px 4px; border: 1px solid #ccc; border-radius: 3px; font-size: 11px; box-sizing: border-box;"><span id="clearFilterBtn" style="position: absolute; right: 6px; top: 50%; transform: translateY(-50%); cursor: pointer; font-size: 14px; color: #999; display: none;" title="Clear filter">×</span></div>'
-    checkbox_html += '<div style="margin-bottom: 5px;"><label style="color: #444;"><input type="checkbox" id="checkAll" checked> <strong>All</strong></label></div>'
-    checkbox_html += '<div style="margin-bottom: 5px;"><label style="color: #444;"><input type="checkbox" id="checkNone"> <strong>None</strong></label></div>'
-    checkbox_html += '<hr style="margin: 8px 0;">'
-
-    # Create checkbox items using the same patterns list
-    for i, pattern in enumerate(patterns):
-        pattern_id = f'pattern_{i}'
-        pattern_display = pattern[:60] + ('...' if len(pattern) > 60 else '')
-        # Use colors if provided, otherwise fall back to plotly default colors
-        trace_color = colors[i] if i < len(colors) else plotly_default_colors[i % len(plotly_default_colors)]
-        checkbox_html += f'<div class="pattern-item" style="margin-bottom: 3px; font-size: 11px;" data-pattern="{pattern}"><label class="pattern-label" data-index="{i}"><input type="checkbox" class="pattern-checkbox" id="{pattern_id}" data-index="{i}" checked> <span class="pattern-text" style="color: {trace_color}; font-weight: bold;">{pattern_display}</span></label></div>'
-
-    checkbox_html += '</div>'
-
-    # Add hover text display area and clipboard copy feature
-    hover_text_html = '''
+# Hover text display area and clipboard copy feature of interactive charts
+# (see _generate_interactive_enhancements)
+_HOVER_TEXT_HTML = '''
     <div id="hoverTextDisplay" style="position: fixed; bottom: 20px; right: 20px; background: rgba(255,255,255,0.95); padding: 10px; border: 1px solid #ccc; border-radius: 5px; max-width: 300px; max-height: 150px; overflow-y: auto; display: none; z-index: 2000; box-shadow: 0 2px 8px rgba(0,0,0,0.2); font-size: 12px; color: #444; font-family: 'Open Sans', verdana, arial, sans-serif;">
         <div style="font-weight: bold; margin-bottom: 5px;">Hover Info:</div>
         <div id="hoverTextContent" style="white-space: pre-wrap; word-break: break-word;"></div>
@@ -294,53 +299,81 @@ def _generate_interactive_enhancements(
     </div>
     '''
 
-    # JavaScript for checkbox functionality and hover text copy
-    js_code = f'''
+
+def _minify_js(source: str) -> str:
+    """
+    Strip indentation, blank lines, whole-line // comments and console.log statements from JS.
+
+    Works line by line and keeps the newlines, so automatic semicolon insertion
+    and string/template literals (all single-line) are unaffected.
+
+    Args:
+        source (str): JavaScript (optionally wrapped in <script> tags)
+
+    Returns:
+        str: Minified JavaScript
+    """
+    lines = []
+    for line in source.splitlines():
+        line = line.strip()
+        if not line or line.startswith('//'):
+            continue
+        if line.startswith('console.log(') and line.endswith(');'):
+            continue
+        lines.append(line)
+    return '\n'.join(lines)
+
+
+# JavaScript for checkbox filtering and hover text copy of interactive charts.
+# A plain string (not an f-string) so the JS braces need no escaping; the
+# __DIV_ID__ placeholder is replaced with the Plotly div ID. Minified once at
+# import, since it is embedded in every generated report.
+_INTERACTIVE_JS_TEMPLATE = _minify_js('''
     <script>
-    (function() {{
+    (function() {
         // Hover text storage and clipboard functionality
         let lastHoverText = '';
         let hoverTextDisplay = null;
         let hoverTextContent = null;
 
         // Function to get hover text elements (lazy initialization)
-        function getHoverTextElements() {{
-            if (!hoverTextDisplay) {{
+        function getHoverTextElements() {
+            if (!hoverTextDisplay) {
                 hoverTextDisplay = document.getElementById('hoverTextDisplay');
-            }}
-            if (!hoverTextContent) {{
+            }
+            if (!hoverTextContent) {
                 hoverTextContent = document.getElementById('hoverTextContent');
-            }}
-            return {{ display: hoverTextDisplay, content: hoverTextContent }};
-        }}
+            }
+            return { display: hoverTextDisplay, content: hoverTextContent };
+        }
 
         // Function to copy text to clipboard
-        function copyToClipboard(text) {{
+        function copyToClipboard(text) {
             const elements = getHoverTextElements();
             const hoverTextContent = elements.content;
 
             if (!hoverTextContent) return;
 
-            if (navigator.clipboard && navigator.clipboard.writeText) {{
-                navigator.clipboard.writeText(text).then(() => {{
+            if (navigator.clipboard && navigator.clipboard.writeText) {
+                navigator.clipboard.writeText(text).then(() => {
                     console.log('Copied to clipboard:', text);
                     // Show feedback
                     const originalContent = hoverTextContent.innerHTML;
                     hoverTextContent.innerHTML = originalContent + '<br><span style="color: green;">✓ Copied!</span>';
-                    setTimeout(() => {{
+                    setTimeout(() => {
                         hoverTextContent.innerHTML = originalContent;
-                    }}, 1000);
-                }}).catch(err => {{
+                    }, 1000);
+                }).catch(err => {
                     console.error('Failed to copy:', err);
                     fallbackCopyToClipboard(text);
-                }});
-            }} else {{
+                });
+            } else {
                 fallbackCopyToClipboard(text);
-            }}
-        }}
+            }
+        }
 
         // Fallback copy method
-        function fallbackCopyToClipboard(text) {{
+        function fallbackCopyToClipboard(text) {
             const elements = getHoverTextElements();
             const hoverTextContent = elements.content;
 
@@ -351,394 +384,434 @@ def _generate_interactive_enhancements(
             document.body.appendChild(textArea);
             textArea.focus();
             textArea.select();
-            try {{
+            try {
                 document.execCommand('copy');
                 console.log('Copied to clipboard (fallback):', text);
-                if (hoverTextContent) {{
+                if (hoverTextContent) {
                     const originalContent = hoverTextContent.innerHTML;
                     hoverTextContent.innerHTML = originalContent + '<br><span style="color: green;">✓ Copied!</span>';
-                    setTimeout(() => {{
+                    setTimeout(() => {
                         hoverTextContent.innerHTML = originalContent;
-                    }}, 1000);
-                }}
-            }} catch (err) {{
+                    }, 1000);
+                }
+            } catch (err) {
                 console.error('Fallback copy failed:', err);
-            }}
+            }
             document.body.removeChild(textArea);
-        }}
+        }
 
         // Handle Ctrl+C keyboard shortcut
-        document.addEventListener('keydown', function(e) {{
-            if ((e.ctrlKey || e.metaKey) && e.key === 'c' && lastHoverText) {{
+        document.addEventListener('keydown', function(e) {
+            if ((e.ctrlKey || e.metaKey) && e.key === 'c' && lastHoverText) {
                 const elements = getHoverTextElements();
-                if (elements.display && elements.display.style.display !== 'none') {{
+                if (elements.display && elements.display.style.display !== 'none') {
                     e.preventDefault();
                     copyToClipboard(lastHoverText);
-                }}
-            }}
-        }});
+                }
+            }
+        });
+
+        // Run cb once the panel, hover box and Plotly all exist. The script is
+        // normally appended after them, so the fast path fires immediately;
+        // otherwise watch DOM insertions (and window load for a late Plotly)
+        // instead of polling with timers.
+        function whenReady(cb) {
+            const isReady = function() {
+                return document.getElementById('checkAll') &&
+                    document.getElementById('hoverTextDisplay') &&
+                    window.Plotly;
+            };
+            if (isReady()) {
+                cb();
+                return;
+            }
+            let done = false;
+            const mo = new MutationObserver(function() {
+                check();
+            });
+            const check = function() {
+                if (!done && isReady()) {
+                    done = true;
+                    mo.disconnect();
+                    cb();
+                }
+            };
+            mo.observe(document.documentElement, {childList: true, subtree: true});
+            window.addEventListener('load', check);
+        }
 
-        // Wait for DOM to be ready, then setup click handler
-        function setupHoverTextClick() {{
+        // Copy the last hover text when the display box is clicked
+        function setupHoverTextClick() {
             const elements = getHoverTextElements();
-            if (elements.display) {{
-                console.log('✓ hoverTextDisplay found, setting up click handler');
-                elements.display.addEventListener('click', function() {{
-                    if (lastHoverText) {{
-                        copyToClipboard(lastHoverText);
-                    }}
-                }});
-            }} else {{
-                // Retry if not ready yet
-                console.log('hoverTextDisplay not found, retrying...');
-                setTimeout(setupHoverTextClick, 100);
-            }}
-        }}
-
-        // Initialize hover text click handler when DOM is ready
-        function initHoverText() {{
-            if (document.readyState === 'loading') {{
-                document.addEventListener('DOMContentLoaded', function() {{
-                    setTimeout(setupHoverTextClick, 100);
-                }});
-            }} else {{
-                setTimeout(setupHoverTextClick, 100);
-            }}
-        }}
-
-        // Start hover text initialization
-        initHoverText();
+            elements.display.addEventListener('click', function() {
+                if (lastHoverText) {
+                    copyToClipboard(lastHoverText);
+                }
+            });
+        }
 
-        // Wait for Plotly to be ready
-        function initCheckboxes() {{
+        function initCheckboxes() {
             const checkAll = document.getElementById('checkAll');
             const checkNone = document.getElementById('checkNone');
             const checkboxes = document.querySelectorAll('.pattern-checkbox');
 
-            if (!checkAll || !checkNone || checkboxes.length === 0) {{
-                console.warn('Checkbox elements not found. Retrying...');
-                setTimeout(initCheckboxes, 200);
+            if (!checkAll || !checkNone || checkboxes.length === 0) {
+                console.warn('Checkbox elements not found');
                 return;
-            }}
+            }
 
             console.log('✓ Checkbox elements found:', checkboxes.length, 'checkboxes');
 
-            if (!window.Plotly) {{
-                console.warn('Plotly not loaded yet');
-                setTimeout(initCheckboxes, 100);
-                return;
-            }}
-
             // Find Plotly div
             let plotlyDiv = null;
-            const targetDivId = "{div_id}";
+            const targetDivId = "__DIV_ID__";
 
             // Method 1: Find by the specific ID
-            if (targetDivId && targetDivId !== '') {{
+            if (targetDivId && targetDivId !== '') {
                 plotlyDiv = document.getElementById(targetDivId);
-            }}
+            }
 
             // Method 2: Use window.gd if available
-            if (!plotlyDiv && window.gd) {{
+            if (!plotlyDiv && window.gd) {
                 plotlyDiv = window.gd;
-            }}
+            }
 
             // Method 3: Find div with class 'js-plotly-plot'
-            if (!plotlyDiv) {{
+            if (!plotlyDiv) {
                 const plotDivs = document.querySelectorAll('.js-plotly-plot');
-                if (plotDivs.length > 0) {{
+                if (plotDivs.length > 0) {
                     plotlyDiv = plotDivs[0];
-                }}
-            }}
+                }
+            }
 
-            if (!plotlyDiv) {{
+            if (!plotlyDiv) {
                 console.error('Plotly div not found. Target ID:', targetDivId);
-                setTimeout(initCheckboxes, 200);
                 return;
-            }}
+            }
 
             console.log('Found Plotly div:', plotlyDiv.id || plotlyDiv.className);
 
             // Setup hover event handler to capture and display hover text
-            plotlyDiv.on('plotly_hover', function(data) {{
-                if (data && data.points && data.points.length > 0) {{
+            plotlyDiv.on('plotly_hover', function(data) {
+                if (data && data.points && data.points.length > 0) {
                     // Collect all points
-                    const pointInfo = data.points.map(pt => {{
+                    const pointInfo = data.points.map(pt => {
                         const yValue = pt.y !== undefined ? pt.y : pt.y0 || 0;
                         const traceName = pt.data?.name || pt.fullData?.name || 'Unknown';
-                        return {{
+                        return {
                             value: yValue,
                             name: traceName,
                             point: pt
-                        }};
-                    }});
+                        };
+                    });
 
                     // Sort by value in descending order
                     pointInfo.sort((a, b) => b.value - a.value);
 
                     // Format hover text
                     let displayText = '';
-                    pointInfo.forEach((info, index) => {{
+                    pointInfo.forEach((info, index) => {
                         if (index > 0) displayText += '\\n';
-                        displayText += `Value: ${{info.value}}, Series: ${{info.name}}`;
-                    }});
+                        displayText += `Value: ${info.value}, Series: ${info.name}`;
+                    });
 
                     // Store for clipboard copy
                     lastHoverText = displayText;
 
                     // Display in hover text area
                     const elements = getHoverTextElements();
-                    if (elements.content && elements.display) {{
+                    if (elements.content && elements.display) {
                         elements.content.textContent = displayText;
                         elements.display.style.display = 'block';
-                    }}
-                }}
-            }});
-
-            // Keep hover text visible for copying
-            plotlyDiv.on('plotly_unhover', function(data) {{
-                // Don't hide - keep visible for copying
-            }});
-
-            // Store original trace data
-            let originalTraceData = null;
-
-            const saveOriginalData = function() {{
-                if (!originalTraceData && plotlyDiv.data) {{
-                    originalTraceData = JSON.parse(JSON.stringify(plotlyDiv.data));
-                    console.log('Saved original trace data:', originalTraceData.length, 'traces');
-                }}
-            }};
-
-            setTimeout(saveOriginalData, 100);
+                    }
+                }
+            });
 
-            const updateVisibility = function() {{
-                const visible = [];
-                checkboxes.forEach((cb) => {{
-                    visible.push(cb.checked);
-                }});
+            // Toggle trace visibility in place; traces never leave the chart, so one
+            // restyle covers all/none/partial selections without re-adding data
+            const updateVisibility = function() {
+                const visible = Array.from(checkboxes, cb => cb.checked);
+                const traceIndices = visible.map((_, i) => i);
 
                 console.log('Updating visibility:', visible);
 
-                if (!originalTraceData && plotlyDiv.data) {{
-                    originalTraceData = JSON.parse(JSON.stringify(plotlyDiv.data));
-                }}
-
-                const currentTraceCount = plotlyDiv.data?.length || plotlyDiv._fullData?.length || 0;
-                const originalTraceCount = originalTraceData ? originalTraceData.length : visible.length;
-                const checkedCount = visible.filter(v => v).length;
-
-                try {{
-                    if (checkedCount === visible.length) {{
-                        // All selected - restore all traces
-                        if (currentTraceCount !== originalTraceCount && originalTraceData) {{
-                            console.log('Restoring all original traces');
-                            if (currentTraceCount > 0) {{
-                                for (let i = currentTraceCount - 1; i >= 0; i--) {{
-                                    try {{ Plotly.deleteTraces(plotlyDiv, i); }} catch (e) {{}}
-                                }}
-                            }}
-                            if (originalTraceData.length > 0) {{
-                                Plotly.addTraces(plotlyDiv, originalTraceData);
-                            }}
-                        }} else {{
-                            const visibleArray = Array(currentTraceCount).fill(true);
-                            const traceIndices = Array.from({{length: currentTraceCount}}, (_, i) => i);
-                            Plotly.restyle(plotlyDiv, {{visible: visibleArray}}, traceIndices);
-                        }}
-                    }} else if (checkedCount === 0) {{
-                        // None selected - hide all
-                        const visibleArray = Array(currentTraceCount).fill(false);
-                        const traceIndices = Array.from({{length: currentTraceCount}}, (_, i) => i);
-                        Plotly.restyle(plotlyDiv, {{visible: visibleArray}}, traceIndices);
-                    }} else {{
-                        // Some selected - show only selected
-                        if (originalTraceData) {{
-                            const selectedTraces = [];
-                            for (let i = 0; i < originalTraceData.length && i < visible.length; i++) {{
-                                if (visible[i]) selectedTraces.push(originalTraceData[i]);
-                            }}
-                            console.log('Selected traces to show:', selectedTraces.length);
-                            if (currentTraceCount > 0) {{
-                                for (let i = currentTraceCount - 1; i >= 0; i--) {{
-                                    try {{ Plotly.deleteTraces(plotlyDiv, i); }} catch (e) {{}}
-                                }}
-                            }}
-                            if (selectedTraces.length > 0) {{
-                                Plotly.addTraces(plotlyDiv, selectedTraces);
-                            }}
-                        }}
-                    }}
-                }} catch (e) {{
+                try {
+                    Plotly.restyle(plotlyDiv, {visible: visible}, traceIndices);
+                } catch (e) {
                     console.error('Error updating plotly:', e);
-                }}
-            }};
+                }
+            };
 
-            // Helper function to check if checkbox is visible
-            const isCheckboxVisible = function(checkbox) {{
-                const patternItem = checkbox.closest('.pattern-item');
+            // Look up each checkbox's .pattern-item once
+            const checkboxItems = Array.from(checkboxes, cb => cb.closest('.pattern-item'));
+
+            // Helper function to check if the i-th checkbox is visible
+            const isCheckboxVisible = function(i) {
+                const patternItem = checkboxItems[i];
                 return patternItem && patternItem.style.display !== 'none';
-            }};
+            };
 
             // Check all - only visible items
-            checkAll.addEventListener('change', function() {{
-                if (this.checked) {{
+            checkAll.addEventListener('change', function() {
+                if (this.checked) {
                     checkNone.checked = false;
-                    checkboxes.forEach(cb => {{
-                        if (isCheckboxVisible(cb)) {{
-                            cb.checked = true;
-                        }} else {{
-                            cb.checked = false;
-                        }}
-                    }});
+                    checkboxes.forEach((cb, i) => {
+                        cb.checked = Boolean(isCheckboxVisible(i));
+                    });
                     updateVisibility();
-                }}
-            }});
+                }
+            });
 
             // Check none
-            checkNone.addEventListener('change', function() {{
-                if (this.checked) {{
+            checkNone.addEventListener('change', function() {
+                if (this.checked) {
                     checkAll.checked = false;
                     checkboxes.forEach(cb => cb.checked = false);
                     updateVisibility();
-                }}
-            }});
+                }
+            });
 
             // Individual checkboxes
-            checkboxes.forEach(cb => {{
-                cb.addEventListener('change', function() {{
-                    if (this.checked) {{
+            checkboxes.forEach(cb => {
+                cb.addEventListener('change', function() {
+                    if (this.checked) {
                         checkNone.checked = false;
-                    }}
-
-                    const visibleCheckboxes = Array.from(checkboxes).filter(c => isCheckboxVisible(c));
-                    const allVisibleChecked = visibleCheckboxes.length > 0 && visibleCheckboxes.every(c => c.checked);
-                    if (allVisibleChecked) {{
+                    }
+
+                    // All visible boxes checked (and at least one visible); stop at the first unchecked
+                    let sawVisible = false;
+                    let allVisibleChecked = true;
+                    for (let i = 0; i < checkboxes.length; i++) {
+                        if (!isCheckboxVisible(i)) continue;
+                        sawVisible = true;
+                        if (!checkboxes[i].checked) {
+                            allVisibleChecked = false;
+                            break;
+                        }
+                    }
+                    allVisibleChecked = sawVisible && allVisibleChecked;
+                    if (allVisibleChecked) {
                         checkAll.checked = true;
                         checkNone.checked = false;
-                    }} else {{
+                    } else {
                         checkAll.checked = false;
-                    }}
+                    }
 
                     updateVisibility();
-                }});
-            }});
+                });
+            });
 
             // Pattern filter input functionality
             const patternFilterInput = document.getElementById('patternFilterInput');
             const clearFilterBtn = document.getElementById('clearFilterBtn');
 
-            if (patternFilterInput) {{
-                const filterPatterns = function() {{
+            if (patternFilterInput) {
+                const patternData = document.getElementById('patternData');
+                const PATTERNS = patternData ? JSON.parse(patternData.textContent) : [];
+                const patternItems = document.querySelectorAll('.pattern-item');
+                let filterTimer = null;
+                let lastFilterText = null;
+
+                const filterPatterns = function() {
                     const filterText = patternFilterInput.value.trim();
-                    const patternItems = document.querySelectorAll('.pattern-item');
 
-                    if (clearFilterBtn) {{
+                    // Skip the DOM walk if the filter did not change (e.g. cursor keys)
+                    if (filterText === lastFilterText) {
+                        return;
+                    }
+                    lastFilterText = filterText;
+
+                    if (clearFilterBtn) {
                         clearFilterBtn.style.display = filterText ? 'block' : 'none';
-                    }}
+                    }
 
-                    if (!filterText) {{
-                        patternItems.forEach(item => {{
+                    if (!filterText) {
+                        patternItems.forEach(item => {
                             item.style.display = '';
-                        }});
+                        });
                         return;
-                    }}
+                    }
 
-                    try {{
+                    try {
                         const regex = new RegExp(filterText, 'i');
                         let visibleCount = 0;
-                        patternItems.forEach(item => {{
-                            const pattern = item.getAttribute('data-pattern') || '';
-                            if (regex.test(pattern)) {{
+                        patternItems.forEach(item => {
+                            const pattern = PATTERNS[parseInt(item.dataset.index, 10)] || '';
+                            if (regex.test(pattern)) {
                                 item.style.display = '';
                                 visibleCount++;
-                            }} else {{
+                            } else {
                                 item.style.display = 'none';
-                            }}
-                        }});
-                        console.log(`Filtered patterns: ${{visibleCount}} visible out of ${{patternItems.length}} total`);
-                    }} catch (e) {{
+                            }
+                        });
+                        console.log(`Filtered patterns: ${visibleCount} visible out of ${patternItems.length} total`);
+                    } catch (e) {
                         console.warn('Invalid regex pattern:', filterText, e);
-                        patternItems.forEach(item => {{
+                        patternItems.forEach(item => {
                             item.style.display = '';
-                        }});
-                    }}
-                }};
-
-                patternFilterInput.addEventListener('input', filterPatterns);
-                patternFilterInput.addEventListener('keyup', filterPatterns);
-
-                if (clearFilterBtn) {{
-                    clearFilterBtn.addEventListener('click', function() {{
+                        });
+                    }
+                };
+
+                // Debounce so fast typing compiles the regex and walks the items once
+                patternFilterInput.addEventListener('input', function() {
+                    clearTimeout(filterTimer);
+                    filterTimer = setTimeout(filterPatterns, 50);
+                });
+
+                if (clearFilterBtn) {
+                    clearFilterBtn.addEventListener('click', function() {
+                        clearTimeout(filterTimer);
                         patternFilterInput.value = '';
                         filterPatterns();
                         patternFilterInput.focus();
-                    }});
+                    });
 
-                    clearFilterBtn.addEventListener('mouseenter', function() {{
+                    clearFilterBtn.addEventListener('mouseenter', function() {
                         this.style.color = '#333';
-                    }});
-                    clearFilterBtn.addEventListener('mouseleave', function() {{
+                    });
+                    clearFilterBtn.addEventListener('mouseleave', function() {
                         this.style.color = '#999';
-                    }});
-                }}
-            }}
-        }}
+                    });
+                }
+            }
+        }
 
-        // Initialize when DOM and Plotly are ready
-        function waitForPlotly() {{
-            if (document.readyState === 'loading') {{
-                document.addEventListener('DOMContentLoaded', function() {{
-                    setTimeout(waitForPlotly, 100);
-                }});
-                return;
-            }}
+        // Start initialization
+        whenReady(function() {
+            setupHoverTextClick();
+            initCheckboxes();
+        });
+    })();
+    </script>
+    ''')
 
-            const checkAll = document.getElementById('checkAll');
-            const hoverTextDisplay = document.getElementById('hoverTextDisplay');
 
-            if (!checkAll || !hoverTextDisplay) {{
-                console.log('Waiting for HTML elements to be inserted...');
-                setTimeout(waitForPlotly, 100);
-                return;
-            }}
+def _generate_interactive_enhancements(
+    patterns: List[str],
+    colors: List[str],
+    div_id: str,
+    filter_label: str = "Filter Patterns:",
+    hover_format: str = "default"
+) -> tuple:
+    """
+    Generate checkbox filter panel, hover text display, and JavaScript for interactive visualizations.
 
-            console.log('✓ HTML elements found, waiting for Plotly...');
+    Args:
+        patterns: List of pattern names to display in checkboxes
+        colors: List of colors matching each pattern (Plotly color format)
+        div_id: The Plotly div ID for targeting in JavaScript
+        filter_label: Label text for the filter panel (default: "Filter Patterns:")
+        hover_format: Format for hover text display ("default", "count", "time", or custom)
 
-            if (window.Plotly) {{
-                console.log('✓ Plotly loaded, initializing checkboxes...');
-                setTimeout(initCheckboxes, 300);
-            }} else {{
-                let retryCount = 0;
-                const maxRetries = 50;
-                const checkPlotly = setInterval(function() {{
-                    retryCount++;
-                    if (window.Plotly) {{
-                        clearInterval(checkPlotly);
-                        console.log('✓ Plotly loaded after', retryCount * 100, 'ms');
-                        setTimeout(initCheckboxes, 300);
-                    }} else if (retryCount >= maxRetries) {{
-                        clearInterval(checkPlotly);
-                        console.error('Plotly not loaded after', maxRetries * 100, 'ms');
-                        setTimeout(initCheckboxes, 300);
-                    }}
-                }}, 100);
-            }}
-        }}
+    Returns:
+        tuple: (checkbox_html, hover_text_html, javascript_code)
+    """
+    # Create checkbox HTML for each pattern
+    checkbox_parts = [
+        '<div id="filterCheckboxPanel" style="position: fixed; right: 10px; top: 80px; width: 180px; max-height: 500px; overflow-y: auto; background: rgba(255,255,255,0.95); padding: 8px; border: 1px solid #ccc; border-radius: 5px; z-index: 1000; box-shadow: 0 2px 8px rgba(0,0,0,0.1); color: #444; font-family: \'Open Sans\', verdana, arial, sans-serif; font-size: 11px;">',
+        f'<div style="font-weight: bold; margin-bottom: 10px; font-size: 14px;">{html.escape(filter_label)}</div>',
+        '<div style="margin-bottom: 8px; position: relative;"><input type="text" id="patternFilterInput" placeholder="Regex filter..." style="width: 100%; padding: 4px 24px 4px 4px; border: 1px solid #ccc; border-radius: 3px; font-size: 11px; box-sizing: border-box;"><span id="clearFilterBtn" style="position: absolute; right: 6px; top: 50%; transform: translateY(-50%); cursor: pointer; font-size: 14px; color: #999; display: none;" title="Clear filter">×</span></div>',
+        '<div style="margin-bottom: 5px;"><label style="color: #444;"><input type="checkbox" id="checkAll" checked> <strong>All</strong></label></div>',
+        '<div style="margin-bottom: 5px;"><label style="color: #444;"><input type="checkbox" id="checkNone"> <strong>None</strong></label></div>',
+        '<hr style="margin: 8px 0;">'
+    ]
 
-        // Start initialization
-        if (document.readyState === 'loading') {{
-            document.addEventListener('DOMContentLoaded', waitForPlotly);
-        }} else {{
-            waitForPlotly();
-        }}
-    }})();
-    </script>
-    '''
+    # Use colors if provided, otherwise fall back to plotly default colors (by pattern index)
+    trace_colors = list(colors[:len(patterns)]) + [
+        _PLOTLY_DEFAULT_COLORS[i % len(_PLOTLY_DEFAULT_COLORS)] for i in range(len(colors), len(patterns))
+    ]
+
+    # Create checkbox items using the same patterns list
+    for i, (pattern, trace_color) in enumerate(zip(patterns, trace_colors)):
+        pattern_id = f'pattern_{i}'
+        pattern_display = pattern[:60] + ('...' if len(pattern) > 60 else '')
+        checkbox_parts.append(f'<div class="pattern-item" style="margin-bottom: 3px; font-size: 11px;" data-index="{i}"><label class="pattern-label" data-index="{i}"><input type="checkbox" class="pattern-checkbox" id="{pattern_id}" data-index="{i}" checked> <span class="pattern-text" style="color: {trace_color}; font-weight: bold;">{html.escape(pattern_display)}</span></label></div>')
+
+    # Full pattern texts for the regex filter, embedded once as JSON ('</' escaped so it cannot close the script)
+    patterns_json = json.dumps(patterns).replace('</', '<\\/')
+    checkbox_parts.append(f'<script type="application/json" id="patternData">{patterns_json}</script>')
+    checkbox_parts.append('</div>')
+    checkbox_html = ''.join(checkbox_parts)
+
+    # Hover text display area and clipboard copy feature (static)
+    hover_text_html = _HOVER_TEXT_HTML
+
+    # JavaScript for checkbox functionality and hover text copy
+    js_code = _INTERACTIVE_JS_TEMPLATE.replace('__DIV_ID__', div_id)
 
     return checkbox_html, hover_text_html, js_code
 
 
+def _build_xlog_hover(
+    subset: pd.DataFrame,
+    time_field: str,
+    url_field: Optional[str],
+    rt_field: Optional[str],
+    status_field: Optional[str],
+    label: Optional[str] = None,
+    max_url_length: Optional[int] = None
+) -> Tuple[Optional[np.ndarray], str]:
+    """
+    Build the customdata and hovertemplate of an XLog trace.
+
+    Plotly fills the template in the browser when a point is hovered, so only the
+    per-point URL and status values are embedded; time and response time come
+    from the point's x and y. Plotly cannot shift x (UTC for timezone-aware
+    columns) into another offset, so logs in a non-UTC timezone also embed the
+    local time text with its offset.
+
+    Args:
+        subset: Rows of one trace
+        time_field: Time column, plotted as x
+        url_field: URL column (skipped if None or missing)
+        rt_field: Response time column in ms, plotted as y (skipped if None or missing)
+        status_field: Status code column (skipped if None or missing)
+        label: First hover line label (e.g. "Pattern"), showing the trace's meta value
+        max_url_length: Truncate longer URLs to max_url_length - 3 characters + '...'
+
+    Returns:
+        tuple: (customdata array with one row per point or None, hovertemplate)
+    """
+    lines = [f'{label}: %{{meta}}'] if label else []
+    columns = []
+
+    times = subset[time_field]
+    tz = times.dt.tz if isinstance(times.dtype, pd.DatetimeTZDtype) else None
+    if tz is None:
+        lines.append('Time: %{x|%Y-%m-%d %H:%M:%S.%L}')
+    elif tz.utcoffset(None) == timedelta(0):
+        lines.append('Time: %{x|%Y-%m-%d %H:%M:%S.%L}+00:00')
+    else:
+        offsets = times.dt.strftime('%z')
+        lines.append(f'Time: %{{customdata[{len(columns)}]}}')
+        columns.append(times.dt.strftime('%Y-%m-%d %H:%M:%S.%f').str[:-3]
+                       + offsets.str[:3] + ':' + offsets.str[3:])
+
+    if url_field and url_field in subset.columns:
+        urls = subset[url_field]
+        url_text = urls.astype(str)
+        if max_url_length:
+            url_text = url_text.where(url_text.str.len() <= max_url_length,
+                                      url_text.str[:max_url_length - 3] + '...')
+        lines.append(f'URL: %{{customdata[{len(columns)}]}}')
+        columns.append(url_text.where(urls.notna(), ''))
+
+    if rt_field and rt_field in subset.columns:
+        lines.append('Response Time: %{y:.2f} ms')
+
+    if status_field and status_field in subset.columns:
+        statuses = subset[status_field]
+        # Whole status codes as in int(); non-finite values are shown as they are
+        finite = pd.Series(np.isfinite(statuses.to_numpy(dtype=float, na_value=np.nan)), index=subset.index)
+        status_text = statuses.astype(str).where(~finite, statuses.where(finite, 0).astype('int64').astype(str))
+        lines.append(f'Status: %{{customdata[{len(columns)}]}}')
+        columns.append(status_text.where(statuses.notna(), ''))
+
+    customdata = np.column_stack([c.to_numpy(dtype=object) for c in columns]) if columns else None
+    return customdata, '<br>'.join(lines) + '<extra></extra>'
+
+
 # ============================================================================
 # MCP Tool: generateXlog
 # ============================================================================
@@ -900,11 +973,11 @@ def generateXlog(
     if rt_field not in log_df.columns:
         raise ValueError(f"Response time field '{rt_field}' not found in DataFrame. Available columns: {list(log_df.columns)[:10]}...")
     
-    # Convert types
-    log_df[time_field] = pd.to_datetime(log_df[time_field], errors='coerce')
-    log_df[rt_field] = pd.to_numeric(log_df[rt_field], errors='coerce')
-    if status_field in log_df.columns:
-        log_df[status_field] = pd.to_numeric(log_df[status_field], errors='coerce')
+    # Convert types (skipped for columns the parser already typed)
+    log_df[time_field] = _parse_time_column(log_df[time_field])
+    for field in (rt_field, status_field):
+        if field in log_df.columns and not pd.api.types.is_numeric_dtype(log_df[field]):
+            log_df[field] = pd.to_numeric(log_df[field], errors='coerce')
     
     # Drop invalid rows (only if rt_field exists)
     if rt_field and rt_field in log_df.columns:
@@ -1001,33 +1074,26 @@ def generateXlog(
     max_points = 50000  # Maximum points to display
     if len(log_df) > max_points:
         print(f"  Note: Sampling {max_points} points from {len(log_df)} total transactions for performance")
-        log_df = log_df.sample(n=max_points, random_state=42)
-
-    # Create color mapping based on status code
-    def get_color(status):
-        if pd.isna(status):
-            return 'gray'
-        try:
-            status = int(status)
-            if status < 300:
-                return 'green'
-            elif status < 400:
-                return 'blue'
-            elif status < 500:
-                return 'orange'
-            else:
-                return 'red'
-        except:
-            return 'gray'
+        # Evenly spaced rows over the whole log keep the time-series shape without a random permutation
+        positions = np.linspace(0, len(log_df) - 1, max_points).astype(np.int64)
+        log_df = log_df.iloc[positions]
 
+    # Create color mapping based on status code: <300 green, <400 blue, <500 orange, else red.
+    # Bins are left-closed, so NaN and +inf fall outside them and become gray.
+    # Kept categorical (int8 codes) for the grouping below.
     if status_field and status_field in log_df.columns:
-        log_df['color'] = log_df[status_field].apply(get_color)
+        log_df['color'] = pd.cut(
+            log_df[status_field], bins=[-np.inf, 300, 400, 500, np.inf], right=False,
+            labels=['green', 'blue', 'orange', 'red']
+        ).cat.add_categories('gray').fillna('gray')
     else:
         # If status field is not available, use default color
         log_df['color'] = 'gray'
 
-    # Create interactive scatter plot using WebGL for better performance
-    fig = go.Figure()
+    # Traces of the interactive scatter plot (WebGL for better performance) and
+    # their checkbox colors; the figure is built from them in one go
+    traces = []
+    trace_colors = []
 
     # Different grouping strategies
     if groupBy == 'url':
@@ -1049,24 +1115,13 @@ def generateXlog(
             ]
 
             # Add scatter plot for each URI pattern
+            pattern_groups = dict(list(log_df.groupby('uri_pattern', sort=False)))
             for idx, (pattern, count) in enumerate(unique_patterns.items()):
-                subset = log_df[log_df['uri_pattern'] == pattern]
-
-                # Pre-format hover text
-                hover_text = []
-                for _, row in subset.iterrows():
-                    text = f"Pattern: {pattern}<br>"
-                    text += f"Time: {row[time_field]}<br>"
-                    if url_field and url_field in row and pd.notna(row[url_field]):
-                        text += f"URL: {row[url_field]}<br>"
-                    if rt_field and rt_field in row and pd.notna(row[rt_field]):
-                        text += f"Response Time: {row[rt_field]:.2f} ms<br>"
-                    if status_field and status_field in row and pd.notna(row[status_field]):
-                        try:
-                            text += f"Status: {int(row[status_field])}"
-                        except:
-                            text += f"Status: {row[status_field]}"
-                    hover_text.append(text)
+                subset = pattern_groups[pattern]
+
+                # Hover text is formatted by Plotly from customdata
+                customdata, hovertemplate = _build_xlog_hover(subset, time_field, url_field, rt_field, status_field,
+                                                              label='Pattern')
 
                 # Add trace - use status code colors for each point
                 if rt_field and rt_field in subset.columns:
@@ -1074,20 +1129,30 @@ def generateXlog(
                     x_values = subset[time_field].values if hasattr(subset[time_field], 'values') else subset[time_field]
                     y_values = subset[rt_field].values if hasattr(subset[rt_field], 'values') else subset[rt_field]
 
-                    fig.add_trace(go.Scattergl(
+                    # Status code colors per point, as category codes (a list of color
+                    # names would be validated point by point by Plotly)
+                    color_codes = pd.Categorical(subset['color'], categories=_XLOG_STATUS_COLORS).codes
+
+                    traces.append(go.Scattergl(
                         x=x_values,
                         y=y_values,
                         mode='markers',
                         name=f"{pattern} ({count})",
                         marker=dict(
-                            color=subset['color'].tolist(),  # Use status code colors
+                            color=color_codes,  # Use status code colors
+                            colorscale=_XLOG_STATUS_COLORSCALE,
+                            cmin=0,
+                            cmax=len(_XLOG_STATUS_COLORS) - 1,
                             size=4,
                             opacity=0.6,
                             line=dict(width=0)
                         ),
-                        hovertext=hover_text,
-                        hoverinfo='text'
+                        meta=pattern,
+                        customdata=customdata,
+                        hovertemplate=hovertemplate
                     ))
+                    # Checkbox color: the first point's color
+                    trace_colors.append(_XLOG_STATUS_COLORS[color_codes[0]])
 
     elif groupBy == 'ip':
         # Group by target IP
@@ -1108,27 +1173,13 @@ def generateXlog(
             ]
 
             # Add scatter plot for each IP
+            ip_groups = dict(list(log_df.groupby(ip_field, sort=False)))
             for idx, (ip, count) in enumerate(unique_ips.items()):
-                subset = log_df[log_df[ip_field] == ip]
-
-                # Pre-format hover text
-                hover_text = []
-                for _, row in subset.iterrows():
-                    text = f"Target IP: {ip}<br>"
-                    text += f"Time: {row[time_field]}<br>"
-                    if url_field and url_field in row and pd.notna(row[url_field]):
-                        url_display = str(row[url_field])
-                        if len(url_display) > 50:
-                            url_display = url_display[:47] + '...'
-                        text += f"URL: {url_display}<br>"
-                    if rt_field and rt_field in row and pd.notna(row[rt_field]):
-                        text += f"Response Time: {row[rt_field]:.2f} ms<br>"
-                    if status_field and status_field in row and pd.notna(row[status_field]):
-                        try:
-                            text += f"Status: {int(row[status_field])}"
-                        except:
-                            text += f"Status: {row[status_field]}"
-                    hover_text.append(text)
+                subset = ip_groups[ip]
+
+                # Hover text is formatted by Plotly from customdata
+                customdata, hovertemplate = _build_xlog_hover(subset, time_field, url_field, rt_field, status_field,
+                                                              label='Target IP', max_url_length=50)
 
                 # Add trace - use status code colors for each point
                 if rt_field and rt_field in subset.columns:
@@ -1136,43 +1187,41 @@ def generateXlog(
                     x_values = subset[time_field].values if hasattr(subset[time_field], 'values') else subset[time_field]
                     y_values = subset[rt_field].values if hasattr(subset[rt_field], 'values') else subset[rt_field]
 
-                    fig.add_trace(go.Scattergl(
+                    # Status code colors per point, as category codes (a list of color
+                    # names would be validated point by point by Plotly)
+                    color_codes = pd.Categorical(subset['color'], categories=_XLOG_STATUS_COLORS).codes
+
+                    traces.append(go.Scattergl(
                         x=x_values,
                         y=y_values,
                         mode='markers',
                         name=f"{ip} ({count})",
                         marker=dict(
-                            color=subset['color'].tolist(),  # Use status code colors
+                            color=color_codes,  # Use status code colors
+                            colorscale=_XLOG_STATUS_COLORSCALE,
+                            cmin=0,
+                            cmax=len(_XLOG_STATUS_COLORS) - 1,
                             size=4,
                             opacity=0.6,
                             line=dict(width=0)
                         ),
-                        hovertext=hover_text,
-                        hoverinfo='text'
+                        meta=ip,
+                        customdata=customdata,
+                        hovertemplate=hovertemplate
                     ))
+                    # Checkbox color: the first point's color
+                    trace_colors.append(_XLOG_STATUS_COLORS[color_codes[0]])
 
     if groupBy == 'status':
-        # Group by status code (original behavior)
+        # Group by status code (original behavior); split the rows by color in one pass
+        color_groups = dict(list(log_df.groupby('color', sort=False, observed=True)))
         for color_name, color_val in [('green', 'Success (2xx)'), ('blue', 'Redirect (3xx)'),
                                        ('orange', 'Client Error (4xx)'), ('red', 'Server Error (5xx)'),
                                        ('gray', 'Unknown')]:
-            mask = log_df['color'] == color_name
-            if mask.any():
-                subset = log_df[mask]
-                # Pre-format hover text efficiently
-                hover_text = []
-                for _, row in subset.iterrows():
-                    text = f"Time: {row[time_field]}<br>"
-                    if url_field and url_field in row and pd.notna(row[url_field]):
-                        text += f"URL: {row[url_field]}<br>"
-                    if rt_field and rt_field in row and pd.notna(row[rt_field]):
-                        text += f"Response Time: {row[rt_field]:.2f} ms<br>"
-                    if status_field and status_field in row and pd.notna(row[status_field]):
-                        try:
-                            text += f"Status: {int(row[status_field])}"
-                        except:
-                            text += f"Status: {row[status_field]}"
-                    hover_text.append(text)
+            subset = color_groups.get(color_name)
+            if subset is not None:
+                # Hover text is formatted by Plotly from customdata
+                customdata, hovertemplate = _build_xlog_hover(subset, time_field, url_field, rt_field, status_field)
 
                 # Use Scattergl for WebGL rendering (much faster for large datasets)
                 # Only plot if rt_field is available
@@ -1181,7 +1230,7 @@ def generateXlog(
                     x_values = subset[time_field].values if hasattr(subset[time_field], 'values') else subset[time_field]
                     y_values = subset[rt_field].values if hasattr(subset[rt_field], 'values') else subset[rt_field]
 
-                    fig.add_trace(go.Scattergl(
+                    traces.append(go.Scattergl(
                     x=x_values,
                     y=y_values,
                     mode='markers',
@@ -1192,15 +1241,16 @@ def generateXlog(
                         opacity=0.6,
                         line=dict(width=0)  # No border for better performance
                         ),
-                        hovertext=hover_text,
-                        hoverinfo='text'
+                        customdata=customdata,
+                        hovertemplate=hovertemplate
                     ))
+                    trace_colors.append(color_name)
                 else:
                     # If no response time, plot by count
                     # Convert datetime to avoid FutureWarning
                     x_values = subset[time_field].values if hasattr(subset[time_field], 'values') else subset[time_field]
 
-                    fig.add_trace(go.Scattergl(
+                    traces.append(go.Scattergl(
                         x=x_values,
                         y=[1] * len(subset),  # Dummy y-axis
                         mode='markers',
@@ -1211,23 +1261,15 @@ def generateXlog(
                             opacity=0.6,
                             line=dict(width=0)
                     ),
-                    hovertext=hover_text,
-                    hoverinfo='text'
+                    customdata=customdata,
+                    hovertemplate=hovertemplate
                 ))
-    
-    # Collect trace names and colors for checkbox filter
-    trace_names = []
-    trace_colors = []
-    for trace in fig.data:
-        trace_names.append(trace.name)
-        # Handle both array colors (URL/IP grouping) and string colors (status grouping)
-        marker_color = trace.marker.color
-        if isinstance(marker_color, (list, tuple)):
-            # For URL/IP grouping, use the first point's color or a default
-            trace_colors.append(marker_color[0] if marker_color else 'gray')
-        else:
-            # For status grouping, use the color directly
-            trace_colors.append(marker_color)
+                    trace_colors.append(color_name)
+
+    fig = go.Figure(data=traces)
+
+    # Collect trace names for checkbox filter
+    trace_names = [trace.name for trace in traces]
 
     # Update layout with checkbox filter enhancements
     # Create title based on groupBy mode
@@ -1270,9 +1312,9 @@ def generateXlog(
     timestamp = datetime.now().strftime('%y%m%d_%H%M%S')
     output_file = input_path.parent / f"xlog_{timestamp}.html"
 
-    # Save as HTML with plotly div ID
+    # Render HTML with plotly div ID (written once below, together with the enhancements)
     plotly_div_id = f'plotly-div-{timestamp}'
-    fig.write_html(str(output_file), include_plotlyjs='cdn', div_id=plotly_div_id)
+    html_content = fig.to_html(include_plotlyjs='cdn', div_id=plotly_div_id)
 
     # Generate interactive enhancements (checkbox filter, hover text, vertical zoom)
     checkbox_html, hover_text_html, js_code = _generate_interactive_enhancements(
@@ -1283,10 +1325,6 @@ def generateXlog(
         hover_format="xlog"
     )
 
-    # Read the generated HTML and insert enhancements
-    with open(output_file, 'r', encoding='utf-8') as f:
-        html_content = f.read()
-
     # Extract the actual div ID from HTML (Plotly may modify it)
     div_id_match = re.search(r'<div id="([^"]+)"[^>]*class="[^"]*plotly[^"]*"', html_content)
     actual_div_id = div_id_match.group(1) if div_id_match else plotly_div_id
@@ -1295,27 +1333,19 @@ def generateXlog(
     js_code = js_code.replace(f'"{plotly_div_id}"', f'"{actual_div_id}"')
 
     # Insert checkbox HTML, hover text display, and JavaScript before closing body tag
-    inserted = False
-    if '</body>' in html_content:
-        html_content = html_content.rsplit('</body>', 1)
-        if len(html_content) == 2:
-            html_content = html_content[0] + checkbox_html + hover_text_html + js_code + '</body>' + html_content[1]
-            inserted = True
-
-    # Fallback: Insert before </html>
-    if not inserted and '</html>' in html_content:
-        html_content = html_content.rsplit('</html>', 1)
-        if len(html_content) == 2:
-            html_content = html_content[0] + checkbox_html + hover_text_html + js_code + '</html>' + html_content[1]
-            inserted = True
+    # (fallback: before </html>, else at the end), writing the pieces without joining them
+    insert_at = html_content.rfind('</body>')
+    if insert_at == -1:
+        insert_at = html_content.rfind('</html>')
+    if insert_at == -1:
+        insert_at = len(html_content)
 
-    # Fallback: Append at the end
-    if not inserted:
-        html_content += checkbox_html + hover_text_html + js_code
-
-    # Write modified HTML
     with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+        f.write(html_content[:insert_at])
+        f.write(checkbox_html)
+        f.write(hover_text_html)
+        f.write(js_code)
+        f.write(html_content[insert_at:])
 
     logger.info(f"  ✓ filterCheckboxPanel inserted for XLog")
     logger.info(f"  ✓ hoverTextDisplay inserted for XLog")
@@ -1481,7 +1511,7 @@ def generateRequestPerURI(
         raise ValueError(f"Time field '{time_field}' not found in DataFrame. Available columns: {list(log_df.columns)[:10]}...")
 
     # Convert types
-    log_df[time_field] = pd.to_datetime(log_df[time_field], errors='coerce')
+    log_df[time_field] = _parse_time_column(log_df[time_field])
     log_df = log_df.dropna(subset=[time_field])
 
     # Generalize URLs (remove IDs) using pattern file if available
@@ -1703,12 +1733,14 @@ def generateRequestPerURI(
     # Position it in the right margin area, not overlapping with the graph
     # Use fixed position to ensure it's always visible
     # Use Plotly's default text color (#444) for consistency
-    checkbox_html = '<div id="filterCheckboxPanel" style="position: fixed; right: 20px; top: 80px; width: 220px; max-height: 500px; overflow-y: auto; background: rgba(255,255,255,0.95); padding: 10px; border: 1px solid #ccc; border-radius: 5px; z-index: 1000; box-shadow: 0 2px 8px rgba(0,0,0,0.1); color: #444; font-family: \'Open Sans\', verdana, arial, sans-serif;">'
-    checkbox_html += '<div style="font-weight: bold; margin-bottom: 10px; font-size: 14px;">Filter URI Patterns:</div>'
-    checkbox_html += '<div style="margin-bottom: 8px; position: relative;"><input type="text" id="patternFilterInput" placeholder="Regex filter..." style="width: 100%; padding: 4px 24px 4px 4px; border: 1px solid #ccc; border-radius: 3px; font-size: 11px; box-sizing: border-box;"><span id="clearFilterBtn" style="position: absolute; right: 6px; top: 50%; transform: translateY(-50%); cursor: pointer; font-size: 14px; color: #999; display: none;" title="Clear filter">×</span></div>'
-    checkbox_html += f'<div style="margin-bottom: 5px;"><label style="color: #444;"><input type="checkbox" id="checkAll" checked> <strong>All</strong></label></div>'
-    checkbox_html += f'<div style="margin-bottom: 5px;"><label style="color: #444;"><input type="checkbox" id="checkNone"> <strong>None</strong></label></div>'
-    checkbox_html += '<hr style="margin: 8px 0;">'
+    checkbox_parts = [
+        '<div id="filterCheckboxPanel" style="position: fixed; right: 20px; top: 80px; width: 220px; max-height: 500px; overflow-y: auto; background: rgba(255,255,255,0.95); padding: 10px; border: 1px solid #ccc; border-radius: 5px; z-index: 1000; box-shadow: 0 2px 8px rgba(0,0,0,0.1); color: #444; font-family: \'Open Sans\', verdana, arial, sans-serif;">',
+        '<div style="font-weight: bold; margin-bottom: 10px; font-size: 14px;">Filter URI Patterns:</div>',
+        '<div style="margin-bottom: 8px; position: relative;"><input type="text" id="patternFilterInput" placeholder="Regex filter..." style="width: 100%; padding: 4px 24px 4px 4px; border: 1px solid #ccc; border-radius: 3px; font-size: 11px; box-sizing: border-box;"><span id="clearFilterBtn" style="position: absolute; right: 6px; top: 50%; transform: translateY(-50%); cursor: pointer; font-size: 14px; color: #999; display: none;" title="Clear filter">×</span></div>',
+        f'<div style="margin-bottom: 5px;"><label style="color: #444;"><input type="checkbox" id="checkAll" checked> <strong>All</strong></label></div>',
+        f'<div style="margin-bottom: 5px;"><label style="color: #444;"><input type="checkbox" id="checkNone"> <strong>None</strong></label></div>',
+        '<hr style="margin: 8px 0;">'
+    ]
     
     # Create checkbox items using the same actual_patterns list as traces
     # This ensures exact color match between chart lines and checkbox labels
@@ -1717,15 +1749,16 @@ def generateRequestPerURI(
         pattern_display = pattern[:60] + ('...' if len(pattern) > 60 else '')
         # Use the same color index as the corresponding trace
         trace_color = plotly_default_colors[i % len(plotly_default_colors)]
-        checkbox_html += f'<div class="pattern-item" style="margin-bottom: 3px; font-size: 11px;" data-pattern="{pattern}"><label class="pattern-label" data-index="{i}"><input type="checkbox" class="pattern-checkbox" id="{pattern_id}" data-index="{i}" checked> <span class="pattern-text" style="color: {trace_color}; font-weight: bold;">{pattern_display}</span></label></div>'
+        checkbox_parts.append(f'<div class="pattern-item" style="margin-bottom: 3px; font-size: 11px;" data-pattern="{html.escape(pattern)}"><label class="pattern-label" data-index="{i}"><input type="checkbox" class="pattern-checkbox" id="{pattern_id}" data-index="{i}" checked> <span class="pattern-text" style="color: {trace_color}; font-weight: bold;">{html.escape(pattern_display)}</span></label></div>')
 
     # Add "Others" checkbox if it exists (same logic as "Others" trace)
     if 'Others' in pivot.columns:
         pattern_id = f'pattern_{len(actual_patterns)}'
         others_color = '#808080'  # Same gray color as Others trace
-        checkbox_html += f'<div class="pattern-item" style="margin-bottom: 3px; font-size: 11px;" data-pattern="Others"><label class="pattern-label" data-index="{len(actual_patterns)}"><input type="checkbox" class="pattern-checkbox" id="{pattern_id}" data-index="{len(actual_patterns)}" checked> <span class="pattern-text" style="color: {others_color}; font-weight: bold;">Others</span></label></div>'
+        checkbox_parts.append(f'<div class="pattern-item" style="margin-bottom: 3px; font-size: 11px;" data-pattern="Others"><label class="pattern-label" data-index="{len(actual_patterns)}"><input type="checkbox" class="pattern-checkbox" id="{pattern_id}" data-index="{len(actual_patterns)}" checked> <span class="pattern-text" style="color: {others_color}; font-weight: bold;">Others</span></label></div>')
     
-    checkbox_html += '</div>'
+    checkbox_parts.append('</div>')
+    checkbox_html = ''.join(checkbox_parts)
     
     # Add hover text display area and clipboard copy feature
     hover_text_html = '''
@@ -1983,9 +2016,22 @@ def generateRequestPerURI(
             // Store original trace data for restoration
             let originalTraceData = null;
             
+            // Deep copy of trace data: structuredClone (Chrome 98+, Firefox 94+, Safari 15.4+)
+            // copies typed arrays directly instead of round-tripping through a JSON string
+            const cloneTraceData = function(data) {{
+                if (typeof structuredClone === 'function') {{
+                    try {{
+                        return structuredClone(data);
+                    }} catch (e) {{
+                        console.warn('structuredClone failed, falling back to JSON copy:', e);
+                    }}
+                }}
+                return JSON.parse(JSON.stringify(data));
+            }};
+            
             const saveOriginalData = function() {{
                 if (!originalTraceData && plotlyDiv.data) {{
-                    originalTraceData = JSON.parse(JSON.stringify(plotlyDiv.data));
+                    originalTraceData = cloneTraceData(plotlyDiv.data);
                     console.log('Saved original trace data:', originalTraceData.length, 'traces');
                 }}
             }};
@@ -2003,7 +2049,7 @@ def generateRequestPerURI(
                 
                 // Ensure we have original data
                 if (!originalTraceData && plotlyDiv.data) {{
-                    originalTraceData = JSON.parse(JSON.stringify(plotlyDiv.data));
+                    originalTraceData = cloneTraceData(plotlyDiv.data);
                 }}
                 
                 // Get current trace count
@@ -2054,7 +2100,7 @@ def generateRequestPerURI(
                         // Some selected - show only selected traces
                         // Ensure we have original data
                         if (!originalTraceData && plotlyDiv.data) {{
-                            originalTraceData = JSON.parse(JSON.stringify(plotlyDiv.data));
+                            originalTraceData = cloneTraceData(plotlyDiv.data);
                         }}
                         
                         if (originalTraceData) {{
@@ -2477,7 +2523,7 @@ def generateReceivedBytesPerURI(
         raise ValueError(f"Received bytes field not found in DataFrame. Available columns: {list(log_df.columns)[:10]}...")
 
     # Convert types
-    log_df[time_field] = pd.to_datetime(log_df[time_field], errors='coerce')
+    log_df[time_field] = _parse_time_column(log_df[time_field])
     log_df[bytes_field] = pd.to_numeric(log_df[bytes_field], errors='coerce')
     log_df = log_df.dropna(subset=[time_field, bytes_field])
 
@@ -2676,7 +2722,7 @@ def generateReceivedBytesPerURI(
         pattern_id = f'pattern_sum_{i}'
         pattern_display = pattern[:50] + ('...' if len(pattern) > 50 else '')
         trace_color = plotly_default_colors[i % len(plotly_default_colors)]
-        checkbox_sum_html += f'<div class="pattern-item-sum" style="margin-bottom: 3px; font-size: 11px;" data-pattern="{pattern}"><label><input type="checkbox" class="pattern-checkbox-sum" id="{pattern_id}" data-index="{i}" checked> <span style="color: {trace_color}; font-weight: bold;">{pattern_display}</span></label></div>'
+        checkbox_sum_html += f'<div class="pattern-item-sum" style="margin-bottom: 3px; font-size: 11px;" data-pattern="{html.escape(pattern)}"><label><input type="checkbox" class="pattern-checkbox-sum" id="{pattern_id}" data-index="{i}" checked> <span style="color: {trace_color}; font-weight: bold;">{html.escape(pattern_display)}</span></label></div>'
 
     checkbox_sum_html += '</div>'
 
@@ -2692,7 +2738,7 @@ def generateReceivedBytesPerURI(
         pattern_id = f'pattern_avg_{i}'
         pattern_display = pattern[:50] + ('...' if len(pattern) > 50 else '')
         trace_color = plotly_default_colors[i % len(plotly_default_colors)]
-        checkbox_avg_html += f'<div class="pattern-item-avg" style="margin-bottom: 3px; font-size: 11px;" data-pattern="{pattern}"><label><input type="checkbox" class="pattern-checkbox-avg" id="{pattern_id}" data-index="{i + len(pivot_sum.columns)}" checked> <span style="color: {trace_color}; font-weight: bold;">{pattern_display}</span></label></div>'
+        checkbox_avg_html += f'<div class="pattern-item-avg" style="margin-bottom: 3px; font-size: 11px;" data-pattern="{html.escape(pattern)}"><label><input type="checkbox" class="pattern-checkbox-avg" id="{pattern_id}" data-index="{i + len(pivot_sum.columns)}" checked> <span style="color: {trace_color}; font-weight: bold;">{html.escape(pattern_display)}</span></label></div>'
 
     checkbox_avg_html += '</div>'
 
@@ -3159,7 +3205,7 @@ def generateSentBytesPerURI(
         raise ValueError(f"Sent bytes field not found in DataFrame. Available columns: {list(log_df.columns)[:10]}...")
 
     # Convert types
-    log_df[time_field] = pd.to_datetime(log_df[time_field], errors='coerce')
+    log_df[time_field] = _parse_time_column(log_df[time_field])
     log_df[bytes_field] = pd.to_numeric(log_df[bytes_field], errors='coerce')
     log_df = log_df.dropna(subset=[time_field, bytes_field])
 
@@ -3358,7 +3404,7 @@ def generateSentBytesPerURI(
         pattern_id = f'pattern_sum_{i}'
         pattern_display = pattern[:50] + ('...' if len(pattern) > 50 else '')
         trace_color = plotly_default_colors[i % len(plotly_default_colors)]
-        checkbox_sum_html += f'<div class="pattern-item-sum" style="margin-bottom: 3px; font-size: 11px;" data-pattern="{pattern}"><label><input type="checkbox" class="pattern-checkbox-sum" id="{pattern_id}" data-index="{i}" checked> <span style="color: {trace_color}; font-weight: bold;">{pattern_display}</span></label></div>'
+        checkbox_sum_html += f'<div class="pattern-item-sum" style="margin-bottom: 3px; font-size: 11px;" data-pattern="{html.escape(pattern)}"><label><input type="checkbox" class="pattern-checkbox-sum" id="{pattern_id}" data-index="{i}" checked> <span style="color: {trace_color}; font-weight: bold;">{html.escape(pattern_display)}</span></label></div>'
 
     checkbox_sum_html += '</div>'
 
@@ -3374,7 +3420,7 @@ def generateSentBytesPerURI(
         pattern_id = f'pattern_avg_{i}'
         pattern_display = pattern[:50] + ('...' if len(pattern) > 50 else '')
         trace_color = plotly_default_colors[i % len(plotly_default_colors)]
-        checkbox_avg_html += f'<div class="pattern-item-avg" style="margin-bottom: 3px; font-size: 11px;" data-pattern="{pattern}"><label><input type="checkbox" class="pattern-checkbox-avg" id="{pattern_id}" data-index="{i + len(pivot_sum.columns)}" checked> <span style="color: {trace_color}; font-weight: bold;">{pattern_display}</span></label></div>'
+        checkbox_avg_html += f'<div class="pattern-item-avg" style="margin-bottom: 3px; font-size: 11px;" data-pattern="{html.escape(pattern)}"><label><input type="checkbox" class="pattern-checkbox-avg" id="{pattern_id}" data-index="{i + len(pivot_sum.columns)}" checked> <span style="color: {trace_color}; font-weight: bold;">{html.escape(pattern_display)}</span></label></div>'
 
     checkbox_avg_html += '</div>'
 
@@ -3787,7 +3833,7 @@ def generateMultiMetricDashboard(
         raise ValueError(f"Time field '{time_field}' not found in DataFrame. Available columns: {list(log_df.columns)[:10]}...")
     
     # Convert types
-    log_df[time_field] = pd.to_datetime(log_df[time_field], errors='coerce')
+    log_df[time_field] = _parse_time_column(log_df[time_field])
     log_df = log_df.dropna(subset=[time_field])
     
     if rt_field in log_df.columns:
@@ -4391,7 +4437,7 @@ def generateProcessingTimePerURI(
                         f"Available columns: {list(log_df.columns)[:20]}...")
 
     # Convert types
-    log_df[time_field] = pd.to_datetime(log_df[time_field], errors='coerce')
+    log_df[time_field] = _parse_time_column(log_df[time_field])
     log_df[processing_time_field_actual] = pd.to_numeric(log_df[processing_time_field_actual], errors='coerce')
     log_df = log_df.dropna(subset=[time_field, processing_time_field_actual])
 
@@ -4757,7 +4803,7 @@ def generateRequestPerTarget(
         raise ValueError(f"Time field '{time_field}' not found in DataFrame. Available columns: {list(log_df.columns)[:10]}...")
 
     # Convert types
-    log_df[time_field] = pd.to_datetime(log_df[time_field], errors='coerce')
+    log_df[time_field] = _parse_time_column(log_df[time_field])
     log_df = log_df.dropna(subset=[time_field])
 
     # Create target field by combining target_ip and target_port
@@ -5043,7 +5089,7 @@ def generateRequestPerClientIP(
         raise ValueError(f"Time field '{time_field}' not found in DataFrame. Available columns: {list(log_df.columns)[:10]}...")
 
     # Convert types
-    log_df[time_field] = pd.to_datetime(log_df[time_field], errors='coerce')
+    log_df[time_field] = _parse_time_column(log_df[time_field])
     log_df = log_df.dropna(subset=[time_field])
 
     # Use client_ip field directly
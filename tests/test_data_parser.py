@@ -2,10 +2,12 @@
 Tests for data_parser module
 """
 
+import os
+import pandas as pd
 import pytest
 from pathlib import Path
 from core.exceptions import FileNotFoundError, InvalidFormatError
-from data_parser import recommendAccessLogFormat, parse_log_file_with_format
+from data_parser import recommendAccessLogFormat, parse_log_file_with_format, save_as_parquet, load_from_parquet, save_to_duckdb, load_from_duckdb, _load_config_near_input, parse_log_file_with_format_chunks
 
 
 def test_recommend_format_file_not_found():
@@ -147,3 +149,72 @@ def test_invalid_log_regex_raises_invalid_format_error(sample_apache_log):
 
     with pytest.raises(InvalidFormatError):
         recommendAccessLogFormat(str(sample_apache_log))
+
+
+def test_parquet_roundtrip_with_column_selection(sample_alb_log, temp_dir):
+    """Test saving parsed data to Parquet and loading selected columns"""
+    pytest.importorskip("pyarrow")
+    result = recommendAccessLogFormat(str(sample_alb_log))
+    df = parse_log_file_with_format(
+        str(sample_alb_log),
+        result["logFormatFile"],
+        use_multiprocessing=False,
+    )
+
+    parquet_path = temp_dir / "parsed.parquet"
+    save_as_parquet(df, str(parquet_path))
+    loaded = load_from_parquet(str(parquet_path), columns_to_load=["request_url"])
+
+    assert list(loaded.columns) == ["request_url"]
+    assert loaded["request_url"].tolist() == df["request_url"].tolist()
+
+
+def test_duckdb_roundtrip_with_column_selection(sample_alb_log, temp_dir):
+    """Test saving parsed data to DuckDB and loading selected columns"""
+    pytest.importorskip("duckdb")
+    result = recommendAccessLogFormat(str(sample_alb_log))
+    df = parse_log_file_with_format(
+        str(sample_alb_log),
+        result["logFormatFile"],
+        use_multiprocessing=False,
+    )
+
+    duckdb_path = temp_dir / "parsed.duckdb"
+    save_to_duckdb(df, str(duckdb_path), "access_log")
+    loaded = load_from_duckdb(str(duckdb_path), "access_log", columns_to_load=["request_url"])
+
+    assert list(loaded.columns) == ["request_url"]
+    assert loaded["request_url"].tolist() == df["request_url"].tolist()
+
+
+def test_load_config_near_input_reloads_after_edit(temp_dir):
+    """Test cached config.yaml is returned as a copy and reloaded when the file changes"""
+    input_file = temp_dir / "access.log"
+    input_file.write_text("", encoding="utf-8")
+    config_path = temp_dir / "config.yaml"
+    config_path.write_text("columns: [a, b]\n", encoding="utf-8")
+
+    config, found_path = _load_config_near_input(str(input_file))
+    assert found_path == config_path
+    assert config["columns"] == ["a", "b"]
+
+    config["columns"].append("c")
+    assert _load_config_near_input(str(input_file))[0]["columns"] == ["a", "b"]
+
+    config_path.write_text("columns: [x]\n", encoding="utf-8")
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert _load_config_near_input(str(input_file))[0]["columns"] == ["x"]
+
+
+def test_parse_log_file_with_format_chunks(sample_alb_log):
+    """Test chunked parsing yields bounded DataFrames that add up to the full parse"""
+    result = recommendAccessLogFormat(str(sample_alb_log))
+    df = parse_log_file_with_format(str(sample_alb_log), result["logFormatFile"], use_multiprocessing=False)
+
+    chunks = list(parse_log_file_with_format_chunks(
+        str(sample_alb_log), result["logFormatFile"], rows_per_chunk=2, use_multiprocessing=False
+    ))
+
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), df)
@@ -0,0 +1,373 @@
+"""
+Tests for data_processor module
+"""
+
+import io
+import json
+
+import pandas as pd
+import pytest
+from data_processor import (
+    _filter_by_uri_patterns, _filter_by_client, _filter_by_urls, _filter_by_time, _write_json_lines,
+    filterUriPatterns, _calculate_url_stats, _format_size,
+    _grouped_value_counts
+)
+
+
+FORMAT_INFO = {
+    'fieldMap': {
+        'timestamp': 'time',
+        'clientIp': 'client_ip',
+        'url': 'request_url',
+        'status': 'elb_status_code',
+        'responseTime': 'target_processing_time'
+    },
+    'timezone': 'UTC',
+    'responseTimeUnit': 's'
+}
+
+
+def test_filter_by_uri_patterns(temp_dir):
+    """Test URI pattern filter matches any pattern from the start of the URL"""
+    uris_file = temp_dir / "uris.txt"
+    uris_file.write_text("/api/users/*\n/health\n", encoding="utf-8")
+    log_df = pd.DataFrame({
+        'request_url': ['/api/users/1', '/api/orders/2', '/health/live', None, '/static/api/users/3']
+    })
+
+    result = _filter_by_uri_patterns(log_df, {'urisFile': str(uris_file)}, FORMAT_INFO)
+
+    assert result['request_url'].tolist() == ['/api/users/1', '/health/live']
+
+
+def test_filter_by_uri_patterns_uncombinable_regex(temp_dir):
+    """Test regex patterns with inline flags, backreferences or clashing group names match one by one"""
+    uris_file = temp_dir / "uris.txt"
+    uris_file.write_text("(?i)/api/*\n/(\\w+)/\\1/*\n/(?P<v>v1)/*\n/(?P<v>v2)/*\n", encoding="utf-8")
+    log_df = pd.DataFrame({
+        'request_url': ['/API/users', '/dup/dup/x', '/dup/other', '/v1/a', '/v2/b', '/v3/c', None]
+    })
+
+    result = _filter_by_uri_patterns(log_df, {'urisFile': str(uris_file)}, FORMAT_INFO)
+
+    assert result['request_url'].tolist() == ['/API/users', '/dup/dup/x', '/v1/a', '/v2/b']
+
+
+def test_filter_by_uri_patterns_mixed_literal_and_regex(temp_dir):
+    """Test a file mixing literal prefixes and regex patterns matches like per-pattern str.match"""
+    patterns = ['/health', '(?i)/api/*', r'/(\w+)/\1/*', '/(?P<v>v1)/*', '/(?P<v>v2)/*', '/static/[0-9]+']
+    uris_file = temp_dir / "uris.txt"
+    uris_file.write_text("\n".join(patterns) + "\n", encoding="utf-8")
+    log_df = pd.DataFrame({
+        'request_url': ['/health/live', '/API/users', '/dup/dup/x', '/dup/other', '/v1/a', '/v2/b',
+                        '/v3/c', '/static/42', '/static/x', None]
+    })
+
+    result = _filter_by_uri_patterns(log_df, {'urisFile': str(uris_file)}, FORMAT_INFO)
+
+    # Same rows as matching each pattern on its own
+    expected = pd.Series(False, index=log_df.index)
+    for pattern in patterns:
+        expected |= log_df['request_url'].str.match(pattern.replace('*', '.*'), na=False)
+    assert result['request_url'].tolist() == log_df.loc[expected, 'request_url'].tolist()
+    assert result['request_url'].tolist() == ['/health/live', '/API/users', '/dup/dup/x', '/v1/a', '/v2/b',
+                                              '/static/42']
+
+
+def test_filter_by_client_cidr_and_exact():
+    """Test client filter with IPv4/IPv6 CIDRs, exact IPs and unparseable values"""
+    log_df = pd.DataFrame({
+        'client_ip': ['10.0.1.5', '10.0.2.5', '192.168.0.1', '2001:db8::1', 'garbage', None, '10.0.1.300']
+    })
+
+    result = _filter_by_client(
+        log_df, {'clientIps': '10.0.1.0/24, 192.168.0.1,2001:db8::/32'}, FORMAT_INFO
+    )
+
+    assert result['client_ip'].tolist() == ['10.0.1.5', '192.168.0.1', '2001:db8::1']
+
+
+def test_filter_by_urls_reloads_changed_file(temp_dir):
+    """Test URL list files are split per line and re-read after they change"""
+    urls_file = temp_dir / "urls.txt"
+    urls_file.write_bytes(b"/a\r\n /b \r\n\r\n")
+    log_df = pd.DataFrame({'request_url': ['/a', '/b', '/c']})
+
+    result = _filter_by_urls(log_df, {'urlsFile': str(urls_file)}, FORMAT_INFO)
+    assert result['request_url'].tolist() == ['/a', '/b']
+
+    urls_file.write_text('{"urls": ["/c"]}', encoding="utf-8")
+    json_file = temp_dir / "urls.json"
+    urls_file.rename(json_file)
+    result = _filter_by_urls(log_df, {'urlsFile': str(json_file)}, FORMAT_INFO)
+    assert result['request_url'].tolist() == ['/c']
+
+    urls_file.write_text("/b\n/c\n", encoding="utf-8")
+    result = _filter_by_urls(log_df, {'urlsFile': str(urls_file)}, FORMAT_INFO)
+    assert result['request_url'].tolist() == ['/b', '/c']
+
+
+def test_filter_by_time_range():
+    """Test start/end bounds with timezone-aware log times and naive/offset parameters"""
+    log_df = pd.DataFrame({
+        'time': pd.date_range('2024-08-08T09:00:00Z', periods=6, freq='10min'),
+        'request_url': ['/a', '/b', '/c', '/d', '/e', '/f']
+    })
+
+    result = _filter_by_time(
+        log_df,
+        {'startTime': '2024-08-08T09:10:00', 'endTime': '2024-08-08T18:30:00+09:00'},
+        FORMAT_INFO
+    )
+
+    assert result['request_url'].tolist() == ['/b', '/c', '/d']
+
+
+def test_write_json_lines_matches_pandas():
+    """Test JSON Lines output keeps epoch-ms times and nulls like DataFrame.to_json"""
+    log_df = pd.DataFrame({
+        'time': pd.to_datetime(['2024-08-08T09:00:00Z', None]),
+        'request_url': ['/a/b', None],
+        'elb_status_code': pd.array([200, None], dtype='Int64')
+    })
+
+    buffer = io.BytesIO()
+    _write_json_lines(log_df, buffer)
+
+    expected = log_df.to_json(orient='records', lines=True, date_format='epoch', date_unit='ms')
+    assert [json.loads(line) for line in buffer.getvalue().decode('utf-8').splitlines()] == \
+        [json.loads(line) for line in expected.splitlines()]
+
+
+def test_write_json_fallback_writes_nan_as_null(temp_dir, monkeypatch):
+    """Test the json module fallback writes non-finite values as null, like orjson"""
+    import data_processor
+
+    data = {'urls': [{'url': '/a', 'responseTime': {'avg': 1.5, 'std': float('nan')}}],
+            'max': float('inf')}
+    monkeypatch.setattr(data_processor, 'orjson', None)
+    output_file = temp_dir / "result.json"
+    data_processor._write_json(data, output_file)
+
+    text = output_file.read_text(encoding='utf-8')
+    assert 'NaN' not in text and 'Infinity' not in text
+    assert json.loads(text) == {'urls': [{'url': '/a', 'responseTime': {'avg': 1.5, 'std': None}}],
+                                'max': None}
+
+
+def test_generalize_url_cache_cleared_with_pattern_rules(temp_dir):
+    """Test cached generalizations are dropped when pattern rules are reloaded"""
+    from data_processor import _generalize_url, _pattern_manager
+
+    patterns_file = temp_dir / "patterns.json"
+    patterns_file.write_text('{"patterns": ["/api/users/*"]}', encoding="utf-8")
+    assert _generalize_url('/api/users/abc', str(patterns_file)) == '/api/users/*'
+    assert _generalize_url('/api/users/abc', str(patterns_file)) == '/api/users/*'
+
+    patterns_file.write_text('{"patterns": ["/api/*"]}', encoding="utf-8")
+    _pattern_manager.clear_cache(str(patterns_file))
+    assert _generalize_url('/api/users/abc', str(patterns_file)) == '/api/*'
+
+
+def test_generalize_urls_matches_generalize_url():
+    """Test batch generalization gives the same patterns as per-URL generalization"""
+    from data_processor import _generalize_url, _generalize_urls
+
+    urls = [
+        '/api/users/12345/orders', '/api/users/67890/orders?page=2', '/static/app.js',
+        '/files/550e8400-e29b-41d4-a716-446655440000', '/12345', '/', '', 'plain', '/a//b/'
+    ]
+
+    assert _generalize_urls(urls) == [_generalize_url(url) for url in urls]
+
+
+def test_filter_by_time_range_unsorted():
+    """Test the mask fallback for logs that are not in time order"""
+    log_df = pd.DataFrame({
+        'time': pd.to_datetime([
+            '2024-08-08T09:30:00Z', '2024-08-08T09:00:00Z', '2024-08-08T09:20:00Z', None, '2024-08-08T09:10:00Z'
+        ]),
+        'request_url': ['/d', '/a', '/c', '/x', '/b']
+    })
+
+    result = _filter_by_time(
+        log_df, {'startTime': '2024-08-08T09:10:00Z', 'endTime': '2024-08-08T09:20:00Z'}, FORMAT_INFO
+    )
+
+    assert result['request_url'].tolist() == ['/c', '/b']
+
+
+def test_filter_by_time_range_empty_bound():
+    """Test an empty bound matches no rows on sorted logs too, like the mask path"""
+    log_df = pd.DataFrame({
+        'time': pd.date_range('2024-01-01T00:00:00', periods=5, freq='1min'),
+        'request_url': ['/a', '/b', '/c', '/d', '/e']
+    })
+
+    for params in ({'startTime': '2024-01-01T00:01:00', 'endTime': ''},
+                   {'startTime': '', 'endTime': '2024-01-01T00:03:00'}):
+        result = _filter_by_time(log_df.copy(), params, FORMAT_INFO)
+        assert result.empty
+        shuffled = _filter_by_time(log_df.iloc[[3, 0, 4, 1, 2]].copy(), params, FORMAT_INFO)
+        assert shuffled.empty
+
+
+def test_format_size():
+    """Test size formatting, including sizes below one byte"""
+    assert _format_size(0) == '0.0B'
+    assert _format_size(0.5) == '0.5B'
+    assert _format_size(1023) == '1023.0B'
+    assert _format_size(1536) == '1.5KB'
+    assert _format_size(3 * 1024 ** 3) == '3.0GB'
+
+
+def test_compiled_pattern_rules_first_match_wins():
+    """Test the combined rule regex returns the first matching rule, like a loop over the rules"""
+    import re
+    from data_processor import CompiledPatternRules
+
+    rules = CompiledPatternRules([
+        {'pattern': re.compile(r'^/api/users/\d+$'), 'replacement': '/api/users/*'},
+        {'pattern': re.compile(r'^/api/(v1|v2)/'), 'replacement': '/api/*/'},
+        {'pattern': re.compile(r'^/api/'), 'replacement': '/api/*'}
+    ])
+
+    assert rules.find_replacement('/api/users/12') == '/api/users/*'
+    assert rules.find_replacement('/api/v2/items') == '/api/*/'
+    assert rules.find_replacement('/api/users/abc') == '/api/*'
+    assert rules.find_replacement('/health') is None
+
+    # Backreferences cannot be combined; rules are then tried one by one
+    fallback = CompiledPatternRules([{'pattern': re.compile(r'^/(a)/\1$'), 'replacement': '/a/a'}])
+    assert fallback.find_replacement('/a/a') == '/a/a'
+
+
+def test_filter_uri_patterns_include_exclude(temp_dir):
+    """Test include/exclude filters in literal (case-insensitive) and regex modes"""
+    uris_file = temp_dir / "uris.json"
+    uris_file.write_text(json.dumps({
+        'patterns': ['/api/users/*', '/API/orders/*', '/health', '/static/*.js'],
+        'counts': {'/api/users/*': 5, '/API/orders/*': 3, '/health': 9, '/static/*.js': 1}
+    }), encoding="utf-8")
+
+    result = filterUriPatterns(str(uris_file), 'includePatterns=api;excludePatterns=Orders')
+    with open(result['filePath'], encoding='utf-8') as f:
+        assert json.load(f)['patterns'] == ['/api/users/*']
+
+    result = filterUriPatterns(str(uris_file), r'excludePatterns=^/api,\.js$;useRegex=true;caseSensitive=true')
+    with open(result['filePath'], encoding='utf-8') as f:
+        data = json.load(f)
+    assert data['patterns'] == ['/API/orders/*', '/health']
+    assert data['counts'] == {'/API/orders/*': 3, '/health': 9}
+
+
+def test_calculate_url_stats_per_url_values():
+    """Test URL statistics: counts, status distribution and numeric stats per URL"""
+    log_df = pd.DataFrame({
+        'request_url': ['/a', '/b', '/a', '/c', '/a', '/b', None],
+        'elb_status_code': [200.0, 404.0, 200.0, None, 500.0, 404.0, 200.0],
+        'target_processing_time': [0.1, 0.5, None, None, 0.3, 0.7, 0.2],
+        'request_processing_time': ['0.001', '-', '0.003', '0.004', '0.002', '0.001', '0.009']
+    })
+
+    result = _calculate_url_stats(
+        log_df, 'request_url', 'elb_status_code', 'target_processing_time',
+        processing_time_fields=['request_processing_time']
+    )
+
+    nan = float('nan')
+    expected = [
+        {'url': '/a', 'count': 3, 'statusCodes': {'200.0': 2, '500.0': 1},
+         'responseTime': {'avg': 0.2, 'sum': 0.4, 'median': 0.2, 'std': 0.1414213562, 'min': 0.1, 'max': 0.3,
+                          'p90': 0.28, 'p95': 0.29, 'p99': 0.298},
+         'request_processing_time': {'avg': 0.002, 'sum': 0.006, 'median': 0.002, 'std': 0.001, 'min': 0.001,
+                                     'max': 0.003, 'p90': 0.0028, 'p95': 0.0029, 'p99': 0.00298}},
+        {'url': '/b', 'count': 2, 'statusCodes': {'404.0': 2},
+         'responseTime': {'avg': 0.6, 'sum': 1.2, 'median': 0.6, 'std': 0.1414213562, 'min': 0.5, 'max': 0.7,
+                          'p90': 0.68, 'p95': 0.69, 'p99': 0.698},
+         'request_processing_time': {'avg': 0.001, 'sum': 0.001, 'median': 0.001, 'std': nan, 'min': 0.001,
+                                     'max': 0.001, 'p90': 0.001, 'p95': 0.001, 'p99': 0.001}},
+        {'url': '/c', 'count': 1, 'statusCodes': {},
+         'request_processing_time': {'avg': 0.004, 'sum': 0.004, 'median': 0.004, 'std': nan, 'min': 0.004,
+                                     'max': 0.004, 'p90': 0.004, 'p95': 0.004, 'p99': 0.004}},
+    ]
+
+    assert len(result) == len(expected)
+    for stat, expected_stat in zip(result, expected):
+        assert stat.keys() == expected_stat.keys()
+        assert (stat['url'], stat['count']) == (expected_stat['url'], expected_stat['count'])
+        assert list(stat['statusCodes'].items()) == list(expected_stat['statusCodes'].items())
+        for key in ('responseTime', 'request_processing_time'):
+            if key in expected_stat:
+                assert stat[key] == pytest.approx(expected_stat[key], nan_ok=True)
+
+
+def test_grouped_value_counts_ties_in_first_occurrence_order():
+    """Test equal counts keep first-occurrence order within a group, like value_counts"""
+    log_df = pd.DataFrame({
+        'request_url': ['/a'] * 6 + ['/b'] * 2,
+        'elb_status_code': [404, 404, 200, 200, 500, 302, 301, 200]
+    })
+
+    counts = _grouped_value_counts(log_df, 'request_url', 'elb_status_code')
+
+    assert list(counts['/a'].items()) == [('404', 2), ('200', 2), ('500', 1), ('302', 1)]
+    assert list(counts['/b'].items()) == [('301', 1), ('200', 1)]
+
+
+def test_calculate_ip_stats_top_100_ties_in_ip_order():
+    """Test IP stats keep the 100 busiest IPs, breaking count ties by IP"""
+    from data_processor import _calculate_ip_stats
+
+    ips = [f'10.0.0.{i:03d}' for i in range(150)]
+    log_df = pd.DataFrame({
+        'client_ip': ['10.0.0.149'] * 3 + ips[::-1],
+        'elb_status_code': [500.0] * 3 + [200.0] * 150,
+        'target_processing_time': [0.3] * 3 + [None] * 150
+    })
+
+    result = _calculate_ip_stats(log_df, 'client_ip', 'elb_status_code', 'target_processing_time')
+
+    assert [stat['ip'] for stat in result] == ['10.0.0.149'] + ips[:99]
+    assert result[0] == {'ip': '10.0.0.149', 'count': 4, 'errorCount': 3, 'avgResponseTime': pytest.approx(0.3)}
+    assert result[1] == {'ip': '10.0.0.000', 'count': 1, 'errorCount': 0}
+
+
+def test_calculate_time_stats_does_not_modify_frame():
+    """Test time stats only read the DataFrame, so stat types can run in threads"""
+    from data_processor import _calculate_time_stats
+
+    log_df = pd.DataFrame({
+        'time': pd.to_datetime(['2024-08-08T09:01:00Z', '2024-08-08T09:04:00Z', '2024-08-08T09:12:00Z']),
+        'elb_status_code': [200.0, 500.0, 404.0],
+        'target_processing_time': [0.1, 0.3, None]
+    })
+    columns = list(log_df.columns)
+
+    result = _calculate_time_stats(log_df, 'time', 'elb_status_code', 'target_processing_time', '10m')
+
+    assert list(log_df.columns) == columns
+    assert [(stat['time'], stat['count'], stat['errorCount']) for stat in result] == [
+        ('2024-08-08T09:00:00+00:00', 2, 1), ('2024-08-08T09:10:00+00:00', 1, 1)
+    ]
+    assert result[0]['avgResponseTime'] == pytest.approx(0.2)
+    assert 'avgResponseTime' not in result[1]
+
+
+def test_calculate_stats_reuses_result_until_input_changes(sample_alb_log):
+    """Test repeated calculateStats calls reuse the stats file until the log file changes"""
+    from data_parser import recommendAccessLogFormat
+    from data_processor import calculateStats
+
+    format_file = recommendAccessLogFormat(str(sample_alb_log))['logFormatFile']
+
+    first = calculateStats(str(sample_alb_log), format_file, 'statsType=summary', use_multiprocessing=False)
+    second = calculateStats(str(sample_alb_log), format_file, 'statsType=summary', use_multiprocessing=False)
+    assert second == first
+
+    with open(sample_alb_log, 'a', encoding='utf-8') as f:
+        f.write('\n' + sample_alb_log.read_text().splitlines()[0])
+
+    third = calculateStats(str(sample_alb_log), format_file, 'statsType=summary', use_multiprocessing=False)
+    with open(third['filePath'], encoding='utf-8') as f:
+        assert json.load(f)['summary']['totalRequests'] == 4
@@ -4,13 +4,14 @@ Tests for multiprocessing functionality in Access Log Analyzer
 
 import pytest
 import tempfile
+import pandas as pd
 import os
 import json
 from pathlib import Path
 
 # Import modules to test
 from core.utils import MultiprocessingConfig
-from data_parser import _parse_lines_chunk, _read_lines_from_file
+from data_parser import _parse_lines_chunk, _read_lines_from_file, _iter_chunks, _imap_bounded, _build_dataframe
 
 
 class TestMultiprocessingConfig:
@@ -30,6 +31,8 @@ class TestMultiprocessingConfig:
         assert config['enabled'] is True
         assert config['chunk_size'] == 10000
         assert config['min_lines_for_parallel'] == 10000
+        assert config['backend'] == 'process'
+        assert config['target_chunk_bytes'] == 4 * 1024 * 1024
 
     def test_get_optimal_workers(self):
         """Test optimal worker calculation"""
@@ -128,10 +131,10 @@ class TestParallelParsing:
             lines_chunk, pattern, pattern_type, format_info
         )
 
-        # Should parse 2 valid JSON lines
-        assert len(parsed_data) == 2
-        assert parsed_data[0]['url'] == '/test'
-        assert parsed_data[1]['status'] == 404
+        # Should parse 2 valid JSON lines (column-wise)
+        assert len(parsed_data['url']) == 2
+        assert parsed_data['url'][0] == '/test'
+        assert parsed_data['status'][1] == 404
 
         # Should have 1 failed line
         assert len(failed_lines) == 1
@@ -160,14 +163,37 @@ class TestParallelParsing:
             lines_chunk, pattern, pattern_type, format_info
         )
 
-        # Should parse 1 line successfully
-        assert len(parsed_data) == 1
-        assert parsed_data[0]['type'] == 'http'
-        assert parsed_data[0]['client_ip'] == '1.2.3.4'
+        # Should parse 1 line successfully (column-wise)
+        assert len(parsed_data['type']) == 1
+        assert parsed_data['type'][0] == 'http'
+        assert parsed_data['client_ip'][0] == '1.2.3.4'
 
         # No failed lines
         assert len(failed_lines) == 0
 
+    def test_parse_lines_chunk_columns_to_load(self):
+        """Test that workers only emit requested columns"""
+        lines_chunk = [
+            (1, '1.2.3.4 GET /a 200\n'),
+            (2, '1.2.3.5 POST /b -\n'),
+        ]
+        pattern = r'([^ ]*) ([^ ]*) ([^ ]*) ([^ ]*)'
+        format_info = {'columns': ['client_ip', 'request_verb', 'request_url', 'status']}
+
+        parsed_data, failed_lines = _parse_lines_chunk(
+            lines_chunk, pattern, 'GROK', format_info, columns_to_load={'request_url', 'status'}
+        )
+
+        assert set(parsed_data) == {'request_url', 'status'}
+        assert parsed_data['request_url'] == ['/a', '/b']
+        # Empty markers are kept by workers and nulled by _build_dataframe
+        assert parsed_data['status'] == ['200', '-']
+        assert failed_lines == []
+
+        df = _build_dataframe(parsed_data, empty_to_null=['status'])
+        assert df['status'].tolist()[0] == '200'
+        assert pd.isna(df['status'].tolist()[1])
+
     def test_read_lines_from_file(self):
         """Test reading lines from file with line numbers"""
         # Create temporary file
@@ -178,7 +204,7 @@ class TestParallelParsing:
             temp_file = f.name
 
         try:
-            lines = _read_lines_from_file(temp_file)
+            lines = list(_read_lines_from_file(temp_file))
 
             # Should read all lines with line numbers
             assert len(lines) == 3
@@ -187,28 +213,98 @@ class TestParallelParsing:
             assert lines[2] == (3, 'line 3\n')
 
             # Test max_lines limit
-            lines = _read_lines_from_file(temp_file, max_lines=2)
+            lines = list(_read_lines_from_file(temp_file, max_lines=2))
             assert len(lines) == 2
 
         finally:
             os.unlink(temp_file)
 
+    def test_iter_chunks(self):
+        """Test grouping streamed lines into fixed-size chunks"""
+        lines = ((i, f'line {i}\n') for i in range(1, 8))
 
-class TestParallelStatistics:
-    """Test parallel statistics calculation"""
+        chunks = list(_iter_chunks(lines, 3))
 
-    def test_parallel_stats_imports(self):
-        """Test that parallel statistics functions can be imported"""
-        from data_processor import (
-            _calculate_url_stats_chunk,
-            _calculate_time_stats_chunk,
-            _calculate_ip_stats_chunk
-        )
+        assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+        assert chunks[0][0] == (1, 'line 1\n')
+        assert chunks[-1][-1] == (7, 'line 7\n')
+
+    def test_iter_chunks_max_bytes(self):
+        """Test that chunks are also cut by accumulated text size"""
+        lines = [(i, 'x' * 9 + '\n') for i in range(1, 8)]
+
+        chunks = list(_iter_chunks(lines, 100, max_bytes=25))
+
+        assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+
+    def test_imap_bounded(self):
+        """Test that chunks are submitted in a bounded window and yielded in order"""
+        from multiprocessing.pool import ThreadPool
+
+        consumed = []
+
+        def items():
+            for i in range(10):
+                consumed.append(i)
+                yield i
+
+        with ThreadPool(2) as pool:
+            results = _imap_bounded(pool, abs, items(), max_pending=3)
+            assert next(results) == 0
+            assert len(consumed) == 3
+            assert list(results) == list(range(1, 10))
+
+
+class TestStatistics:
+    """Test the statistics calculateStats aggregates with groupby"""
+
+    @staticmethod
+    def _log_df():
+        return pd.DataFrame({
+            'time': pd.to_datetime(['2024-01-01T00:00:10Z', '2024-01-01T00:00:50Z',
+                                    '2024-01-01T00:01:05Z', '2024-01-01T00:01:30Z']),
+            'request_url': ['/a', '/b', '/a', '/a'],
+            'client_ip': ['10.0.0.1', '10.0.0.2', '10.0.0.1', '10.0.0.1'],
+            'elb_status_code': [200, 500, 404, 200],
+            'target_processing_time': [0.1, 0.3, 0.2, None]
+        })
+
+    def test_url_stats(self):
+        """Test per-URL counts, status codes and response time statistics"""
+        from data_processor import _calculate_url_stats
+
+        stats = _calculate_url_stats(self._log_df(), 'request_url', 'elb_status_code', 'target_processing_time')
+
+        assert [(s['url'], s['count'], s['statusCodes']) for s in stats] == [
+            ('/a', 3, {'200': 2, '404': 1}),
+            ('/b', 1, {'500': 1})
+        ]
+        assert stats[0]['responseTime']['avg'] == pytest.approx(0.15)
+        assert stats[0]['responseTime']['p95'] == pytest.approx(0.195)
+        assert stats[1]['responseTime']['max'] == pytest.approx(0.3)
+
+    def test_time_stats(self):
+        """Test per-interval counts, error rates and response times"""
+        from data_processor import _calculate_time_stats
+
+        stats = _calculate_time_stats(self._log_df(), 'time', 'elb_status_code', 'target_processing_time', '1m')
+
+        assert [(s['time'], s['count'], s['errorCount'], s['errorRate']) for s in stats] == [
+            ('2024-01-01T00:00:00+00:00', 2, 1, 0.5),
+            ('2024-01-01T00:01:00+00:00', 2, 1, 0.5)
+        ]
+        assert stats[0]['avgResponseTime'] == pytest.approx(0.2)
+        assert stats[0]['p95ResponseTime'] == pytest.approx(0.29)
+        assert stats[1]['p95ResponseTime'] == pytest.approx(0.2)
+
+    def test_ip_stats(self):
+        """Test per-IP counts, error counts and average response times"""
+        from data_processor import _calculate_ip_stats
+
+        stats = _calculate_ip_stats(self._log_df(), 'client_ip', 'elb_status_code', 'target_processing_time')
 
-        # Just verify they exist
-        assert callable(_calculate_url_stats_chunk)
-        assert callable(_calculate_time_stats_chunk)
-        assert callable(_calculate_ip_stats_chunk)
+        assert [(s['ip'], s['count'], s['errorCount']) for s in stats] == [('10.0.0.1', 3, 1), ('10.0.0.2', 1, 1)]
+        assert [s['avgResponseTime'] for s in stats] == pytest.approx([0.15, 0.3])
 
 
 class TestEndToEnd:
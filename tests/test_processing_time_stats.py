@@ -70,7 +70,7 @@ def test_processing_time_stats():
     # Import the function
     import sys
     sys.path.insert(0, str(Path(__file__).parent))
-    from data_processor import _calculate_url_stats_chunk
+    from data_processor import _calculate_url_stats
 
     # Prepare data for testing
     url_field = 'request_url'
@@ -82,20 +82,17 @@ def test_processing_time_stats():
         'response_processing_time'
     ]
 
-    # Group by URL
-    url_groups = log_df.groupby(url_field)
-    url_group_data = [(url, group) for url, group in url_groups]
-
     print("\n" + "=" * 80)
     print("Calculating Statistics...")
     print("=" * 80)
 
     # Calculate statistics
-    url_stats = _calculate_url_stats_chunk(
-        url_group_data,
+    url_stats = _calculate_url_stats(
+        log_df,
+        url_field,
         status_field,
         rt_field,
-        processing_time_fields
+        processing_time_fields=processing_time_fields
     )
 
     # Display results